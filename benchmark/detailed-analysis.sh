@@ -1,5 +1,7 @@
 #!/bin/bash
 # Detailed Plugin Analysis - Runtime Behavior Study
+#
+# component_breakdown, usage_scenarios, context_window_impact: also in scripts/corpus_metrics.py (see benchmark/README.md)
 
 set -e
 
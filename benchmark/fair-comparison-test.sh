@@ -1,6 +1,8 @@
 #!/bin/bash
 # Fair Comparison Test - Unbiased Performance Measurement
 # Tests BOTH Plugin and MCP Gateway advantages
+#
+# token_efficiency: also in scripts/corpus_metrics.py; the qualitative sections are script-only (see benchmark/README.md)
 
 set -e
 
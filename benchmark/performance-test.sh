@@ -1,6 +1,8 @@
 #!/bin/bash
 # SuperClaude Plugin Performance Benchmark
 # Measures plugin overhead and command execution times
+#
+# plugin_metrics and context_load: also in scripts/corpus_metrics.py (see benchmark/README.md)
 
 set -e
 
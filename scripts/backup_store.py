@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Content-Addressed Backup Store
+
+Deduplicated, compressed snapshots of Plugin files (plugin.json by default)
+under backups/.  Each distinct file content is stored once as a gzip blob
+named by its SHA-256; a small JSON index maps snapshot timestamps to blobs.
+Retention policies evict old snapshots, and blobs no snapshot references
+are garbage-collected.
+
+Layout:
+    backups/
+    ├── index.json
+    └── objects/
+        └── 3f/3fa4…e1.gz
+
+Usage:
+    python scripts/backup_store.py [OPTIONS] COMMAND
+
+Commands:
+    list                    Show snapshots, newest first
+    restore [ID]            Restore a snapshot (default: latest)
+    prune                   Apply the retention policy
+    import-legacy           Import plugin.json.*.backup files into the store
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --keep-last N           Retention: most recent snapshots to keep
+    --keep-daily N          Retention: newest snapshot of each of the last N days
+    --keep-weekly N         Retention: newest snapshot of each of the last N weeks
+"""
+
+import os
+import sys
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import tempfile
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+LEGACY_BACKUP_PATTERN = re.compile(r'^(?P<file>.+)\.(?P<stamp>\d{8}_\d{6})\.backup$')
+
+
+class BackupError(RuntimeError):
+    """Raised when a snapshot is missing or its blob fails verification."""
+    pass
+
+
+@dataclass
+class Snapshot:
+    """One backup of one file at one point in time."""
+    id: str
+    file: str
+    blob: str
+    size: int
+    created: str
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromisoformat(self.created)
+
+
+@dataclass
+class RetentionPolicy:
+    """Which snapshots survive a prune (union of all rules)."""
+    keep_last: int = 10
+    keep_daily: int = 7
+    keep_weekly: int = 4
+
+    def select(self, snapshots: List[Snapshot]) -> Set[str]:
+        """IDs of snapshots to keep, given snapshots of one file."""
+        ordered = sorted(snapshots, key=lambda s: (s.created, s.id), reverse=True)
+        keep = {s.id for s in ordered[:self.keep_last]}
+
+        for count, bucket in ((self.keep_daily, lambda d: d.date()),
+                              (self.keep_weekly, lambda d: d.isocalendar()[:2])):
+            seen = set()
+            for snapshot in ordered:
+                if len(seen) >= count:
+                    break
+                key = bucket(snapshot.created_at)
+                if key not in seen:
+                    seen.add(key)
+                    keep.add(snapshot.id)
+        return keep
+
+
+class BackupStore:
+    """Content-addressed snapshot store rooted at a backups/ directory."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.objects_dir = root / 'objects'
+        self.index_path = root / 'index.json'
+        self.snapshots: List[Snapshot] = self._load_index()
+
+    # ── Index ──────────────────────────────────────────────────────────────────
+
+    def _load_index(self) -> List[Snapshot]:
+        if not self.index_path.exists():
+            return []
+        data = json.loads(self.index_path.read_text(encoding='utf-8'))
+        return [Snapshot(**entry) for entry in data.get('snapshots', [])]
+
+    def _save_index(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "snapshots": [asdict(s) for s in sorted(self.snapshots, key=lambda s: s.id)],
+        }
+        atomic_write(self.index_path, (json.dumps(data, indent=2) + '\n').encode('utf-8'))
+
+    def blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.gz"
+
+    # ── Operations ─────────────────────────────────────────────────────────────
+
+    def backup(self, source: Path, name: Optional[str] = None, when: Optional[datetime] = None) -> Snapshot:
+        """
+        Snapshot a file.  Content already in the store is not written again.
+
+        Args:
+            source: File to back up
+            name: Logical file name recorded in the index (default: source name)
+            when: Snapshot time (default: now)
+        """
+        data = source.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self.blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            # mtime=0 keeps blobs byte-identical for identical content
+            atomic_write(blob_path, gzip.compress(data, mtime=0))
+        else:
+            logger.debug(f"  ♻️  Blob already stored: {digest[:12]}")
+
+        when = when or datetime.now()
+        snapshot_id = when.strftime(TIMESTAMP_FORMAT)
+        taken = {s.id for s in self.snapshots}
+        suffix = 1
+        while snapshot_id in taken:
+            snapshot_id = f"{when.strftime(TIMESTAMP_FORMAT)}-{suffix}"
+            suffix += 1
+
+        snapshot = Snapshot(
+            id=snapshot_id,
+            file=name or source.name,
+            blob=digest,
+            size=len(data),
+            created=when.isoformat(timespec='seconds'),
+        )
+        self.snapshots.append(snapshot)
+        self._save_index()
+        return snapshot
+
+    def get(self, snapshot_id: Optional[str] = None, file: str = 'plugin.json') -> Snapshot:
+        """Look up a snapshot by id, or the latest snapshot of file."""
+        if snapshot_id in (None, 'latest'):
+            candidates = [s for s in self.snapshots if s.file == file]
+            if not candidates:
+                raise BackupError(f"No snapshots of {file}")
+            return max(candidates, key=lambda s: (s.created, s.id))
+        for snapshot in self.snapshots:
+            if snapshot.id == snapshot_id:
+                return snapshot
+        raise BackupError(f"Unknown snapshot: {snapshot_id}")
+
+    def read(self, snapshot: Snapshot) -> bytes:
+        """Decompress and verify a snapshot's content."""
+        blob_path = self.blob_path(snapshot.blob)
+        if not blob_path.exists():
+            raise BackupError(f"Blob missing for snapshot {snapshot.id}: {blob_path}")
+        data = gzip.decompress(blob_path.read_bytes())
+        if hashlib.sha256(data).hexdigest() != snapshot.blob:
+            raise BackupError(f"Blob corrupted for snapshot {snapshot.id}")
+        return data
+
+    def restore(self, snapshot: Snapshot, target: Path) -> None:
+        """Atomically replace target with a snapshot's content."""
+        atomic_write(target, self.read(snapshot))
+
+    def prune(self, policy: RetentionPolicy) -> List[Snapshot]:
+        """Apply a retention policy per file, then delete unreferenced blobs."""
+        keep: Set[str] = set()
+        by_file: Dict[str, List[Snapshot]] = {}
+        for snapshot in self.snapshots:
+            by_file.setdefault(snapshot.file, []).append(snapshot)
+        for snapshots in by_file.values():
+            keep |= policy.select(snapshots)
+
+        evicted = [s for s in self.snapshots if s.id not in keep]
+        if evicted:
+            self.snapshots = [s for s in self.snapshots if s.id in keep]
+            self._save_index()
+        self._collect_garbage()
+        return evicted
+
+    def _collect_garbage(self) -> int:
+        referenced = {s.blob for s in self.snapshots}
+        removed = 0
+        if not self.objects_dir.exists():
+            return removed
+        for blob in self.objects_dir.glob('*/*.gz'):
+            if blob.name[:-3] not in referenced:
+                blob.unlink()
+                removed += 1
+        return removed
+
+    def import_legacy(self, remove: bool = False) -> int:
+        """Import plugin.json.<timestamp>.backup copies into the store."""
+        imported = 0
+        known = {(s.file, s.id) for s in self.snapshots}
+        for legacy in sorted(self.root.glob('*.backup')):
+            match = LEGACY_BACKUP_PATTERN.match(legacy.name)
+            if not match:
+                continue
+            if (match.group('file'), match.group('stamp')) not in known:
+                when = datetime.strptime(match.group('stamp'), TIMESTAMP_FORMAT)
+                self.backup(legacy, name=match.group('file'), when=when)
+                imported += 1
+            if remove:
+                legacy.unlink()
+        return imported
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file, then rename over path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Manage the deduplicated plugin.json backup store'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    defaults = RetentionPolicy()
+    parser.add_argument('--keep-last', type=int, default=defaults.keep_last,
+                        help='Most recent snapshots to keep')
+    parser.add_argument('--keep-daily', type=int, default=defaults.keep_daily,
+                        help='Newest snapshot of each of the last N days to keep')
+    parser.add_argument('--keep-weekly', type=int, default=defaults.keep_weekly,
+                        help='Newest snapshot of each of the last N weeks to keep')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('list', help='Show snapshots, newest first')
+    restore_parser = subparsers.add_parser('restore', help='Restore a snapshot')
+    restore_parser.add_argument('snapshot', nargs='?', default='latest')
+    restore_parser.add_argument('--output', type=Path, help='Restore to this path instead')
+    subparsers.add_parser('prune', help='Apply the retention policy')
+    legacy_parser = subparsers.add_parser('import-legacy', help='Import *.backup files')
+    legacy_parser.add_argument('--remove', action='store_true',
+                               help='Delete legacy files after importing')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    store = BackupStore(args.plugin_root / 'backups')
+    try:
+        if args.command == 'list':
+            for s in sorted(store.snapshots, key=lambda s: (s.created, s.id), reverse=True):
+                print(f"{s.id:<18} {s.file:<14} {s.size:>8} B  {s.blob[:12]}")
+        elif args.command == 'restore':
+            snapshot = store.get(args.snapshot)
+            target = args.output or args.plugin_root / snapshot.file
+            store.restore(snapshot, target)
+            logger.info(f"♻️  Restored {snapshot.file} from {snapshot.id} → {target}")
+        elif args.command == 'prune':
+            evicted = store.prune(RetentionPolicy(args.keep_last, args.keep_daily, args.keep_weekly))
+            logger.info(f"🧹 Evicted {len(evicted)} snapshot(s), {len(store.snapshots)} kept")
+        elif args.command == 'import-legacy':
+            imported = store.import_legacy(remove=args.remove)
+            logger.info(f"📦 Imported {imported} legacy backup(s)")
+    except BackupError as e:
+        logger.error(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
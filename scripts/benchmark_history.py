@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Benchmark History Store
+
+Ingests every result file in benchmark/results/ (benchmark_*, detailed_analysis_*,
+fair_comparison_*, metrics_* and sync reports) into a local SQLite store keyed
+by run timestamp and git commit.  Each numeric leaf of a report becomes a
+metric time series, e.g. `plugin_metrics.estimated_tokens`.
+
+The `check` command compares the latest run of each series with the previous
+one and flags regressions in token footprint or sync latency beyond
+configurable thresholds, exiting non-zero so it can gate releases.
+
+Usage:
+    python scripts/benchmark_history.py [OPTIONS] [COMMAND]
+
+Commands:
+    ingest                  Load result files into the store
+    series METRIC           Print one metric's time series
+    check                   Ingest, then fail on regressions (default)
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --db PATH               SQLite store (default: benchmark/history.sqlite)
+    --results PATH          Extra result file or directory (repeatable)
+    --threshold GLOB=PCT    Max allowed increase for matching metrics (repeatable;
+                            checked before the built-in defaults)
+"""
+
+import sys
+import argparse
+import fnmatch
+import json
+import re
+import sqlite3
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Metric name glob → maximum allowed increase (percent) between adjacent runs.
+# Token footprint and sync latency are the release-gating series.
+DEFAULT_THRESHOLDS: Dict[str, float] = {
+    "plugin_metrics.estimated_tokens": 5.0,
+    "total_plugin_cost.tokens": 5.0,
+    "static_metrics.plugin.tokens": 5.0,
+    "component_breakdown.*.total_tokens": 10.0,
+    "duration_seconds": 25.0,
+}
+
+RESULT_FILE_PATTERN = re.compile(r'^(?P<kind>[a-z_]+?)_(?P<stamp>\d{8}_\d{6})\.json$')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    run_at TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    schema_version INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_kind_time ON runs(kind, run_at);
+CREATE INDEX IF NOT EXISTS idx_metrics_name ON metrics(name);
+"""
+
+
+@dataclass
+class Regression:
+    """A metric that grew more than its threshold between two runs."""
+    kind: str
+    metric: str
+    previous: float
+    current: float
+    change_pct: float
+    threshold_pct: float
+    previous_run: str
+    current_run: str
+
+    def describe(self) -> str:
+        return (
+            f"{self.kind}:{self.metric} {self.previous:g} → {self.current:g} "
+            f"(+{self.change_pct:.1f}% > {self.threshold_pct:g}%) "
+            f"[{self.previous_run} → {self.current_run}]"
+        )
+
+
+def flatten_metrics(data: dict, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Yield (dotted.name, value) for every numeric leaf of a report."""
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            yield name, float(value)
+        elif isinstance(value, dict):
+            yield from flatten_metrics(value, f"{name}.")
+
+
+def parse_run_time(data: dict, path: Path) -> str:
+    """Normalise a report's timestamp (YYYYMMDD_HHMMSS or ISO) to ISO-8601."""
+    stamp = str(data.get("timestamp", ""))
+    try:
+        return datetime.strptime(stamp, '%Y%m%d_%H%M%S').isoformat()
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(stamp.replace('Z', '+00:00')).replace(tzinfo=None).isoformat()
+    except ValueError:
+        pass
+    match = RESULT_FILE_PATTERN.match(path.name)
+    if match:
+        return datetime.strptime(match.group('stamp'), '%Y%m%d_%H%M%S').isoformat()
+    return datetime.fromtimestamp(path.stat().st_mtime).isoformat(timespec='seconds')
+
+
+def result_kind(data: dict, path: Path) -> str:
+    """Series family of a result file: benchmark, fair_comparison, sync_report…"""
+    if "framework_commit" in data and "files_synced" in data:
+        return "sync_report"
+    match = RESULT_FILE_PATTERN.match(path.name)
+    return match.group('kind') if match else path.stem
+
+
+class HistoryStore:
+    """SQLite-backed time series of benchmark and sync metrics."""
+
+    def __init__(self, db_path: Path, plugin_root: Optional[Path] = None):
+        self.db_path = db_path
+        self.plugin_root = plugin_root or db_path.parent
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _commit_for(self, data: dict, path: Path) -> str:
+        """Plugin commit a result belongs to: recorded, else the commit that added it."""
+        if data.get("git_commit"):
+            return data["git_commit"]
+        try:
+            result = subprocess.run(
+                ['git', 'log', '--diff-filter=A', '--format=%H', '-1', '--', str(path)],
+                cwd=self.plugin_root,
+                check=True,
+                capture_output=True,
+                text=True
+            )
+            return result.stdout.strip() or "uncommitted"
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return "unknown"
+
+    def ingest_file(self, path: Path) -> bool:
+        """Load one result file. Returns False if it was already ingested or unreadable."""
+        source = str(path.resolve())
+        if self.conn.execute('SELECT 1 FROM runs WHERE source = ?', (source,)).fetchone():
+            return False
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"⚠️  Skipping unreadable result {path.name}: {e}")
+            return False
+        if not isinstance(data, dict):
+            return False
+
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO runs (source, kind, run_at, git_commit, schema_version) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (
+                    source,
+                    result_kind(data, path),
+                    parse_run_time(data, path),
+                    self._commit_for(data, path),
+                    int(data.get("schema_version", 0)),
+                )
+            )
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO metrics (run_id, name, value) VALUES (?, ?, ?)',
+                [(cursor.lastrowid, name, value) for name, value in flatten_metrics(data)]
+            )
+        return True
+
+    def ingest(self, paths: List[Path]) -> int:
+        """Load result files and directories (*.json). Returns the number of new runs."""
+        added = 0
+        for path in paths:
+            files = sorted(path.glob('*.json')) if path.is_dir() else [path]
+            for result_file in files:
+                if result_file.is_file() and self.ingest_file(result_file):
+                    added += 1
+        logger.info(f"🗄️  Ingested {added} new result file(s) into {self.db_path.name}")
+        return added
+
+    def series(self, metric: str, kind: Optional[str] = None) -> List[Tuple[str, str, str, float]]:
+        """(kind, run_at, git_commit, value) rows of one metric, oldest first."""
+        query = (
+            'SELECT r.kind, r.run_at, r.git_commit, m.value FROM metrics m '
+            'JOIN runs r ON r.id = m.run_id WHERE m.name = ?'
+        )
+        params: List[str] = [metric]
+        if kind:
+            query += ' AND r.kind = ?'
+            params.append(kind)
+        return self.conn.execute(query + ' ORDER BY r.kind, r.run_at, r.id', params).fetchall()
+
+    def detect_regressions(self, thresholds: Dict[str, float]) -> List[Regression]:
+        """
+        Compare the two most recent runs of every (kind, metric) series.
+
+        A metric regresses when it grew by more than the percentage of the
+        first threshold glob it matches (see parse_thresholds for the order).
+        """
+        rows = self.conn.execute(
+            'SELECT r.kind, m.name, r.run_at, m.value FROM metrics m '
+            'JOIN runs r ON r.id = m.run_id ORDER BY r.kind, m.name, r.run_at, r.id'
+        ).fetchall()
+
+        latest: Dict[Tuple[str, str], List[Tuple[str, float]]] = {}
+        for kind, name, run_at, value in rows:
+            points = latest.setdefault((kind, name), [])
+            points.append((run_at, value))
+            if len(points) > 2:
+                points.pop(0)
+
+        regressions = []
+        for (kind, name), points in sorted(latest.items()):
+            if len(points) < 2:
+                continue
+            threshold = next(
+                (pct for pattern, pct in thresholds.items() if fnmatch.fnmatchcase(name, pattern)),
+                None
+            )
+            if threshold is None:
+                continue
+            (prev_at, prev), (cur_at, cur) = points
+            if prev <= 0:
+                continue
+            change = (cur - prev) * 100 / prev
+            if change > threshold:
+                regressions.append(
+                    Regression(kind, name, prev, cur, change, threshold, prev_at, cur_at)
+                )
+        return regressions
+
+
+def parse_threshold(item: str) -> Tuple[str, float]:
+    """Split one GLOB=PCT override; raises ValueError when malformed."""
+    pattern, sep, pct = item.rpartition('=')
+    if not sep or not pattern:
+        raise ValueError(f"Threshold must be GLOB=PCT, got '{item}'")
+    try:
+        return pattern, float(pct)
+    except ValueError:
+        raise ValueError(f"Threshold percentage must be a number, got '{item}'") from None
+
+
+def threshold_arg(item: str) -> str:
+    """argparse type for --threshold: reject malformed overrides with a usage error."""
+    try:
+        parse_threshold(item)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+    return item
+
+
+def parse_thresholds(values: List[str]) -> Dict[str, float]:
+    """
+    Merge GLOB=PCT overrides with the default thresholds.
+
+    detect_regressions uses the first glob that matches, so overrides are
+    placed ahead of every default: `*tokens=1` wins over the default for
+    plugin_metrics.estimated_tokens.
+    """
+    thresholds = dict(parse_threshold(item) for item in values)
+    for pattern, pct in DEFAULT_THRESHOLDS.items():
+        thresholds.setdefault(pattern, pct)
+    return thresholds
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Track benchmark results over time and detect regressions'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument(
+        '--db',
+        type=Path,
+        help='SQLite store (default: <plugin-root>/benchmark/history.sqlite)'
+    )
+    parser.add_argument(
+        '--results',
+        type=Path,
+        action='append',
+        default=[],
+        help='Extra result file or directory to ingest (repeatable)'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=threshold_arg,
+        action='append',
+        default=[],
+        help='Max allowed increase as GLOB=PCT (repeatable)'
+    )
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('ingest', help='Load result files into the store')
+    series_parser = subparsers.add_parser('series', help="Print one metric's time series")
+    series_parser.add_argument('metric')
+    series_parser.add_argument('--kind', help='Restrict to one result family')
+    subparsers.add_parser('check', help='Ingest, then fail on regressions')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    store = HistoryStore(
+        args.db or args.plugin_root / 'benchmark' / 'history.sqlite',
+        args.plugin_root
+    )
+    try:
+        if args.command == 'series':
+            for kind, run_at, commit, value in store.series(args.metric, args.kind):
+                print(f"{kind:<18} {run_at:<20} {commit[:8]:<9} {value:g}")
+            return 0
+
+        store.ingest([args.plugin_root / 'benchmark' / 'results'] + args.results)
+        if args.command == 'ingest':
+            return 0
+
+        regressions = store.detect_regressions(parse_thresholds(args.threshold))
+        if regressions:
+            print(f"\n❌ Regressions: {len(regressions)}")
+            for regression in regressions:
+                print(f"  - {regression.describe()}")
+            return 1
+        print("✅ No regressions beyond thresholds")
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
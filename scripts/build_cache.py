@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Sync Build Cache
+
+Content-addressed cache of transformed output sets, so re-syncing a
+Framework commit that was already processed (workflow re-dispatch, branch
+switch, revert) restores each mapping's output in one read instead of
+re-reading and re-transforming every file.
+
+A key combines everything the output depends on: the id of the mapped
+Framework subtree (its git tree id, or a content digest outside git), the
+mapping's filename prefix and transformer, and a digest of the
+transformation rules.  Editing ContentTransformer therefore invalidates
+every entry without any bookkeeping.
+
+Layout:
+    .sync-cache/
+    ├── index.json
+    └── entries/
+        └── 9c/9c41…07.json.gz      {"source name": "transformed content", ...}
+
+Entries are evicted least-recently-used once the cache exceeds its size cap.
+
+Usage:
+    python scripts/build_cache.py [OPTIONS] COMMAND
+
+Commands:
+    list                    Show entries, most recently used first
+    prune                   Evict down to --max-size
+    clear                   Remove every entry
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --cache-dir PATH        Cache directory (default: .sync-cache)
+    --max-size MB           Size cap in MiB (default: 256)
+"""
+
+import sys
+import argparse
+import gzip
+import hashlib
+import json
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+from backup_store import atomic_write
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_CACHE_DIR = '.sync-cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def make_key(*parts: str) -> str:
+    """Cache key over the parts an output set depends on."""
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def tree_id(repo: Path, subdir: str) -> str:
+    """
+    Id of a directory's content: the git tree id when the directory is
+    committed and clean, otherwise a digest of its files.
+    """
+    try:
+        status = subprocess.run(
+            ['git', 'status', '--porcelain', '--', subdir],
+            cwd=repo, check=True, capture_output=True, text=True
+        ).stdout
+        if not status.strip():
+            tree = subprocess.run(
+                ['git', 'rev-parse', f'HEAD:./{subdir}'],
+                cwd=repo, check=True, capture_output=True, text=True
+            ).stdout.strip()
+            return f"git:{tree}"
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        pass
+
+    base = repo / subdir
+    digest = hashlib.sha256()
+    for path in sorted(base.rglob('*')):
+        if path.is_file():
+            digest.update(path.relative_to(base).as_posix().encode('utf-8') + b'\0')
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return f"sha256:{digest.hexdigest()}"
+
+
+@dataclass
+class CacheEntry:
+    """One cached output set."""
+    key: str
+    mapping: str
+    files: int
+    size: int
+    created: float
+    last_used: float
+
+
+class BuildCache:
+    """LRU-evicted store of transformed output sets, safe across threads."""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.index_path = root / 'index.json'
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.entries: Dict[str, CacheEntry] = self._load_index()
+
+    # ── Index ──────────────────────────────────────────────────────────────────
+
+    def _load_index(self) -> Dict[str, CacheEntry]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            data = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except ValueError:
+            logger.warning("⚠️  Build cache index unreadable — starting empty")
+            return {}
+        if data.get('version') != INDEX_VERSION:
+            return {}
+        return {e['key']: CacheEntry(**e) for e in data.get('entries', [])}
+
+    def _save_index(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "entries": [asdict(e) for e in sorted(self.entries.values(), key=lambda e: e.key)],
+        }
+        atomic_write(self.index_path, (json.dumps(data, indent=2) + '\n').encode('utf-8'))
+
+    def entry_path(self, key: str) -> Path:
+        return self.root / 'entries' / key[:2] / f"{key}.json.gz"
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(e.size for e in self.entries.values())
+
+    # ── Operations ─────────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Output set stored under key, or None (a missing or corrupt entry is dropped)."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            try:
+                files = json.loads(gzip.decompress(self.entry_path(key).read_bytes()))
+            except (OSError, ValueError):
+                logger.warning(f"⚠️  Dropping unreadable build cache entry {key[:12]}")
+                self._remove(key)
+                self._save_index()
+                self.misses += 1
+                return None
+            entry.last_used = time.time()
+            self._save_index()
+            self.hits += 1
+            return files
+
+    def put(self, key: str, mapping: str, files: Dict[str, str]) -> CacheEntry:
+        """Store an output set, then evict down to the size cap."""
+        data = gzip.compress(
+            json.dumps(files, ensure_ascii=False, sort_keys=True).encode('utf-8'), mtime=0
+        )
+        with self._lock:
+            atomic_write(self.entry_path(key), data)
+            now = time.time()
+            entry = CacheEntry(key, mapping, len(files), len(data), now, now)
+            self.entries[key] = entry
+            self._evict()
+            self._save_index()
+            return entry
+
+    def prune(self, max_bytes: Optional[int] = None) -> List[CacheEntry]:
+        """Evict least-recently-used entries until the cache fits max_bytes."""
+        with self._lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            evicted = self._evict()
+            self._save_index()
+            return evicted
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self.entries)
+            self.entries = {}
+            shutil.rmtree(self.root / 'entries', ignore_errors=True)
+            self._save_index()
+            return count
+
+    def _evict(self) -> List[CacheEntry]:
+        evicted = []
+        total = self.total_bytes
+        for entry in sorted(self.entries.values(), key=lambda e: e.last_used):
+            if total <= self.max_bytes:
+                break
+            self._remove(entry.key)
+            total -= entry.size
+            evicted.append(entry)
+        return evicted
+
+    def _remove(self, key: str) -> None:
+        self.entries.pop(key, None)
+        try:
+            self.entry_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Inspect and prune the sync build cache'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument('--cache-dir', type=Path, help='Cache directory')
+    parser.add_argument('--max-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help='Size cap in MiB')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('list', help='Show entries, most recently used first')
+    subparsers.add_parser('prune', help='Evict down to --max-size')
+    subparsers.add_parser('clear', help='Remove every entry')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    cache = BuildCache(args.cache_dir or args.plugin_root / DEFAULT_CACHE_DIR,
+                       args.max_size * 1024 * 1024)
+    if args.command == 'list':
+        for e in sorted(cache.entries.values(), key=lambda e: e.last_used, reverse=True):
+            used = time.strftime('%Y-%m-%d %H:%M', time.localtime(e.last_used))
+            print(f"{e.key[:12]}  {e.mapping:<12} {e.files:>4} files {e.size:>9} B  {used}")
+        logger.info(f"📦 {len(cache.entries)} entries, {cache.total_bytes:,} bytes")
+    elif args.command == 'prune':
+        evicted = cache.prune()
+        logger.info(f"🧹 Evicted {len(evicted)} entries, {cache.total_bytes:,} bytes kept")
+    elif args.command == 'clear':
+        logger.info(f"🧹 Removed {cache.clear()} entries")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
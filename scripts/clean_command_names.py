@@ -32,12 +32,12 @@ Exit Codes:
     1 - Error (directory not found or processing failed)
 """
 
-import os
-import re
 import sys
 from pathlib import Path
 from typing import Tuple
 
+import frontmatter
+
 
 def find_project_root() -> Path:
     """
@@ -65,36 +65,31 @@ def clean_name_attributes(content: str) -> Tuple[str, bool]:
     """
     Remove 'name:' attributes from YAML frontmatter.
 
+    Only the frontmatter header is inspected and rewritten; the markdown body
+    is left byte-for-byte intact.
+
     Args:
         content: File content as string
 
     Returns:
         Tuple of (cleaned content, was_modified)
     """
-    # Pattern to match 'name: value' in frontmatter
-    # Matches: name: value, name : value, NAME: value (case-insensitive)
-    name_pattern = re.compile(r'^\s*name\s*:\s*.*$', re.MULTILINE | re.IGNORECASE)
+    header = frontmatter.parse(content)
 
-    # Check if modification is needed
-    if not name_pattern.search(content):
+    # Matches: name: value, name : value, NAME: value (case-insensitive)
+    if header is None or not header.remove('name', ignore_case=True):
         return content, False
 
-    # Remove name attributes
-    cleaned = name_pattern.sub('', content)
-
-    # Clean up multiple consecutive newlines (max 2)
-    cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
-
-    # Remove trailing whitespace while preserving final newline
-    cleaned = cleaned.rstrip() + '\n' if cleaned.strip() else ''
-
-    return cleaned, True
+    return header.apply(content), True
 
 
 def process_commands_directory(commands_dir: Path) -> int:
     """
     Process all command markdown files in directory.
 
+    Files are processed in parallel; files without a name attribute are
+    not rewritten.
+
     Args:
         commands_dir: Path to commands directory
 
@@ -105,43 +100,28 @@ def process_commands_directory(commands_dir: Path) -> int:
         print(f"Error: Directory not found: {commands_dir}", file=sys.stderr)
         return -1
 
-    modified_count = 0
-    processed_count = 0
-    error_count = 0
-
     print(f"🔍 Scanning: {commands_dir}")
     print(f"{'='*60}")
 
-    # Process all .md files
-    for md_file in sorted(commands_dir.glob("*.md")):
-        processed_count += 1
-
-        try:
-            # Read file content
-            content = md_file.read_text(encoding='utf-8')
-
-            # Clean name attributes
-            cleaned_content, was_modified = clean_name_attributes(content)
-
-            if was_modified:
-                # Write cleaned content back
-                md_file.write_text(cleaned_content, encoding='utf-8')
-                modified_count += 1
-                print(f"✅ Modified: {md_file.name}")
-            else:
-                print(f"⏭️  Skipped:  {md_file.name} (no name attribute)")
+    result = frontmatter.edit_directory(
+        commands_dir,
+        lambda header, path: header.remove('name', ignore_case=True)
+    )
 
-        except Exception as e:
-            error_count += 1
-            print(f"❌ Error:    {md_file.name} - {e}", file=sys.stderr)
+    for md_file in result.modified:
+        print(f"✅ Modified: {md_file.name}")
+    for md_file in result.unchanged + result.no_frontmatter:
+        print(f"⏭️  Skipped:  {md_file.name} (no name attribute)")
+    for md_file, error in result.errors.items():
+        print(f"❌ Error:    {md_file.name} - {error}", file=sys.stderr)
 
     print(f"{'='*60}")
     print(f"📊 Summary:")
-    print(f"   • Processed: {processed_count} files")
-    print(f"   • Modified:  {modified_count} files")
-    print(f"   • Errors:    {error_count} files")
+    print(f"   • Processed: {result.processed} files")
+    print(f"   • Modified:  {len(result.modified)} files")
+    print(f"   • Errors:    {len(result.errors)} files")
 
-    return modified_count if error_count == 0 else -1
+    return len(result.modified) if not result.errors else -1
 
 
 def main() -> int:
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Command Closure Packs
+
+For every command, the transitive closure of the agents, modes and core
+files it references (directly or through those files), taken from the
+corpus cross-reference index of the transformed Plugin.  The result is a
+pack manifest a loader can use to bring in exactly one command's context
+when the command is invoked, instead of the whole corpus up front.
+
+Closures stop at other commands: /sc:pm mentioning /sc:implement does not
+pull /sc:implement's body, since that is its own entrypoint.  Such
+commands are listed under "commands" so a loader can prefetch them.
+
+Manifest (.claude-plugin/closure-packs.json):
+
+    {
+      "version": 1,
+      "estimator": "bytes",
+      "corpus_tokens": 187000,
+      "packs": {
+        "sc:pm": {
+          "path": "commands/sc-pm.md",
+          "tokens": 9120,
+          "files": [["commands/sc-pm.md", "command", 2210],
+                    ["agents/sc-pm-agent.md", "agent", 6910]],
+          "commands": ["sc:implement"]
+        }
+      }
+    }
+
+Usage:
+    python scripts/closure_packs.py [OPTIONS] COMMAND
+
+Commands:
+    build                   Derive the packs and write the manifest
+    show NAME               Print one pack (e.g. sc:pm)
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --manifest PATH         Pack manifest (default: .claude-plugin/closure-packs.json)
+    --estimator NAME        Token estimator (bytes, chars, words, pieces)
+"""
+
+import sys
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+from corpus_index import CorpusIndex
+from token_estimator import ESTIMATORS, DEFAULT_ESTIMATOR, get_estimator
+
+logger = logging.getLogger(__name__)
+
+PACKS_VERSION = 1
+DEFAULT_PACKS_PATH = Path('.claude-plugin') / 'closure-packs.json'
+
+# Node kinds a command's pack pulls in; load order within a pack
+PACKED_KINDS = ("agent", "mode", "core")
+_KIND_ORDER = {kind: i for i, kind in enumerate(("command",) + PACKED_KINDS)}
+
+
+def build_packs(plugin_root: Path, estimator_name: str = DEFAULT_ESTIMATOR) -> dict:
+    """Closure pack manifest for every command in the Plugin tree."""
+    estimator = get_estimator(estimator_name)
+    index = CorpusIndex.build(plugin_root)
+    tokens: Dict[str, int] = {
+        node_id: estimator((plugin_root / node.path).read_text(encoding='utf-8'))
+        for node_id, node in index.nodes.items()
+    }
+
+    packs = {}
+    for node_id in sorted(index.nodes):
+        node = index.nodes[node_id]
+        if node.kind != "command":
+            continue
+        members = sorted(
+            index.closure(node_id, PACKED_KINDS),
+            key=lambda m: (_KIND_ORDER[index.nodes[m].kind], m != node_id, index.nodes[m].name)
+        )
+        related = sorted({
+            index.nodes[target].name
+            for member in members
+            for target in index.edges.get(member, ())
+            if index.nodes[target].kind == "command" and target != node_id
+        })
+        packs[node.name] = {
+            "path": node.path,
+            "tokens": sum(tokens[m] for m in members),
+            "files": [[index.nodes[m].path, index.nodes[m].kind, tokens[m]] for m in members],
+            "commands": related,
+        }
+
+    return {
+        "version": PACKS_VERSION,
+        "estimator": estimator_name,
+        "corpus_tokens": sum(tokens.values()),
+        "packs": packs,
+    }
+
+
+def write_packs(
+    plugin_root: Path,
+    manifest_path: Optional[Path] = None,
+    estimator_name: str = DEFAULT_ESTIMATOR
+) -> dict:
+    """Build the pack manifest for a Plugin tree and save it."""
+    start = time.perf_counter()
+    manifest = build_packs(plugin_root, estimator_name)
+    manifest_path = manifest_path or plugin_root / DEFAULT_PACKS_PATH
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=1, ensure_ascii=False) + '\n', encoding='utf-8')
+
+    packs = manifest['packs'].values()
+    mean = sum(p['tokens'] for p in packs) / len(packs) if packs else 0
+    logger.info(
+        f"📦 Closure packs: {len(packs)} commands, mean {mean:,.0f} tokens per pack "
+        f"vs {manifest['corpus_tokens']:,} for the whole corpus "
+        f"({(time.perf_counter() - start) * 1000:.1f} ms)"
+    )
+    return manifest
+
+
+def load_packs(manifest_path: Path) -> Optional[dict]:
+    """Saved pack manifest, or None if missing or of another format version."""
+    if not manifest_path.exists():
+        return None
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    if manifest.get('version') != PACKS_VERSION:
+        return None
+    return manifest
+
+
+def get_pack(manifest: dict, command: str) -> dict:
+    """Pack for a command given as sc:pm, /sc:pm or pm."""
+    name = command.lstrip('/')
+    if not name.startswith('sc:'):
+        name = f"sc:{name}"
+    try:
+        return manifest['packs'][name]
+    except KeyError:
+        raise KeyError(f"No pack for {name}") from None
+
+
+def pack_files(manifest: dict, command: str) -> List[str]:
+    """Paths to load, in order, when command is invoked."""
+    return [path for path, _, _ in get_pack(manifest, command)['files']]
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Derive per-command dependency closure packs'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument('--manifest', type=Path, help='Pack manifest path')
+    parser.add_argument('--estimator', choices=sorted(ESTIMATORS), default=DEFAULT_ESTIMATOR,
+                        help='Token estimator')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='Derive the packs and write the manifest')
+    show_parser = subparsers.add_parser('show', help='Print one pack')
+    show_parser.add_argument('name')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    manifest_path = args.manifest or args.plugin_root / DEFAULT_PACKS_PATH
+    if args.command == 'build':
+        write_packs(args.plugin_root, manifest_path, args.estimator)
+        return 0
+
+    manifest = load_packs(manifest_path)
+    if manifest is None:
+        logger.info("ℹ️  No pack manifest — deriving from the corpus")
+        manifest = build_packs(args.plugin_root, args.estimator)
+    try:
+        pack = get_pack(manifest, args.name)
+    except KeyError as e:
+        logger.error(f"❌ {e.args[0]}")
+        return 1
+    for path, kind, tokens in pack['files']:
+        print(f"{tokens:>8}  {kind:<8} {path}")
+    print(f"{pack['tokens']:>8}  total ({len(pack['files'])} files)")
+    if pack['commands']:
+        print(f"related commands: {', '.join(pack['commands'])}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Command Stubs
+
+Optional output layout that keeps only each command's frontmatter in
+commands/ and moves the full file to a sidecar directory.  Until a command
+is invoked, only its `description` frontmatter matters, so the stub is all
+that has to be read up front.  The stub's one-line pointer names the
+deferred body for the model to read on invocation.
+
+Layout:
+    commands/sc-pm.md           ---\\ndescription: ...\\n---\\n\\nRead `…/command-bodies/sc-pm.md` …
+    command-bodies/sc-pm.md     the complete transformed command, unchanged
+
+Bodies are the complete files, so `join` restores the full layout exactly.
+Everything that reads command text (corpus index, search, closure packs,
+content registry, bundles) resolves a stub to its body with `command_file`.
+
+Usage:
+    python scripts/command_stubs.py [OPTIONS] COMMAND
+
+Commands:
+    report                  Show the upfront bytes a split would save
+    split                   Write stubs and deferred bodies
+    join                    Restore full command files from their bodies
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+"""
+
+import sys
+import argparse
+import shutil
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+from frontmatter import FRONTMATTER_PATTERN
+
+logger = logging.getLogger(__name__)
+
+COMMANDS_DIR = 'commands'
+BODIES_DIR = 'command-bodies'
+
+# The pointer left in place of a command's body
+POINTER_TEMPLATE = "Read `${{CLAUDE_PLUGIN_ROOT}}/{body}` and follow it for: $ARGUMENTS\n"
+
+
+def make_stub(content: str, body_path: str) -> str:
+    """Frontmatter of content followed by a pointer to body_path."""
+    pointer = POINTER_TEMPLATE.format(body=body_path)
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return pointer
+    return f"{content[:match.end()]}\n\n{pointer}"
+
+
+def command_file(plugin_root: Path, path: Path) -> Path:
+    """
+    The file holding the full text of a command: its deferred body when path
+    is a stub pointing at one, otherwise path itself.
+    """
+    try:
+        rel = path.relative_to(plugin_root / COMMANDS_DIR).as_posix()
+    except ValueError:
+        return path
+    body_path = plugin_root / BODIES_DIR / rel
+    if not body_path.is_file():
+        return path
+    pointer = POINTER_TEMPLATE.format(body=f"{BODIES_DIR}/{rel}")
+    try:
+        if path.read_text(encoding='utf-8').endswith(pointer):
+            return body_path
+    except OSError:
+        pass
+    return path
+
+
+@dataclass
+class StubReport:
+    """Upfront bytes of the command files in the full and stub layouts."""
+    commands: int = 0
+    full_bytes: int = 0
+    stub_bytes: int = 0
+    files: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.full_bytes - self.stub_bytes
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of upfront bytes deferred (0.0–1.0)."""
+        return self.saved_bytes / self.full_bytes if self.full_bytes else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.update(saved_bytes=self.saved_bytes, reduction=round(self.reduction, 4))
+        return data
+
+    def summary(self) -> str:
+        return (f"{self.full_bytes:,} → {self.stub_bytes:,} upfront command bytes "
+                f"(−{self.reduction:.1%}) across {self.commands} commands")
+
+
+def _command_files(commands_dir: Path) -> List[Path]:
+    return sorted(commands_dir.rglob('*.md')) if commands_dir.is_dir() else []
+
+
+def split_commands(plugin_root: Path, dry_run: bool = False) -> StubReport:
+    """
+    Replace each command file with a stub and write its body to BODIES_DIR.
+
+    Commands that are already stubs keep their existing body; commands no
+    larger than their stub would be stay whole.  Bodies whose command is
+    gone or stays whole are removed.
+    """
+    commands_dir = plugin_root / COMMANDS_DIR
+    bodies_dir = plugin_root / BODIES_DIR
+    report = StubReport()
+    kept = set()
+
+    for path in _command_files(commands_dir):
+        rel = path.relative_to(commands_dir).as_posix()
+        body_path = bodies_dir / rel
+        body_rel = f"{BODIES_DIR}/{rel}"
+        content = path.read_text(encoding='utf-8')
+        if body_path.exists():
+            body = body_path.read_text(encoding='utf-8')
+            if content == make_stub(body, body_rel):
+                content = body
+        stub = make_stub(content, body_rel)
+        full, small = len(content.encode('utf-8')), len(stub.encode('utf-8'))
+        whole = small >= full
+
+        report.commands += 1
+        report.full_bytes += full
+        report.stub_bytes += full if whole else small
+        report.files[rel] = [full, full if whole else small]
+        if not whole:
+            kept.add(rel)
+
+        if not dry_run:
+            if not whole:
+                body_path.parent.mkdir(parents=True, exist_ok=True)
+                body_path.write_text(content, encoding='utf-8')
+            path.write_text(content if whole else stub, encoding='utf-8')
+
+    if not dry_run:
+        for body_path in _command_files(bodies_dir):
+            if body_path.relative_to(bodies_dir).as_posix() not in kept:
+                body_path.unlink()
+                logger.info(f"  🗑️  Removed: {body_path.relative_to(plugin_root)}")
+    return report
+
+
+def join_commands(plugin_root: Path, dry_run: bool = False) -> int:
+    """Put every deferred body back over its stub and remove BODIES_DIR."""
+    commands_dir = plugin_root / COMMANDS_DIR
+    bodies_dir = plugin_root / BODIES_DIR
+    restored = 0
+    for body_path in _command_files(bodies_dir):
+        rel = body_path.relative_to(bodies_dir).as_posix()
+        path = commands_dir / rel
+        body = body_path.read_text(encoding='utf-8')
+        if path.exists() and path.read_text(encoding='utf-8') == make_stub(body, f"{BODIES_DIR}/{rel}"):
+            if not dry_run:
+                path.write_text(body, encoding='utf-8')
+            restored += 1
+    if not dry_run and bodies_dir.exists():
+        shutil.rmtree(bodies_dir)
+    return restored
+
+
+def remove_bodies(plugin_root: Path, dry_run: bool = False) -> Optional[int]:
+    """Drop BODIES_DIR after a full-layout sync; returns the files removed, if any."""
+    bodies_dir = plugin_root / BODIES_DIR
+    if not bodies_dir.exists():
+        return None
+    count = len(_command_files(bodies_dir))
+    if not dry_run:
+        shutil.rmtree(bodies_dir)
+    return count
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Split commands into frontmatter stubs plus deferred bodies'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('report', help='Show the upfront bytes a split would save')
+    subparsers.add_parser('split', help='Write stubs and deferred bodies')
+    subparsers.add_parser('join', help='Restore full command files from their bodies')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == 'join':
+        logger.info(f"↩️  Restored {join_commands(args.plugin_root)} command files")
+        return 0
+
+    report = split_commands(args.plugin_root, dry_run=args.command == 'report')
+    if args.command == 'report':
+        print(f"{'full':>8} {'stub':>6}  command")
+        for rel, (full, small) in sorted(report.files.items(), key=lambda item: -item[1][0]):
+            print(f"{full:8} {small:6}  {COMMANDS_DIR}/{rel}")
+    logger.info(f"📉 {report.summary()}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
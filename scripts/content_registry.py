@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Content Registry
+
+In-process, read-only view of the Plugin corpus for tools that consume it
+(bots, linters, reports).  Opening the registry reads only each file's
+frontmatter; bodies are read on first access and kept in a size-bounded
+LRU cache.  Every access re-stats the file, so edits made on disk are
+picked up on the next lookup (mtime/size change → entry reloaded).
+
+Names follow the same rules as the corpus index: commands are looked up as
+`sc:implement`, agents by frontmatter name with or without the `sc-`
+prefix, modes and core files by file stem.
+
+Example:
+    registry = ContentRegistry.open(Path('.'))
+    command = registry.get_command('sc:implement')
+    command.get('category')            # frontmatter value, no body read
+    registry.body(command)             # read once, then served from cache
+
+Usage:
+    python scripts/content_registry.py [OPTIONS] [NAME ...]
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --cache-mb N            Body cache budget in MiB (default: 8)
+"""
+
+import os
+import sys
+import argparse
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+
+import frontmatter
+from corpus_index import CorpusIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_BYTES = 8 * 1024 * 1024
+
+
+@dataclass
+class Entry:
+    """One corpus file, described by its frontmatter."""
+    kind: str
+    name: str
+    path: Path
+    mtime_ns: int
+    size: int
+    header: Optional[frontmatter.Frontmatter] = None
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Frontmatter value, or default when absent."""
+        return self.header.get(key, default) if self.header else default
+
+    def get_list(self, key: str) -> List[str]:
+        return self.header.get_list(key) if self.header else []
+
+
+def read_header(path: Path) -> str:
+    """Read a file only up to the end of its frontmatter ('' if it has none)."""
+    with open(path, encoding='utf-8') as handle:
+        first = handle.readline()
+        if first.rstrip() != '---':
+            return ''
+        lines = [first]
+        for line in handle:
+            lines.append(line)
+            if line.rstrip() == '---':
+                break
+        return ''.join(lines)
+
+
+class BodyCache:
+    """LRU cache of file contents bounded by total bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items: 'OrderedDict[Path, Tuple[Tuple[int, int], str]]' = OrderedDict()
+
+    def get(self, path: Path, stamp: Tuple[int, int]) -> Optional[str]:
+        item = self._items.get(path)
+        if item is None or item[0] != stamp:
+            self.misses += 1
+            return None
+        self._items.move_to_end(path)
+        self.hits += 1
+        return item[1]
+
+    def put(self, path: Path, stamp: Tuple[int, int], text: str) -> None:
+        self.discard(path)
+        size = len(text.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        self._items[path] = (stamp, text)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted) = self._items.popitem(last=False)
+            self.current_bytes -= len(evicted.encode('utf-8'))
+
+    def discard(self, path: Path) -> None:
+        item = self._items.pop(path, None)
+        if item is not None:
+            self.current_bytes -= len(item[1].encode('utf-8'))
+
+    def paths(self) -> List[Path]:
+        return list(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class ContentRegistry:
+    """Frontmatter index of commands, agents, modes and core files."""
+
+    def __init__(self, plugin_root: Path, cache_bytes: int = DEFAULT_CACHE_BYTES):
+        self.plugin_root = plugin_root
+        self.cache = BodyCache(cache_bytes)
+        self._entries: Dict[Tuple[str, str], Entry] = {}
+        self._aliases: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def open(cls, plugin_root: Path, cache_bytes: int = DEFAULT_CACHE_BYTES) -> 'ContentRegistry':
+        """Scan the corpus, reading frontmatter only."""
+        registry = cls(plugin_root, cache_bytes)
+        registry.refresh()
+        return registry
+
+    # ── Loading ────────────────────────────────────────────────────────────────
+
+    def refresh(self) -> None:
+        """Rescan directories for added and removed files."""
+        with self._lock:
+            entries: Dict[Tuple[str, str], Entry] = {}
+            for kind, path in CorpusIndex.corpus_files(self.plugin_root):
+                entry = self._load_entry(kind, path, path.stat())
+                entries[(kind, entry.name)] = entry
+            self._entries = entries
+            self._rebuild_aliases()
+            for path in [p for p in self.cache.paths() if not p.exists()]:
+                self.cache.discard(path)
+
+    def _load_entry(self, kind: str, path: Path, stat: os.stat_result) -> Entry:
+        header_text = read_header(path)
+        return Entry(
+            kind=kind,
+            name=CorpusIndex.node_name(kind, path, header_text),
+            path=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            header=frontmatter.parse(header_text) if header_text else None,
+        )
+
+    def _rebuild_aliases(self) -> None:
+        self._aliases = {}
+        for key, entry in self._entries.items():
+            if entry.kind == "agent":
+                bare = entry.name[3:] if entry.name.startswith('sc-') else entry.name
+                for alias in (bare, f"sc-{bare}"):
+                    self._aliases.setdefault(("agent", alias), key)
+            elif entry.kind == "command":
+                self._aliases.setdefault(("command", entry.name[3:]), key)
+
+    def _fresh(self, entry: Entry) -> Optional[Entry]:
+        """Re-stat an entry; reload its header if the file changed."""
+        try:
+            stat = entry.path.stat()
+        except FileNotFoundError:
+            self._entries.pop((entry.kind, entry.name), None)
+            self.cache.discard(entry.path)
+            return None
+        if (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size):
+            return entry
+        reloaded = self._load_entry(entry.kind, entry.path, stat)
+        self.cache.discard(entry.path)
+        self._entries.pop((entry.kind, entry.name), None)
+        self._entries[(reloaded.kind, reloaded.name)] = reloaded
+        if reloaded.name != entry.name:
+            self._rebuild_aliases()
+        return reloaded
+
+    # ── Lookup ─────────────────────────────────────────────────────────────────
+
+    def get(self, kind: str, name: str) -> Optional[Entry]:
+        """Entry by kind and name (or alias), or None."""
+        with self._lock:
+            key = (kind, name)
+            entry = self._entries.get(key) or self._entries.get(self._aliases.get(key))
+            return self._fresh(entry) if entry else None
+
+    def get_command(self, name: str) -> Optional[Entry]:
+        """Command by invocation name: 'sc:implement' (or 'implement')."""
+        return self.get("command", name)
+
+    def get_agent(self, name: str) -> Optional[Entry]:
+        """Agent by frontmatter name, with or without the sc- prefix."""
+        return self.get("agent", name)
+
+    def get_mode(self, name: str) -> Optional[Entry]:
+        return self.get("mode", name)
+
+    def entries(self, kind: Optional[str] = None) -> Iterator[Entry]:
+        """All entries (of one kind), sorted by name."""
+        with self._lock:
+            selected = [e for e in self._entries.values() if kind is None or e.kind == kind]
+        return iter(sorted(selected, key=lambda e: (e.kind, e.name)))
+
+    def body(self, entry: Entry) -> str:
+        """Full file content, served from the LRU cache while unchanged."""
+        with self._lock:
+            current = self._fresh(entry)
+            if current is None:
+                raise FileNotFoundError(entry.path)
+            stamp = (current.mtime_ns, current.size)
+            text = self.cache.get(current.path, stamp)
+            if text is None:
+                text = current.path.read_text(encoding='utf-8')
+                self.cache.put(current.path, stamp, text)
+            return text
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Load the Plugin content registry and time lookups'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument(
+        '--cache-mb',
+        type=float,
+        default=DEFAULT_CACHE_BYTES / (1024 * 1024),
+        help='Body cache budget in MiB'
+    )
+    parser.add_argument('names', nargs='*', help='Commands to look up (e.g. sc:implement)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    start = time.perf_counter()
+    registry = ContentRegistry.open(args.plugin_root, int(args.cache_mb * 1024 * 1024))
+    logger.info(f"📚 Registry opened: {len(registry)} entries ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    for name in args.names or ['sc:implement']:
+        entry = registry.get_command(name)
+        if entry is None:
+            logger.warning(f"⚠️  Unknown command: {name}")
+            continue
+        registry.body(entry)
+        start = time.perf_counter()
+        for _ in range(1000):
+            registry.body(registry.get_command(name))
+        per_call_us = (time.perf_counter() - start) * 1000
+        logger.info(f"⚡ {entry.name}: {entry.get('description', '')[:60]} ({per_call_us:.1f} µs/lookup warm)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
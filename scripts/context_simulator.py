@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Context-Load Simulator
+
+Quantifies the upfront-versus-lazy loading trade-off argued in
+benchmark/PERFORMANCE_EVIDENCE.md and FAIR_CONCLUSION.md.  Reads the plugin
+tree and a scenario file, generates thousands of synthetic sessions, and
+computes the tokens each loading strategy puts into context at startup and
+on demand.
+
+Strategies:
+    upfront             every command/agent/mode/core file at startup (today)
+    lazy                nothing at startup; each invoked file once, on demand
+    frontmatter_stubs   command/agent frontmatter at startup; bodies on demand
+    closure             like lazy, but an invocation also loads the agents, modes
+                        and core files it references, transitively (a closure
+                        pack; other commands stay unloaded until invoked)
+
+Scenario file (JSON):
+    {
+      "sessions": 5000,
+      "seed": 7,
+      "scenarios": [
+        {"name": "implement+test", "weight": 3,
+         "session": "invokes /sc:implement then /sc:test with sc-python-expert"},
+        {"name": "explore", "weight": 1, "random_commands": [1, 6]}
+      ]
+    }
+
+Usage:
+    python scripts/context_simulator.py SCENARIO_FILE [OPTIONS]
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --estimator NAME        Token estimator (bytes, chars, words, pieces)
+    --sessions N            Override the number of synthetic sessions
+    --output PATH           Save the simulation report as JSON
+"""
+
+import sys
+import argparse
+import json
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence, Set, Tuple
+import logging
+
+from closure_packs import PACKED_KINDS
+from corpus_index import CorpusIndex
+from token_estimator import ESTIMATORS, DEFAULT_ESTIMATOR, get_estimator
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ["upfront", "lazy", "frontmatter_stubs", "closure"]
+
+# Tokens of a scenario "session" sentence that name corpus items
+STEP_PATTERN = re.compile(
+    r'(?P<command>/sc:[\w-]+)|@?agent-(?P<mention>[\w-]+)'
+    r'|\b(?P<agent>sc-[\w-]+)|\b(?P<mode>MODE_\w+)'
+)
+FRONTMATTER_PATTERN = re.compile(r'\A---\n.*?\n---\n?', re.DOTALL)
+
+
+class ScenarioError(ValueError):
+    """Raised when a scenario file references unknown items or is malformed."""
+    pass
+
+
+@dataclass
+class CorpusCosts:
+    """Per-item token costs, indexed by position in `ids`."""
+    ids: List[str]
+    full: List[int]
+    stub: List[int]
+    kinds: List[str]
+    closure: List[Tuple[int, ...]] = field(default_factory=list)
+
+    @classmethod
+    def from_tree(cls, plugin_root: Path, estimator_name: str = DEFAULT_ESTIMATOR) -> 'CorpusCosts':
+        estimator = get_estimator(estimator_name)
+        index = CorpusIndex.build(plugin_root)
+        ids = sorted(index.nodes)
+        position = {node_id: i for i, node_id in enumerate(ids)}
+        full, stub, kinds = [], [], []
+        for node_id in ids:
+            node = index.nodes[node_id]
+            text = (plugin_root / node.path).read_text(encoding='utf-8')
+            frontmatter = FRONTMATTER_PATTERN.match(text)
+            full.append(estimator(text))
+            stub.append(estimator(frontmatter.group(0)) if frontmatter else 0)
+            kinds.append(node.kind)
+
+        costs = cls(ids, full, stub, kinds)
+        costs.closure = [
+            tuple(sorted(position[n] for n in index.closure(node_id, PACKED_KINDS)))
+            for node_id in ids
+        ]
+        return costs
+
+    def position(self, node_id: str) -> Optional[int]:
+        try:
+            return self.ids.index(node_id)
+        except ValueError:
+            return None
+
+
+@dataclass
+class Scenario:
+    """A weighted family of sessions."""
+    name: str
+    weight: float
+    steps: Tuple[int, ...] = ()
+    random_commands: Tuple[int, int] = (0, 0)
+
+
+def parse_steps(sentence: str, costs: CorpusCosts) -> Tuple[int, ...]:
+    """Map '/sc:implement then /sc:test with sc-python-expert' to item positions."""
+    steps = []
+    for match in STEP_PATTERN.finditer(sentence):
+        group = match.lastgroup
+        value = match.group(group)
+        if group == "command":
+            candidates = [f"command/{value[1:]}"]
+        elif group in ("agent", "mention"):
+            bare = value[3:] if value.startswith('sc-') else value
+            candidates = [f"agent/sc-{bare}", f"agent/{bare}"]
+        else:
+            candidates = [f"mode/{value}"]
+        found = next((p for p in map(costs.position, candidates) if p is not None), None)
+        if found is None:
+            raise ScenarioError(f"Unknown item '{value}' in scenario: {sentence}")
+        steps.append(found)
+    return tuple(steps)
+
+
+def load_scenarios(data: dict, costs: CorpusCosts) -> List[Scenario]:
+    """Build Scenario objects from a parsed scenario file."""
+    scenarios = []
+    for i, entry in enumerate(data.get("scenarios", [])):
+        if isinstance(entry, str):
+            entry = {"session": entry}
+        steps: Tuple[int, ...] = ()
+        if "session" in entry:
+            steps = parse_steps(entry["session"], costs)
+        elif "steps" in entry:
+            steps = parse_steps(" ".join(entry["steps"]), costs)
+        low, high = entry.get("random_commands", (0, 0))
+        if not steps and not high:
+            raise ScenarioError(f"Scenario {i} has neither steps nor random_commands")
+        scenarios.append(Scenario(
+            name=entry.get("name", f"scenario_{i}"),
+            weight=float(entry.get("weight", 1)),
+            steps=steps,
+            random_commands=(int(low), int(high)),
+        ))
+    if not scenarios:
+        raise ScenarioError("Scenario file defines no scenarios")
+    return scenarios
+
+
+class ContextSimulator:
+    """Monte Carlo simulation of per-session context cost."""
+
+    def __init__(self, costs: CorpusCosts):
+        self.costs = costs
+        self.commands = [i for i, kind in enumerate(costs.kinds) if kind == "command"]
+        stubbed = [i for i, kind in enumerate(costs.kinds) if kind in ("command", "agent")]
+        self.startup = {
+            "upfront": sum(costs.full),
+            "lazy": 0,
+            "frontmatter_stubs": sum(costs.stub[i] for i in stubbed),
+            "closure": 0,
+        }
+
+    def sample(self, scenarios: Sequence[Scenario], sessions: int, seed: int = 0) -> Counter:
+        """
+        Draw synthetic sessions.
+
+        Returns a Counter of session signatures (sorted tuples of distinct item
+        positions); sessions that load the same items are costed only once.
+        """
+        rng = random.Random(seed)
+        picks = rng.choices(scenarios, weights=[s.weight for s in scenarios], k=sessions)
+        signatures: Counter = Counter()
+        for scenario in picks:
+            items = set(scenario.steps)
+            low, high = scenario.random_commands
+            if high:
+                items.update(rng.sample(self.commands, min(rng.randint(low, high), len(self.commands))))
+            signatures[tuple(sorted(items))] += 1
+        return signatures
+
+    def on_demand(self, strategy: str, signature: Tuple[int, ...]) -> int:
+        """Tokens loaded after startup for one session signature."""
+        costs = self.costs
+        if strategy == "upfront":
+            return 0
+        if strategy == "lazy":
+            return sum(costs.full[i] for i in signature)
+        if strategy == "frontmatter_stubs":
+            # Stubs are already resident; only bodies of invoked items load.
+            # Modes and core files have no stub and load whole.
+            return sum(
+                costs.full[i] - costs.stub[i] if costs.kinds[i] in ("command", "agent") else costs.full[i]
+                for i in signature
+            )
+        if strategy == "closure":
+            loaded: Set[int] = set()
+            for i in signature:
+                loaded.update(costs.closure[i])
+            return sum(costs.full[i] for i in loaded)
+        raise ValueError(f"Unknown strategy: {strategy}")
+
+    def run(self, scenarios: Sequence[Scenario], sessions: int, seed: int = 0) -> dict:
+        """Simulate sessions and aggregate startup/on-demand cost per strategy."""
+        signatures = self.sample(scenarios, sessions, seed)
+        report = {
+            "sessions": sessions,
+            "unique_sessions": len(signatures),
+            "strategies": {},
+        }
+        for strategy in STRATEGIES:
+            # Weighted aggregation over unique signatures
+            totals = sorted(
+                (self.startup[strategy] + self.on_demand(strategy, sig), count)
+                for sig, count in signatures.items()
+            )
+            mean = sum(t * c for t, c in totals) / sessions if sessions else 0.0
+            report["strategies"][strategy] = {
+                "startup_tokens": self.startup[strategy],
+                "mean_on_demand_tokens": round(mean - self.startup[strategy], 1),
+                "mean_total_tokens": round(mean, 1),
+                "p50_total_tokens": weighted_percentile(totals, 50),
+                "p95_total_tokens": weighted_percentile(totals, 95),
+                "max_total_tokens": totals[-1][0] if totals else 0,
+            }
+        baseline = report["strategies"]["upfront"]["mean_total_tokens"]
+        for stats in report["strategies"].values():
+            stats["savings_vs_upfront_pct"] = (
+                round((baseline - stats["mean_total_tokens"]) * 100 / baseline, 1) if baseline else 0.0
+            )
+        return report
+
+
+def weighted_percentile(sorted_pairs: List[Tuple[int, int]], pct: float) -> int:
+    """Nearest-rank percentile over (value, count) pairs sorted by value."""
+    total = sum(count for _, count in sorted_pairs)
+    if not total:
+        return 0
+    rank = max(1, -(-total * pct // 100))
+    seen = 0
+    for value, count in sorted_pairs:
+        seen += count
+        if seen >= rank:
+            return value
+    return sorted_pairs[-1][0]
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Simulate per-session context cost under different loading strategies'
+    )
+    parser.add_argument(
+        'scenario_file',
+        type=Path,
+        help='JSON scenario file'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument(
+        '--estimator',
+        choices=sorted(ESTIMATORS),
+        default=DEFAULT_ESTIMATOR,
+        help='Token estimator'
+    )
+    parser.add_argument(
+        '--sessions',
+        type=int,
+        help='Override the number of synthetic sessions'
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        help='Save the simulation report as JSON'
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    data = json.loads(args.scenario_file.read_text(encoding='utf-8'))
+    costs = CorpusCosts.from_tree(args.plugin_root, args.estimator)
+    try:
+        scenarios = load_scenarios(data, costs)
+    except ScenarioError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    sessions = args.sessions or int(data.get("sessions", 1000))
+    report = ContextSimulator(costs).run(scenarios, sessions, int(data.get("seed", 0)))
+    report["estimator"] = args.estimator
+    report["scenarios"] = [s.name for s in scenarios]
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        logger.info(f"📊 Report saved to: {args.output}")
+
+    print(f"\nCONTEXT LOAD SIMULATION ({sessions} sessions, {report['unique_sessions']} unique)")
+    print("=" * 60)
+    print(f"{'strategy':<18} {'startup':>8} {'mean':>9} {'p50':>8} {'p95':>8} {'saved':>7}")
+    for strategy, stats in report["strategies"].items():
+        print(
+            f"{strategy:<18} {stats['startup_tokens']:>8} {stats['mean_total_tokens']:>9.0f} "
+            f"{stats['p50_total_tokens']:>8} {stats['p95_total_tokens']:>8} "
+            f"{stats['savings_vs_upfront_pct']:>6.1f}%"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Corpus Cross-Reference Index
+
+Builds a graph of command, agent, mode and core nodes from the transformed
+Plugin corpus, with an edge for every reference one file makes to another.
+The index reports dangling references (targets that do not exist) and
+orphaned nodes (nodes nothing else references).
+
+Each file is read once and scanned once with a single combined pattern.
+A literal prefilter finds the lines that can hold a reference at all, and
+only those lines go through the full pattern.  Node lookups are plain
+set/dict membership tests, so the cost is linear in corpus size.
+
+Usage:
+    python scripts/corpus_index.py [OPTIONS]
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --json                  Print the full report as JSON
+    --strict                Exit non-zero when dangling references exist
+"""
+
+import os
+import sys
+import argparse
+import json
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import logging
+
+import frontmatter
+from command_stubs import command_file
+
+logger = logging.getLogger(__name__)
+
+# Threads scanning one level of a synced tree's directories at a time
+SCAN_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# Directory overviews, not referenceable corpus content
+SKIPPED_STEMS = ('README', 'sc-README')
+
+
+def _scan_level(root: Path, rel: str) -> Tuple[List[str], List[str]]:
+    files, dirs = [], []
+    with os.scandir(root / rel if rel else root) as entries:
+        for entry in entries:
+            child = f"{rel}/{entry.name}" if rel else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                # Dot-directories are tool state (staging, caches), never content
+                if not entry.name.startswith('.'):
+                    dirs.append(child)
+            elif entry.name.endswith('.md') and entry.is_file():
+                files.append(child)
+    return files, dirs
+
+
+def scan_markdown(root: Path, workers: int = SCAN_WORKERS) -> List[str]:
+    """
+    Relative POSIX paths of every markdown file under root, sorted.
+
+    The tree is walked breadth-first with os.scandir, each level's
+    directories scanned in parallel, so deep and wide trees cost one
+    directory read per directory and no per-file stat calls.
+    """
+    if not root.is_dir():
+        return []
+    found: List[str] = []
+    level = ['']
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while level:
+            next_level: List[str] = []
+            for files, dirs in pool.map(lambda rel: _scan_level(root, rel), level):
+                found.extend(files)
+                next_level.extend(dirs)
+            level = next_level
+    return sorted(found)
+
+
+
+@dataclass(frozen=True)
+class Node:
+    """A referenceable unit of the Plugin corpus."""
+    kind: str
+    name: str
+    path: str
+
+    @property
+    def node_id(self) -> str:
+        return f"{self.kind}/{self.name}"
+
+
+class CorpusIndex:
+    """Cross-reference graph over commands, agents, modes and core files."""
+
+    # Directories scanned, in order, with the node kind they produce
+    CORPUS_DIRS: List[Tuple[str, str]] = [
+        ("commands", "command"),
+        ("agents", "agent"),
+        ("modes", "mode"),
+        ("core", "core"),
+    ]
+
+    # One alternation per reference kind so every file is scanned exactly once.
+    # Repeated namespace prefixes (/sc:sc:build) resolve to the final segment.
+    REFERENCE_PATTERN = re.compile(
+        r'(?<![\w/])/sc:(?:sc:)*(?P<command>\w[\w-]*)'
+        r'|@agent-(?P<mention>[\w-]+)'
+        r'|\b(?P<agent>sc-[a-z0-9]+(?:-[a-z0-9]+)*)\b'
+        r'|\b(?P<mode>MODE_\w+?)(?:\.md)?\b'
+        r'|\b(?P<core>[A-Z][A-Z_]*[A-Z])\.md\b'
+    )
+
+    # A literal every REFERENCE_PATTERN match contains.  Matches never span
+    # lines, so lines without one of these are skipped without the boundary
+    # checks that make the full pattern slow to try at every position.
+    REFERENCE_HINT = re.compile(r'/sc:|@agent-|sc-|MODE_|\.md')
+
+    def __init__(self):
+        self.nodes: Dict[str, Node] = {}
+        self.edges: Dict[str, Set[str]] = defaultdict(set)
+        self.dangling: Dict[str, Set[str]] = defaultdict(set)
+        # Raw references collected during the scan, resolved in resolve()
+        self._pending: List[Tuple[str, str, str, bool]] = []
+        self._agent_aliases: Dict[str, str] = {}
+
+    # ── Building ───────────────────────────────────────────────────────────────
+
+    @classmethod
+    def build(cls, plugin_root: Path) -> 'CorpusIndex':
+        """Scan the Plugin tree once and return a resolved index."""
+        index = cls()
+        for kind, path in cls.corpus_files(plugin_root):
+            text = path.read_text(encoding='utf-8')
+            index.add_document(kind, path, text, plugin_root)
+        index.resolve()
+        return index
+
+    @classmethod
+    def corpus_files(
+        cls,
+        plugin_root: Path,
+        kinds: Optional[Iterable[str]] = None
+    ) -> Iterator[Tuple[str, Path]]:
+        """
+        (kind, path) of every corpus markdown file, nested directories included.
+
+        Directories are taken in CORPUS_DIRS order and files in sorted
+        relative-path order; README overviews are skipped.  A command stub
+        yields its deferred body, so callers always read the full text.
+        """
+        wanted = set(kinds) if kinds is not None else None
+        for dirname, kind in cls.CORPUS_DIRS:
+            if wanted is not None and kind not in wanted:
+                continue
+            directory = plugin_root / dirname
+            for rel in scan_markdown(directory):
+                path = directory / rel
+                if path.stem not in SKIPPED_STEMS:
+                    yield kind, command_file(plugin_root, path) if kind == "command" else path
+
+    @classmethod
+    def node_name(cls, kind: str, path: Path, text: str = "") -> str:
+        """Derive the public name of a corpus file."""
+        stem = path.stem
+        if kind == "command":
+            # Same mapping PluginJsonGenerator uses: sc-brainstorm.md → sc:brainstorm
+            return f"sc:{stem[3:] if stem.startswith('sc-') else stem}"
+        if kind == "agent":
+            header = frontmatter.parse(text)
+            return (header and header.get('name')) or stem
+        return stem
+
+    def add_document(
+        self,
+        kind: str,
+        path: Path,
+        text: str,
+        plugin_root: Optional[Path] = None
+    ) -> Node:
+        """Register a node and collect the references its text makes."""
+        rel = str(path.relative_to(plugin_root)) if plugin_root else str(path)
+        node = Node(kind, self.node_name(kind, path, text), rel)
+        self.nodes[node.node_id] = node
+        if kind == "agent":
+            self._register_agent_aliases(node.node_id, node.name)
+
+        for match in self.scan_references(text):
+            group = match.lastgroup
+            value = match.group(group)
+            if group == "command":
+                self._pending.append((node.node_id, "command", f"sc:{value}", True))
+            elif group == "mention":
+                self._pending.append((node.node_id, "agent", value, True))
+            elif group == "agent":
+                # Bare sc- tokens are also used for filenames; only count hits
+                self._pending.append((node.node_id, "agent", value, False))
+            elif group == "mode":
+                self._pending.append((node.node_id, "mode", value, True))
+            elif group == "core":
+                # CLAUDE.md, PLANNING.md etc. are user files, not corpus nodes
+                self._pending.append((node.node_id, "core", value, False))
+
+        header = frontmatter.parse(text) if kind == "command" else None
+        if header:
+            for persona in header.get_list('personas'):
+                # Personas are abstract roles; only matching agents count
+                self._pending.append((node.node_id, "agent", persona, False))
+
+        return node
+
+    @classmethod
+    def scan_references(cls, text: str) -> Iterator[re.Match]:
+        """REFERENCE_PATTERN matches in text, scanning only lines with a hint."""
+        pos = 0
+        while True:
+            hint = cls.REFERENCE_HINT.search(text, pos)
+            if not hint:
+                return
+            start = text.rfind('\n', 0, hint.start()) + 1
+            end = text.find('\n', hint.end())
+            if end < 0:
+                end = len(text)
+            yield from cls.REFERENCE_PATTERN.finditer(text, start, end)
+            pos = end
+
+    def _register_agent_aliases(self, node_id: str, name: str) -> None:
+        bare = name[3:] if name.startswith('sc-') else name
+        for alias in (name, bare, f"sc-{bare}"):
+            self._agent_aliases.setdefault(alias, node_id)
+
+    def resolve(self) -> None:
+        """Turn collected references into edges and dangling entries."""
+        for source, kind, value, required in self._pending:
+            if kind == "agent":
+                target = self._agent_aliases.get(value)
+            else:
+                target = f"{kind}/{value}"
+                if target not in self.nodes:
+                    target = None
+            if target is not None:
+                if target != source:
+                    self.edges[source].add(target)
+            elif required:
+                self.dangling[source].add(f"{kind}/{value}")
+        self._pending = []
+
+    # ── Queries ────────────────────────────────────────────────────────────────
+
+    def incoming(self) -> Dict[str, Set[str]]:
+        """Reverse adjacency: node_id → set of nodes referencing it."""
+        reverse: Dict[str, Set[str]] = defaultdict(set)
+        for source, targets in self.edges.items():
+            for target in targets:
+                reverse[target].add(source)
+        return reverse
+
+    def closure(self, start: str, kinds: Optional[Iterable[str]] = None) -> Set[str]:
+        """
+        start plus every node reachable from it.
+
+        With kinds, only nodes of those kinds are entered (start is always
+        included), e.g. an agent/mode/core closure that stops at commands.
+        """
+        wanted = set(kinds) if kinds is not None else None
+        seen = {start}
+        stack = [start]
+        while stack:
+            for target in self.edges.get(stack.pop(), ()):
+                if target in seen:
+                    continue
+                if wanted is not None and self.nodes[target].kind not in wanted:
+                    continue
+                seen.add(target)
+                stack.append(target)
+        return seen
+
+    def orphans(self, kinds: Iterable[str] = ("agent", "mode")) -> List[str]:
+        """
+        Nodes of the given kinds that no other node references.
+
+        Commands are user entrypoints, so they are excluded by default.
+        """
+        wanted = set(kinds)
+        referenced = self.incoming()
+        return sorted(
+            node_id for node_id, node in self.nodes.items()
+            if node.kind in wanted and node_id not in referenced
+        )
+
+    def dangling_references(self) -> List[Tuple[str, str]]:
+        """Sorted (source path, missing target) pairs."""
+        return sorted(
+            (self.nodes[source].path, target)
+            for source, targets in self.dangling.items()
+            for target in targets
+        )
+
+    def report(self) -> dict:
+        """JSON-serializable summary of the graph."""
+        counts: Dict[str, int] = defaultdict(int)
+        for node in self.nodes.values():
+            counts[node.kind] += 1
+        return {
+            "nodes": dict(counts),
+            "edges": sum(len(t) for t in self.edges.values()),
+            "dangling": [
+                {"source": source, "target": target}
+                for source, target in self.dangling_references()
+            ],
+            "orphans": self.orphans(),
+            "graph": {
+                source: sorted(targets)
+                for source, targets in sorted(self.edges.items())
+            },
+        }
+
+
+def validate_corpus(plugin_root: Path) -> Tuple[CorpusIndex, List[str]]:
+    """
+    Build the index for a Plugin tree and describe its problems.
+
+    Orphans are often intentional (agents only invoked by users), so they
+    are logged at debug level rather than returned.
+
+    Returns:
+        (index, warnings) — one warning per dangling reference
+    """
+    start = time.perf_counter()
+    index = CorpusIndex.build(plugin_root)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    edge_count = sum(len(t) for t in index.edges.values())
+    logger.info(
+        f"🕸️  Corpus index: {len(index.nodes)} nodes, {edge_count} edges "
+        f"({elapsed_ms:.1f} ms)"
+    )
+
+    warnings = [
+        f"Dangling reference in {source}: {target}"
+        for source, target in index.dangling_references()
+    ]
+    for node_id in index.orphans():
+        logger.debug(f"Orphaned node: {node_id}")
+    return index, warnings
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Build the cross-reference index of the Plugin corpus'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print the full report as JSON'
+    )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Exit non-zero when dangling references exist'
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    index, warnings = validate_corpus(args.plugin_root)
+
+    if args.json:
+        print(json.dumps(index.report(), indent=2, ensure_ascii=False))
+    else:
+        for warning in warnings:
+            print(f"  - {warning}")
+        for node_id in index.orphans():
+            print(f"  - Orphaned node: {node_id}")
+
+    sys.exit(1 if args.strict and index.dangling else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Corpus Metrics Engine
+
+Single-pass replacement for the metric collection in the benchmark shell
+scripts (performance-test.sh, detailed-analysis.sh, fair-comparison-test.sh).
+Those scripts walk the tree once per category and per metric with
+`find … -exec wc -c`; this module walks the plugin exactly once with
+`os.scandir`, optionally fanning top-level directories out to a thread pool,
+and derives every metric from that one listing.
+
+On top of the scripts' metrics it reports p50/p95 file size and token
+distributions per category, and writes schema-versioned JSON into
+benchmark/results/.
+
+Usage:
+    python scripts/corpus_metrics.py [OPTIONS]
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --output-dir PATH       Results directory (default: benchmark/results)
+    --estimator NAME        Token estimator (bytes, chars, words, pieces)
+    --workers N             Parallel directory walkers (default: 1)
+    --stdout                Print the report instead of writing a file
+"""
+
+import os
+import sys
+import argparse
+import json
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from token_estimator import ESTIMATORS, DEFAULT_ESTIMATOR, get_estimator
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Component categories reported by detailed-analysis.sh, in report order
+CATEGORIES = ["commands", "agents", "modes", "core"]
+
+# Directories never walked: VCS internals are not part of the plugin payload
+SKIP_DIRS = {".git"}
+
+# Context windows used by the scripts' context-pressure sections
+CONTEXT_WINDOWS = {
+    "claude_sonnet_4_5": 200000,
+    "gpt4_turbo": 128000,
+    "gemini_1_5_pro": 1000000,
+}
+
+# Session sizes from fair-comparison-test.sh (commands per session)
+SESSION_SIZES = {
+    "single_command": 1,
+    "medium_session_10_commands": 10,
+    "heavy_session_50_commands": 50,
+}
+
+
+@dataclass
+class FileStat:
+    """Size and token estimate of one file in the plugin tree."""
+    rel_path: str
+    size: int
+    tokens: int
+
+    @property
+    def category(self) -> Optional[str]:
+        top = self.rel_path.split('/', 1)[0]
+        return top if top in CATEGORIES else None
+
+    @property
+    def is_markdown(self) -> bool:
+        return self.rel_path.endswith('.md')
+
+
+class CorpusWalker:
+    """Lists every file of the plugin tree in one os.scandir traversal."""
+
+    def __init__(self, plugin_root: Path, estimator_name: str = DEFAULT_ESTIMATOR, workers: int = 1):
+        self.plugin_root = plugin_root
+        self.estimator_name = estimator_name
+        self.estimator = get_estimator(estimator_name)
+        self.workers = max(1, workers)
+
+    def walk(self) -> List[FileStat]:
+        """Return stats for every file, sorted by relative path."""
+        stats: List[FileStat] = []
+        subdirs: List[Tuple[str, str]] = []
+
+        with os.scandir(self.plugin_root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append((entry.path, entry.name))
+                elif entry.is_file(follow_symlinks=False):
+                    stats.append(self._stat(entry, entry.name))
+
+        if self.workers > 1 and len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for result in pool.map(lambda d: self._walk_dir(*d), subdirs):
+                    stats.extend(result)
+        else:
+            for path, rel in subdirs:
+                stats.extend(self._walk_dir(path, rel))
+
+        stats.sort(key=lambda s: s.rel_path)
+        return stats
+
+    def _walk_dir(self, path: str, rel: str) -> List[FileStat]:
+        stats: List[FileStat] = []
+        stack = [(path, rel)]
+        while stack:
+            current, current_rel = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    entry_rel = f"{current_rel}/{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append((entry.path, entry_rel))
+                    elif entry.is_file(follow_symlinks=False):
+                        stats.append(self._stat(entry, entry_rel))
+        return stats
+
+    def _stat(self, entry: os.DirEntry, rel: str) -> FileStat:
+        size = entry.stat(follow_symlinks=False).st_size
+        if not rel.endswith('.md'):
+            return FileStat(rel, size, 0)
+        if self.estimator_name == "bytes":
+            # bytes / 4 needs no read
+            return FileStat(rel, size, size // 4)
+        with open(entry.path, encoding='utf-8', errors='replace') as handle:
+            return FileStat(rel, size, self.estimator(handle.read()))
+
+
+def percentile(values: List[int], pct: float) -> int:
+    """Nearest-rank percentile of an unsorted list (0 for an empty list)."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def human_size(num_bytes: int) -> str:
+    """Format bytes like `du -sh` (1024-based, one decimal under 10)."""
+    size = float(num_bytes)
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024 or unit == "G":
+            if unit == "B":
+                return f"{int(size)}B"
+            return f"{size:.1f}{unit}" if size < 10 else f"{size:.0f}{unit}"
+        size /= 1024
+    return f"{size:.0f}G"
+
+
+class MetricsReport:
+    """Derives every benchmark metric from a single file listing."""
+
+    def __init__(self, stats: List[FileStat], estimator_name: str = DEFAULT_ESTIMATOR):
+        self.stats = stats
+        self.estimator_name = estimator_name
+        self.markdown = [s for s in stats if s.is_markdown]
+        self.by_category: Dict[str, List[FileStat]] = {c: [] for c in CATEGORIES}
+        self.by_path: Dict[str, FileStat] = {}
+        for stat in self.markdown:
+            self.by_path[stat.rel_path] = stat
+            if stat.category:
+                self.by_category[stat.category].append(stat)
+
+    def _tokens(self, files: List[FileStat]) -> int:
+        # Scripts estimate on the summed byte count, not per file
+        if self.estimator_name == "bytes":
+            return sum(f.size for f in files) // 4
+        return sum(f.tokens for f in files)
+
+    def _lookup(self, category: str, name: str) -> int:
+        for candidate in (f"{category}/sc-{name}.md", f"{category}/{name}.md"):
+            if candidate in self.by_path:
+                return self._tokens([self.by_path[candidate]])
+        return 0
+
+    def component_breakdown(self) -> Dict[str, dict]:
+        breakdown = {}
+        for category, files in self.by_category.items():
+            total_bytes = sum(f.size for f in files)
+            count = len(files)
+            avg_bytes = total_bytes // count if count else 0
+            breakdown[category] = {
+                "category": category,
+                "file_count": count,
+                "total_bytes": total_bytes,
+                "avg_bytes": avg_bytes,
+                "total_tokens": self._tokens(files),
+                "avg_tokens": self._tokens(files) // count if count else 0,
+            }
+        return breakdown
+
+    def distributions(self) -> Dict[str, dict]:
+        distributions = {}
+        for category, files in self.by_category.items():
+            sizes = [f.size for f in files]
+            tokens = [f.tokens for f in files]
+            distributions[category] = {
+                "size_bytes": {
+                    "p50": percentile(sizes, 50),
+                    "p95": percentile(sizes, 95),
+                    "max": max(sizes, default=0),
+                },
+                "tokens": {
+                    "p50": percentile(tokens, 50),
+                    "p95": percentile(tokens, 95),
+                    "max": max(tokens, default=0),
+                },
+            }
+        return distributions
+
+    def build(self) -> dict:
+        """Assemble the full, schema-versioned report."""
+        md_bytes = sum(f.size for f in self.markdown)
+        md_tokens = self._tokens(self.markdown)
+        counts = {c: len(files) for c, files in self.by_category.items()}
+        help_tokens = self._lookup("commands", "help")
+        architect_tokens = self._lookup("agents", "backend-architect")
+
+        def overhead(single: int) -> dict:
+            return {
+                "plugin_tokens": md_tokens,
+                "mcp_tokens": single,
+                "overhead_tokens": md_tokens - single,
+                "waste_percentage": (md_tokens - single) * 100 // md_tokens if md_tokens else 0,
+            }
+
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "generator": "corpus_metrics",
+            "timestamp": datetime.now().strftime('%Y%m%d_%H%M%S'),
+            "estimator": self.estimator_name,
+            "plugin_metrics": {
+                "total_size": human_size(sum(f.size for f in self.stats)),
+                "total_size_bytes": sum(f.size for f in self.stats),
+                "markdown_files": len(self.markdown),
+                "markdown_size_bytes": md_bytes,
+                "markdown_size_kb": md_bytes // 1024,
+                "estimated_tokens": md_tokens,
+                "commands": counts["commands"],
+                "agents": counts["agents"],
+                "modes": counts["modes"],
+            },
+            "context_load": {
+                "tokens_per_command": md_tokens // counts["commands"] if counts["commands"] else 0,
+                "tokens_per_agent": md_tokens // counts["agents"] if counts["agents"] else 0,
+            },
+            "component_breakdown": self.component_breakdown(),
+            "distributions": self.distributions(),
+            "total_plugin_cost": {
+                "files": len(self.markdown),
+                "bytes": md_bytes,
+                "tokens": md_tokens,
+            },
+            "usage_scenarios": {
+                "scenario_1_help_command": overhead(help_tokens),
+                "scenario_2_backend_architect": overhead(architect_tokens),
+                "scenario_3_typical_session": {
+                    "plugin_tokens": md_tokens,
+                    "mcp_tokens": help_tokens * 5,
+                    "savings_tokens": md_tokens - help_tokens * 5,
+                },
+            },
+            "token_efficiency": {
+                name: {
+                    "plugin_tokens": md_tokens,
+                    "mcp_tokens": help_tokens * size,
+                    "winner": "plugin" if md_tokens < help_tokens * size else "mcp_gateway",
+                }
+                for name, size in SESSION_SIZES.items()
+            },
+            "context_window_impact": {
+                name: {
+                    "total_context": window,
+                    "plugin_usage": md_tokens,
+                    "percentage_used": md_tokens * 100 // window,
+                    "remaining": window - md_tokens,
+                }
+                for name, window in CONTEXT_WINDOWS.items()
+            },
+        }
+
+
+def git_commit(plugin_root: Path) -> str:
+    """Current HEAD of the plugin repository, or 'unknown'."""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=plugin_root,
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "unknown"
+
+
+def collect_metrics(
+    plugin_root: Path,
+    estimator_name: str = DEFAULT_ESTIMATOR,
+    workers: int = 1
+) -> dict:
+    """Walk the plugin once and return the full metrics report."""
+    stats = CorpusWalker(plugin_root, estimator_name, workers).walk()
+    report = MetricsReport(stats, estimator_name).build()
+    report["git_commit"] = git_commit(plugin_root)
+    return report
+
+
+def write_report(report: dict, output_dir: Path) -> Path:
+    """Write a report as metrics_<timestamp>.json and return its path."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"metrics_{report['timestamp']}.json"
+    path.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+    return path
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Collect plugin corpus metrics in a single tree walk'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=Path,
+        help='Results directory (default: <plugin-root>/benchmark/results)'
+    )
+    parser.add_argument(
+        '--estimator',
+        choices=sorted(ESTIMATORS),
+        default=DEFAULT_ESTIMATOR,
+        help='Token estimator'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Parallel directory walkers'
+    )
+    parser.add_argument(
+        '--stdout',
+        action='store_true',
+        help='Print the report instead of writing a file'
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    report = collect_metrics(args.plugin_root, args.estimator, args.workers)
+
+    if args.stdout:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    output_dir = args.output_dir or args.plugin_root / 'benchmark' / 'results'
+    path = write_report(report, output_dir)
+    metrics = report["plugin_metrics"]
+    logger.info(f"📄 Results saved to: {path}")
+    print(f"  Markdown Files: {metrics['markdown_files']}")
+    print(f"  Total MD Size: {metrics['markdown_size_kb']} KB")
+    print(f"  Estimated Tokens: {metrics['estimated_tokens']}")
+    for category, dist in report["distributions"].items():
+        print(
+            f"  {category:<9} p50 {dist['tokens']['p50']:>6} tokens  "
+            f"p95 {dist['tokens']['p95']:>6} tokens"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Delta Update Packages
+
+Builds a compact update package between two Plugin versions, so an update
+that changed three commands ships three small diffs instead of the whole
+tree.  Either side can be a directory or a git ref of the Plugin repo.
+
+A package is gzip-compressed JSON:
+
+    {
+      "version": 1,
+      "from": {"plugin_version": "4.4.0", "tree": "<digest>"},
+      "to":   {"plugin_version": "4.4.1", "tree": "<digest>"},
+      "changes": [
+        {"path": "commands/sc-build.md", "op": "patch",
+         "before": "<sha256>", "after": "<sha256>", "ops": [...]},
+        {"path": "agents/sc-new.md", "op": "add", "after": "<sha256>", "text": "..."},
+        {"path": "agents/sc-old.md", "op": "remove", "before": "<sha256>"}
+      ]
+    }
+
+`patch` ops are line-level edit scripts: ["=", n] keeps n lines, ["-", n]
+drops n lines, ["+", [lines]] inserts lines.  A text file is sent as a
+patch only when that is smaller than sending it whole (`replace`);
+binary files always travel whole, base64-encoded.
+
+The tree digest is a SHA-256 over the sorted (path, SHA-256) pairs of every
+shipped file.  apply checks the target tree matches "from" and every
+change's path and "before" hash before touching anything, computes all
+results in memory and writes them to temporary siblings, renames them into
+place only once all are on disk, then checks the tree matches "to".
+
+Usage:
+    python scripts/delta_update.py [OPTIONS] COMMAND
+
+Commands:
+    create OLD NEW          Build a package (OLD/NEW: directory or git ref)
+    apply PACKAGE           Verify and patch the Plugin tree in place
+    show PACKAGE            Summarize a package
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --output PATH           create: package path (default: dist/delta-<from>-<to>.json.gz)
+"""
+
+import os
+import sys
+import argparse
+import base64
+import difflib
+import gzip
+import hashlib
+import json
+import subprocess
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from command_stubs import BODIES_DIR
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_VERSION = 1
+
+# What an installed Plugin consists of
+SHIPPED_PATHS = ["commands", BODIES_DIR, "agents", "modes", "core", ".claude-plugin", "plugin.json"]
+
+
+class DeltaError(RuntimeError):
+    """Raised when a package does not match the tree it is applied to."""
+    pass
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def tree_digest(files: Dict[str, bytes]) -> str:
+    """Digest of a whole tree from its per-file hashes."""
+    h = hashlib.sha256()
+    for path in sorted(files):
+        h.update(f"{path}\0{sha256(files[path])}\n".encode('utf-8'))
+    return h.hexdigest()
+
+
+def plugin_version(files: Dict[str, bytes]) -> str:
+    for candidate in ("plugin.json", ".claude-plugin/plugin.json"):
+        if candidate in files:
+            try:
+                return json.loads(files[candidate]).get('version', 'unknown')
+            except ValueError:
+                pass
+    return 'unknown'
+
+
+# ── Reading trees ──────────────────────────────────────────────────────────────
+
+def read_directory(root: Path) -> Dict[str, bytes]:
+    """Shipped files of a Plugin directory: relative path → content."""
+    files: Dict[str, bytes] = {}
+    for entry in SHIPPED_PATHS:
+        path = root / entry
+        if path.is_file():
+            files[entry] = path.read_bytes()
+        elif path.is_dir():
+            for child in path.rglob('*'):
+                if child.is_file():
+                    files[child.relative_to(root).as_posix()] = child.read_bytes()
+    return files
+
+
+def read_git_ref(repo: Path, ref: str) -> Dict[str, bytes]:
+    """Shipped files at a git ref, read through one cat-file process."""
+    listing = subprocess.run(
+        ['git', 'ls-tree', '-r', '-z', ref, '--', *SHIPPED_PATHS],
+        cwd=repo, check=True, capture_output=True
+    ).stdout
+    blobs: List[Tuple[str, str]] = []
+    for record in listing.split(b'\0'):
+        if not record:
+            continue
+        meta, path = record.split(b'\t', 1)
+        _, kind, obj = meta.split()
+        if kind == b'blob':
+            blobs.append((path.decode('utf-8'), obj.decode('ascii')))
+
+    request = ''.join(f"{obj}\n" for _, obj in blobs).encode('ascii')
+    output = subprocess.run(
+        ['git', 'cat-file', '--batch'],
+        cwd=repo, input=request, check=True, capture_output=True
+    ).stdout
+
+    files: Dict[str, bytes] = {}
+    position = 0
+    for path, _ in blobs:
+        header_end = output.index(b'\n', position)
+        size = int(output[position:header_end].split()[2])
+        start = header_end + 1
+        files[path] = output[start:start + size]
+        position = start + size + 1
+    return files
+
+
+def read_tree(source: str, repo: Path) -> Dict[str, bytes]:
+    """A directory if one exists at source, otherwise a git ref of repo."""
+    path = Path(source)
+    if path.is_dir():
+        return read_directory(path)
+    return read_git_ref(repo, source)
+
+
+# ── Diffing ────────────────────────────────────────────────────────────────────
+
+def line_ops(old: str, new: str) -> list:
+    """Line edit script turning old into new."""
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops: list = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", i2 - i1])
+        if j2 > j1:
+            ops.append(["+", new_lines[j1:j2]])
+    return ops
+
+
+def apply_ops(old: str, ops: list) -> str:
+    lines = old.splitlines(keepends=True)
+    result: List[str] = []
+    position = 0
+    for op, arg in ops:
+        if op == "=":
+            result.extend(lines[position:position + arg])
+            position += arg
+        elif op == "-":
+            position += arg
+        elif op == "+":
+            result.extend(arg)
+        else:
+            raise DeltaError(f"Unknown patch op: {op}")
+    return ''.join(result)
+
+
+def _payload(data: bytes) -> Dict[str, str]:
+    try:
+        return {"text": data.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(data).decode('ascii')}
+
+
+def _content(change: dict) -> bytes:
+    if "text" in change:
+        return change["text"].encode('utf-8')
+    return base64.b64decode(change["base64"])
+
+
+def create_package(old: Dict[str, bytes], new: Dict[str, bytes]) -> dict:
+    """Delta package turning tree old into tree new."""
+    changes = []
+    for path in sorted(set(old) | set(new)):
+        before, after = old.get(path), new.get(path)
+        if before == after:
+            continue
+        if after is None:
+            changes.append({"path": path, "op": "remove", "before": sha256(before)})
+            continue
+        if before is None:
+            changes.append({"path": path, "op": "add", "after": sha256(after), **_payload(after)})
+            continue
+
+        change = {"path": path, "before": sha256(before), "after": sha256(after)}
+        whole = _payload(after)
+        if "text" in whole and "text" in _payload(before):
+            ops = line_ops(before.decode('utf-8'), whole["text"])
+            if len(json.dumps(ops)) < len(json.dumps(whole["text"])):
+                changes.append({**change, "op": "patch", "ops": ops})
+                continue
+        changes.append({**change, "op": "replace", **whole})
+
+    return {
+        "version": PACKAGE_VERSION,
+        "from": {"plugin_version": plugin_version(old), "tree": tree_digest(old)},
+        "to": {"plugin_version": plugin_version(new), "tree": tree_digest(new)},
+        "changes": changes,
+    }
+
+
+def write_package(package: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(package, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    path.write_bytes(gzip.compress(data, mtime=0))
+
+
+def read_package(path: Path) -> dict:
+    package = json.loads(gzip.decompress(path.read_bytes()))
+    if package.get('version') != PACKAGE_VERSION:
+        raise DeltaError(f"Unsupported package version: {package.get('version')}")
+    return package
+
+
+# ── Applying ───────────────────────────────────────────────────────────────────
+
+def check_path(path: str) -> str:
+    """path, if it is a relative path inside SHIPPED_PATHS; DeltaError otherwise."""
+    parts = PurePosixPath(path).parts
+    if not parts or path.startswith('/') or '..' in parts or '\\' in path:
+        raise DeltaError(f"Unsafe path in package: {path!r}")
+    if not any(path == entry or path.startswith(f"{entry}/") for entry in SHIPPED_PATHS):
+        raise DeltaError(f"Path outside the shipped tree: {path!r}")
+    return path
+
+
+def apply_package(package: dict, root: Path) -> Dict[str, int]:
+    """
+    Verify root is the package's "from" tree, patch it, verify "to".
+
+    Nothing is written unless every change checks out and can be computed
+    first.  New contents then go to temporary files next to their targets
+    and are renamed into place only once all of them are written, so a
+    failure while writing leaves the tree untouched.  The renames and
+    removals that follow are not one atomic step.
+    """
+    current = read_directory(root)
+    if tree_digest(current) != package['from']['tree']:
+        raise DeltaError(
+            f"Tree does not match package base {package['from']['plugin_version']} "
+            f"— refusing to patch"
+        )
+
+    results: Dict[str, Optional[bytes]] = {}
+    for change in package['changes']:
+        path, op = check_path(change['path']), change['op']
+        if op == 'add':
+            if path in current:
+                raise DeltaError(f"Cannot add {path}: it already exists")
+        elif op in ('patch', 'replace', 'remove'):
+            if path not in current:
+                raise DeltaError(f"Cannot {op} {path}: it does not exist")
+            if sha256(current[path]) != change['before']:
+                raise DeltaError(f"Cannot {op} {path}: content differs from the package base")
+        else:
+            raise DeltaError(f"Unknown change op: {op}")
+
+        if op == 'remove':
+            results[path] = None
+        elif op == 'patch':
+            results[path] = apply_ops(current[path].decode('utf-8'), change['ops']).encode('utf-8')
+        else:
+            results[path] = _content(change)
+        if results[path] is not None and sha256(results[path]) != change['after']:
+            raise DeltaError(f"Patched content does not match package for {path}")
+
+    staged: List[Tuple[Path, Path]] = []
+    try:
+        for path, data in results.items():
+            if data is None:
+                continue
+            target = root / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f".{target.name}.delta-tmp")
+            tmp.write_bytes(data)
+            staged.append((tmp, target))
+    except OSError:
+        for tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+
+    for tmp, target in staged:
+        os.replace(tmp, target)
+    removed = [path for path, data in results.items() if data is None]
+    for path in removed:
+        (root / path).unlink()
+    counts = {'written': len(staged), 'removed': len(removed)}
+
+    if tree_digest(read_directory(root)) != package['to']['tree']:
+        raise DeltaError("Tree does not match package target after applying")
+    return counts
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Create and apply delta update packages between Plugin versions'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    create_parser = subparsers.add_parser('create', help='Build a package')
+    create_parser.add_argument('old', help='Directory or git ref of the old version')
+    create_parser.add_argument('new', help='Directory or git ref of the new version')
+    create_parser.add_argument('--output', type=Path, help='Package path')
+    apply_parser = subparsers.add_parser('apply', help='Verify and patch the Plugin tree')
+    apply_parser.add_argument('package', type=Path)
+    show_parser = subparsers.add_parser('show', help='Summarize a package')
+    show_parser.add_argument('package', type=Path)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    try:
+        if args.command == 'create':
+            old = read_tree(args.old, args.plugin_root)
+            new = read_tree(args.new, args.plugin_root)
+            package = create_package(old, new)
+            output = args.output or args.plugin_root / 'dist' / (
+                f"delta-{package['from']['plugin_version']}-{package['to']['plugin_version']}.json.gz"
+            )
+            write_package(package, output)
+            full_size = sum(len(data) for data in new.values())
+            logger.info(
+                f"📦 {len(package['changes'])} change(s) → {output} "
+                f"({output.stat().st_size:,} bytes vs {full_size:,} bytes full tree)"
+            )
+        elif args.command == 'apply':
+            package = read_package(args.package)
+            counts = apply_package(package, args.plugin_root)
+            logger.info(
+                f"✅ Updated {package['from']['plugin_version']} → {package['to']['plugin_version']}: "
+                f"{counts['written']} written, {counts['removed']} removed"
+            )
+        elif args.command == 'show':
+            package = read_package(args.package)
+            print(f"{package['from']['plugin_version']} → {package['to']['plugin_version']}")
+            for change in package['changes']:
+                print(f"  {change['op']:<8} {change['path']}")
+    except (DeltaError, OSError, subprocess.CalledProcessError) as e:
+        logger.error(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Framework Replay and Bisect
+
+Replays the sync transforms across a range of Framework commits without
+checking anything out: each commit's mapped subtrees are listed from the
+git object store, blobs are read through one `git cat-file --batch` per
+commit, and the SYNC_MAPPINGS transforms run in memory.  A blob already
+transformed at an earlier commit is reused, so walking N commits costs
+roughly the number of distinct file versions, not N full syncs.
+
+Warnings logged while transforming (e.g. an agent without frontmatter) are
+captured per file and reported with the commit that introduced them.
+
+Ranges follow git syntax; for A..B the replay starts at A itself so the
+first commit after A has a baseline to compare against.  History is walked
+along first parents.
+
+Usage:
+    python scripts/framework_replay.py [OPTIONS] COMMAND
+
+Commands:
+    log RANGE               Per commit: outputs added/modified/removed, new warnings
+    first-change RANGE PATH First commit whose transform changed PATH (e.g. commands/sc-build.md)
+    first-warning RANGE [REGEX]
+                            First commit that introduced a (matching) warning
+    bisect GOOD BAD         First commit where the predicate holds, by binary search
+
+Options:
+    --framework-repo PATH|URL   Framework repository (URLs are cloned bare)
+    bisect predicates (one of):
+    --contains PATH TEXT    PATH's output contains TEXT
+    --lacks PATH TEXT       PATH's output is missing or lacks TEXT
+    --warning REGEX         a warning matches REGEX
+    --exec CMD              CMD exits non-zero when run in the materialized tree
+"""
+
+import sys
+import argparse
+import re
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+
+from sync_from_framework import ContentTransformer, FrameworkSyncer, SyncMapping
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayState:
+    """Transformed Plugin output of one Framework commit."""
+    commit: str
+    subject: str
+    outputs: Dict[str, str]
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CommitChange:
+    """What one commit changed relative to the commit before it."""
+    state: ReplayState
+    added: List[str]
+    modified: List[str]
+    removed: List[str]
+    new_warnings: List[str]
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.modified or self.removed or self.new_warnings)
+
+
+class _WarningCollector(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+class FrameworkReplay:
+    """In-memory sync replay over the history of a Framework repository."""
+
+    def __init__(self, repo: Path, mappings: Optional[List[SyncMapping]] = None):
+        self.repo = repo
+        self.mappings = mappings if mappings is not None else FrameworkSyncer.SYNC_MAPPINGS
+        # (mapping name, blob id, file name) → (transformed content, warnings)
+        self._transformed: Dict[Tuple[str, str, str], Tuple[str, List[str]]] = {}
+        self.transforms = 0
+        self.reused = 0
+
+    def _git(self, *args: str, data: Optional[bytes] = None) -> bytes:
+        return subprocess.run(
+            ['git', *args], cwd=self.repo, input=data, check=True, capture_output=True
+        ).stdout
+
+    def commits(self, rev_range: str) -> List[str]:
+        """Commits of a range, oldest first; A..B includes A as the baseline."""
+        if '..' not in rev_range:
+            return [self._git('rev-parse', '--verify', f'{rev_range}^{{commit}}').decode().strip()]
+        base = rev_range.split('..', 1)[0] or 'HEAD'
+        listed = self._git('rev-list', '--reverse', '--first-parent', rev_range).decode().split()
+        return [self._git('rev-parse', '--verify', f'{base}^{{commit}}').decode().strip(), *listed]
+
+    def _read_blobs(self, object_ids: List[str]) -> Dict[str, bytes]:
+        if not object_ids:
+            return {}
+        output = self._git('cat-file', '--batch', data=''.join(f"{o}\n" for o in object_ids).encode())
+        blobs: Dict[str, bytes] = {}
+        position = 0
+        for object_id in object_ids:
+            header_end = output.index(b'\n', position)
+            size = int(output[position:header_end].split()[2])
+            start = header_end + 1
+            blobs[object_id] = output[start:start + size]
+            position = start + size + 1
+        return blobs
+
+    def state(self, commit: str) -> ReplayState:
+        """Replay the sync transforms for one commit."""
+        sources = [m.source.rstrip('/') for m in self.mappings]
+        listing = self._git('ls-tree', '-r', '-z', commit, '--', *sources)
+        files: List[Tuple[SyncMapping, str, str]] = []
+        for record in listing.split(b'\0'):
+            if not record:
+                continue
+            meta, path = record.split(b'\t', 1)
+            _, kind, object_id = meta.decode().split()
+            path = path.decode('utf-8')
+            for mapping in self.mappings:
+                # Like sync_directory (scan_markdown): markdown files anywhere
+                # under the mapped directory, except inside dot-directories
+                prefix = mapping.source.rstrip('/') + '/'
+                rel = path[len(prefix):]
+                if kind != 'blob' or not path.startswith(prefix) or not rel.endswith('.md'):
+                    continue
+                if any(part.startswith('.') for part in rel.split('/')[:-1]):
+                    continue
+                files.append((mapping, object_id, rel))
+
+        missing = sorted({o for m, o, n in files if (m.name, o, n) not in self._transformed})
+        blobs = self._read_blobs(missing)
+
+        outputs: Dict[str, str] = {}
+        warnings: List[str] = []
+        for mapping, object_id, rel in files:
+            name = rel.rpartition('/')[2]
+            key = (mapping.name, object_id, name)
+            if key in self._transformed:
+                self.reused += 1
+            else:
+                self._transformed[key] = self._transform(mapping, blobs[object_id], name)
+                self.transforms += 1
+            content, file_warnings = self._transformed[key]
+            outputs[f"{mapping.dest.rstrip('/')}/{mapping.output_path(rel)}"] = content
+            warnings.extend(file_warnings)
+
+        subject = self._git('log', '-1', '--format=%s', commit).decode('utf-8').strip()
+        return ReplayState(commit, subject, outputs, warnings)
+
+    @staticmethod
+    def _transform(mapping: SyncMapping, data: bytes, name: str) -> Tuple[str, List[str]]:
+        collector = _WarningCollector()
+        transform_logger = logging.getLogger(ContentTransformer.__module__)
+        transform_logger.addHandler(collector)
+        try:
+            content = data.decode('utf-8')
+            transform_fn = mapping.transform_fn()
+            if transform_fn:
+                content = transform_fn(content, name)
+        finally:
+            transform_logger.removeHandler(collector)
+        return content, collector.messages
+
+    def replay(self, commits: List[str]) -> Iterator[ReplayState]:
+        for commit in commits:
+            yield self.state(commit)
+
+    def changes(self, commits: List[str]) -> Iterator[CommitChange]:
+        """What each commit after the first changed in the transformed output."""
+        previous: Optional[ReplayState] = None
+        for state in self.replay(commits):
+            if previous is not None:
+                yield diff_states(previous, state)
+            previous = state
+
+
+def diff_states(old: ReplayState, new: ReplayState) -> CommitChange:
+    seen = set(old.warnings)
+    return CommitChange(
+        state=new,
+        added=sorted(set(new.outputs) - set(old.outputs)),
+        modified=sorted(p for p in set(new.outputs) & set(old.outputs)
+                        if new.outputs[p] != old.outputs[p]),
+        removed=sorted(set(old.outputs) - set(new.outputs)),
+        new_warnings=[w for w in new.warnings if w not in seen],
+    )
+
+
+def first_change(replay: FrameworkReplay, commits: List[str], path: str) -> Optional[CommitChange]:
+    """First commit after the baseline whose transform changed path's output."""
+    for change in replay.changes(commits):
+        if path in change.added or path in change.modified or path in change.removed:
+            return change
+    return None
+
+
+def first_warning(
+    replay: FrameworkReplay,
+    commits: List[str],
+    pattern: Optional[str] = None
+) -> Optional[CommitChange]:
+    """First commit after the baseline that introduced a (matching) warning."""
+    regex = re.compile(pattern) if pattern else None
+    for change in replay.changes(commits):
+        if any(regex is None or regex.search(w) for w in change.new_warnings):
+            return change
+    return None
+
+
+def bisect(
+    replay: FrameworkReplay,
+    commits: List[str],
+    is_bad: Callable[[ReplayState], bool]
+) -> Tuple[ReplayState, int]:
+    """
+    First commit for which is_bad holds, assuming it holds from there on.
+
+    Returns:
+        (first bad state, number of commits tested)
+
+    Raises:
+        ValueError: if the first commit is already bad or the last is good
+    """
+    tested = 0
+
+    def check(index: int) -> Tuple[ReplayState, bool]:
+        nonlocal tested
+        tested += 1
+        state = replay.state(commits[index])
+        return state, is_bad(state)
+
+    _, bad = check(0)
+    if bad:
+        raise ValueError(f"Predicate already holds at the good commit {commits[0][:8]}")
+    last_state, bad = check(len(commits) - 1)
+    if not bad:
+        raise ValueError(f"Predicate does not hold at the bad commit {commits[-1][:8]}")
+
+    good, bad_index, bad_state = 0, len(commits) - 1, last_state
+    while bad_index - good > 1:
+        middle = (good + bad_index) // 2
+        state, is_bad_here = check(middle)
+        if is_bad_here:
+            bad_index, bad_state = middle, state
+        else:
+            good = middle
+    return bad_state, tested
+
+
+def materialize(state: ReplayState, root: Path) -> None:
+    """Write a state's outputs under root."""
+    for path, content in state.outputs.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding='utf-8')
+
+
+def exec_predicate(command: str) -> Callable[[ReplayState], bool]:
+    """Bad when command exits non-zero inside the materialized output tree."""
+    def is_bad(state: ReplayState) -> bool:
+        root = Path(tempfile.mkdtemp(prefix='superclaude_replay_'))
+        try:
+            materialize(state, root)
+            return subprocess.run(command, shell=True, cwd=root).returncode != 0
+        finally:
+            shutil.rmtree(root)
+    return is_bad
+
+
+def make_predicate(
+    contains: Optional[Tuple[str, str]] = None,
+    lacks: Optional[Tuple[str, str]] = None,
+    warning: Optional[str] = None,
+    exec_command: Optional[str] = None
+) -> Callable[[ReplayState], bool]:
+    """Bisect predicate from the CLI options (exactly one is given)."""
+    if contains:
+        path, text = contains
+        return lambda state: text in state.outputs.get(path, '')
+    if lacks:
+        path, text = lacks
+        return lambda state: text not in state.outputs.get(path, '')
+    if warning:
+        regex = re.compile(warning)
+        return lambda state: any(regex.search(w) for w in state.warnings)
+    return exec_predicate(exec_command)
+
+
+def _open_repo(location: str) -> Tuple[Path, Optional[str]]:
+    """A local repository path, or a bare clone of a URL (with its temp dir)."""
+    if Path(location).is_dir():
+        return Path(location), None
+    temp_dir = tempfile.mkdtemp(prefix='superclaude_replay_')
+    logger.info(f"📥 Cloning {location} (bare, full history)")
+    subprocess.run(
+        ['git', 'clone', '--bare', '--quiet', location, str(Path(temp_dir) / 'framework.git')],
+        check=True, capture_output=True
+    )
+    return Path(temp_dir) / 'framework.git', temp_dir
+
+
+def _describe(change: CommitChange) -> str:
+    lines = [f"{change.state.commit[:8]} {change.state.subject}"]
+    for label, paths in (('+', change.added), ('~', change.modified), ('-', change.removed)):
+        lines.extend(f"    {label} {p}" for p in paths)
+    lines.extend(f"    ⚠️  {w}" for w in change.new_warnings)
+    return '\n'.join(lines)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Replay sync transforms across Framework history and bisect regressions'
+    )
+    parser.add_argument(
+        '--framework-repo',
+        default='https://github.com/SuperClaude-Org/SuperClaude_Framework',
+        help='Framework repository path or URL'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    log_parser = subparsers.add_parser('log', help='Output changes and new warnings per commit')
+    log_parser.add_argument('range')
+    change_parser = subparsers.add_parser('first-change', help='First commit changing an output')
+    change_parser.add_argument('range')
+    change_parser.add_argument('path')
+    warning_parser = subparsers.add_parser('first-warning', help='First commit adding a warning')
+    warning_parser.add_argument('range')
+    warning_parser.add_argument('pattern', nargs='?')
+    bisect_parser = subparsers.add_parser('bisect', help='Binary search for the first bad commit')
+    bisect_parser.add_argument('good')
+    bisect_parser.add_argument('bad')
+    predicate = bisect_parser.add_mutually_exclusive_group(required=True)
+    predicate.add_argument('--contains', nargs=2, metavar=('PATH', 'TEXT'))
+    predicate.add_argument('--lacks', nargs=2, metavar=('PATH', 'TEXT'))
+    predicate.add_argument('--warning', metavar='REGEX')
+    predicate.add_argument('--exec', dest='exec_command', metavar='CMD')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    # Transform warnings are captured and reported per commit instead
+    logging.getLogger(ContentTransformer.__module__).propagate = False
+
+    repo, temp_dir = _open_repo(args.framework_repo)
+    try:
+        replay = FrameworkReplay(repo)
+        if args.command == 'log':
+            for change in replay.changes(replay.commits(args.range)):
+                if not change.empty:
+                    print(_describe(change))
+        elif args.command == 'first-change':
+            change = first_change(replay, replay.commits(args.range), args.path)
+            if change is None:
+                logger.info(f"✅ {args.path} unchanged across {args.range}")
+                return 1
+            print(_describe(change))
+        elif args.command == 'first-warning':
+            change = first_warning(replay, replay.commits(args.range), args.pattern)
+            if change is None:
+                logger.info(f"✅ No new warnings across {args.range}")
+                return 1
+            print(_describe(change))
+        elif args.command == 'bisect':
+            is_bad = make_predicate(args.contains, args.lacks, args.warning, args.exec_command)
+            commits = replay.commits(f"{args.good}..{args.bad}")
+            state, tested = bisect(replay, commits, is_bad)
+            print(f"{state.commit} is the first bad commit\n    {state.subject}")
+            logger.info(f"🔎 {tested} of {len(commits)} commits tested")
+        logger.info(f"♻️  {replay.transforms} file(s) transformed, {replay.reused} reused")
+    except (ValueError, subprocess.CalledProcessError) as e:
+        logger.error(f"❌ {e}")
+        return 1
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Frontmatter Parser & Batch Editor
+
+Shared YAML-frontmatter handling for the sync and maintenance scripts.  The
+header is parsed once into a lightweight line-based structure that records
+its span in the file; edits re-render only the header and splice it back,
+so the markdown body is never rescanned or rewritten.
+
+Only top-level `key: value` lines are interpreted.  Everything else (nested
+mappings, list items, comments) is kept verbatim and travels with the key
+line above it.
+
+Example:
+    fm = parse(content)
+    if fm and fm.get('name') == 'backend-architect':
+        fm.set('name', 'sc-backend-architect')
+        content = fm.apply(content)
+
+    result = edit_directory(Path('commands'), lambda fm, path: fm.remove('name'))
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+FRONTMATTER_PATTERN = re.compile(r'\A---[ \t]*\n(.*?)^---[ \t]*$', re.DOTALL | re.MULTILINE)
+KEY_PATTERN = re.compile(r'^([A-Za-z0-9_][\w-]*)\s*:(.*)$')
+
+
+class Frontmatter:
+    """Parsed YAML header of a markdown document."""
+
+    def __init__(self, text: str, span: Tuple[int, int]):
+        # span covers the header body between the --- delimiters
+        self.span = span
+        self.original = text
+        self._lines: List[str] = text.splitlines(keepends=True)
+        if self._lines and not self._lines[-1].endswith('\n'):
+            self._lines[-1] += '\n'
+
+    # ── Lookup ─────────────────────────────────────────────────────────────────
+
+    def _find(self, key: str, ignore_case: bool = False) -> Optional[int]:
+        wanted = key.lower() if ignore_case else key
+        for i, line in enumerate(self._lines):
+            match = KEY_PATTERN.match(line)
+            if match:
+                found = match.group(1).lower() if ignore_case else match.group(1)
+                if found == wanted:
+                    return i
+        return None
+
+    def _extent(self, index: int) -> int:
+        """Index one past the last continuation line of the key at index."""
+        end = index + 1
+        while end < len(self._lines) and self._lines[end][:1] in (' ', '\t', '-'):
+            end += 1
+        return end
+
+    def keys(self) -> List[str]:
+        return [m.group(1) for m in map(KEY_PATTERN.match, self._lines) if m]
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) is not None
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Scalar value of a top-level key, with surrounding quotes removed."""
+        index = self._find(key)
+        if index is None:
+            return default
+        value = KEY_PATTERN.match(self._lines[index]).group(2).strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            value = value[1:-1]
+        return value
+
+    def get_list(self, key: str) -> List[str]:
+        """Items of a flow-style list value such as `personas: [a, "b"]`."""
+        value = self.get(key)
+        if not value or not (value.startswith('[') and value.endswith(']')):
+            return []
+        items = (item.strip().strip('"\'') for item in value[1:-1].split(','))
+        return [item for item in items if item]
+
+    # ── Editing ────────────────────────────────────────────────────────────────
+
+    def set(self, key: str, value: str) -> None:
+        """Replace a key's line (dropping nested lines) or append the key."""
+        line = f"{key}: {value}\n"
+        index = self._find(key)
+        if index is None:
+            self._lines.append(line)
+        else:
+            self._lines[index:self._extent(index)] = [line]
+
+    def remove(self, key: str, ignore_case: bool = False) -> bool:
+        """Remove every occurrence of a key. Returns True if any was removed."""
+        removed = False
+        index = self._find(key, ignore_case)
+        while index is not None:
+            del self._lines[index:self._extent(index)]
+            removed = True
+            index = self._find(key, ignore_case)
+        return removed
+
+    def render(self) -> str:
+        return ''.join(self._lines)
+
+    @property
+    def modified(self) -> bool:
+        return self.render() != self.original
+
+    def apply(self, content: str) -> str:
+        """Splice the (possibly edited) header back into the document it came from."""
+        if not self.modified:
+            return content
+        start, end = self.span
+        return content[:start] + self.render() + content[end:]
+
+    def byte_span(self, content: str) -> Tuple[int, int]:
+        """UTF-8 byte offsets of the header body within content."""
+        start = len(content[:self.span[0]].encode('utf-8'))
+        return start, start + len(content[self.span[0]:self.span[1]].encode('utf-8'))
+
+
+def parse(content: str) -> Optional[Frontmatter]:
+    """Parse the frontmatter at the start of content, or None if there is none."""
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return None
+    return Frontmatter(match.group(1), match.span(1))
+
+
+# ── Batch editing ──────────────────────────────────────────────────────────────
+
+EditFn = Callable[[Frontmatter, Path], object]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch frontmatter edit."""
+    modified: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    no_frontmatter: List[Path] = field(default_factory=list)
+    errors: Dict[Path, str] = field(default_factory=dict)
+
+    @property
+    def processed(self) -> int:
+        return (len(self.modified) + len(self.unchanged)
+                + len(self.no_frontmatter) + len(self.errors))
+
+
+def edit_file(path: Path, edit_fn: EditFn, dry_run: bool = False) -> str:
+    """
+    Apply edit_fn to one file's frontmatter and write it back only if it changed.
+
+    Returns:
+        'modified', 'unchanged' or 'no_frontmatter'
+    """
+    content = path.read_text(encoding='utf-8')
+    fm = parse(content)
+    if fm is None:
+        return 'no_frontmatter'
+    edit_fn(fm, path)
+    if not fm.modified:
+        return 'unchanged'
+    if not dry_run:
+        path.write_text(fm.apply(content), encoding='utf-8')
+    return 'modified'
+
+
+def edit_directory(
+    directory: Path,
+    edit_fn: EditFn,
+    pattern: str = '*.md',
+    workers: Optional[int] = None,
+    dry_run: bool = False
+) -> BatchResult:
+    """
+    Apply edit_fn to the frontmatter of every matching file, in parallel.
+
+    Files whose frontmatter is unchanged are not rewritten.  Per-file
+    exceptions are collected in BatchResult.errors instead of aborting the batch.
+    """
+    files = sorted(directory.glob(pattern))
+    result = BatchResult()
+
+    def run(path: Path) -> Tuple[Path, str, Optional[str]]:
+        try:
+            return path, edit_file(path, edit_fn, dry_run), None
+        except Exception as e:
+            return path, 'error', str(e)
+
+    max_workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for path, status, error in pool.map(run, files):
+            if status == 'error':
+                result.errors[path] = error
+            else:
+                getattr(result, status).append(path)
+    return result
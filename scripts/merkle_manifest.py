@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Merkle Manifest
+
+Merkle tree over the Plugin tree, covering both the synced directories and
+PROTECTED_PATHS.  A file node is the SHA-256 of its content; a directory
+node is the SHA-256 of its children's (type, hash, name) lines, so the root
+hash fingerprints the whole install.
+
+Because every directory hash summarizes its subtree:
+- comparing two manifests only descends into directories whose hashes
+  differ, finding the changed files in O(changes · depth)
+- re-verifying after a change rehashes only the touched files: nodes
+  remember the stat (size, mtime, ctime) they were hashed from, and a file
+  whose stat is unchanged keeps its hash; untouched subtrees are reused
+  as-is when the touched paths are known
+
+The sync writes the manifest to .claude-plugin/merkle-manifest.json; it
+holds content hashes and sizes only (no timestamps), so it is stable across
+checkouts and can be checked offline against any copy of the Plugin.
+Paths the sync commit does not include (UNCOMMITTED_PATHS) are left out.
+
+Usage:
+    python scripts/merkle_manifest.py [OPTIONS] COMMAND
+
+Commands:
+    build                   Write the manifest for the Plugin tree
+    verify [PATH ...]       Check the tree against the manifest
+                            (only PATHs, if given, are rehashed)
+    compare A B             Files differing between two manifests or trees
+    show [PATH]             Print node hashes under PATH (default: root)
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --manifest PATH         Manifest file (default: .claude-plugin/merkle-manifest.json)
+"""
+
+import os
+import sys
+import argparse
+import hashlib
+import json
+import stat
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_PATH = Path('.claude-plugin') / 'merkle-manifest.json'
+
+# Never part of the tree: VCS metadata, caches and the sync's scratch state
+EXCLUDED_NAMES = frozenset({
+    '.git', '__pycache__', '.pytest_cache', '.sync-cache', '.sync-checkpoint.jsonl',
+})
+EXCLUDED_SUFFIXES = ('.staging', '.previous', '.trash')
+
+# In scope but never committed alongside the manifest: backups/ grows on
+# every sync and stays out of git, and the sync workflow writes the
+# Framework commit marker after the manifest.  Leaving them out keeps the
+# manifest verifiable against a checkout of the sync commit.
+UNCOMMITTED_PATHS = ('backups', 'docs/.framework-sync-commit')
+
+
+@dataclass
+class Node:
+    """A file ('blob'), symlink ('link') or directory ('tree')."""
+    type: str
+    hash: str
+    size: int = 0
+    children: List[str] = field(default_factory=list)
+    # (size, mtime_ns, ctime_ns) the hash was computed from; in memory only
+    stat: Optional[Tuple[int, int, int]] = None
+
+
+@dataclass
+class ManifestDiff:
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        return not (self.added or self.modified or self.removed)
+
+
+def _join(parent: str, name: str) -> str:
+    return f"{parent}/{name}" if parent else name
+
+
+def _tree_hash(children: Iterable[Tuple[str, Node]]) -> str:
+    digest = hashlib.sha256(b'tree\0')
+    for name, node in children:
+        digest.update(f"{node.type} {node.hash} {name}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _blob_hash(path: Path) -> str:
+    digest = hashlib.sha256(b'blob\0')
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MerkleManifest:
+    """Merkle tree of a set of top-level paths (the scope) under a root."""
+
+    def __init__(self, nodes: Dict[str, Node], scope: List[str], exclude: Iterable[str] = ()):
+        self.nodes = nodes
+        self.scope = scope
+        self.exclude = frozenset(exclude)
+
+    @property
+    def root_hash(self) -> str:
+        return self.nodes[''].hash
+
+    @property
+    def file_count(self) -> int:
+        return sum(1 for node in self.nodes.values() if node.type != 'tree')
+
+    # ── Building ───────────────────────────────────────────────────────────────
+
+    @classmethod
+    def build(
+        cls,
+        root: Path,
+        scope: Iterable[str],
+        previous: Optional['MerkleManifest'] = None,
+        exclude: Iterable[str] = ()
+    ) -> 'MerkleManifest':
+        """
+        Hash the scope under root.
+
+        Files whose stat matches their node in previous keep that node's
+        hash instead of being read again.
+        """
+        scope = sorted({entry.rstrip('/') for entry in scope})
+        manifest = cls({}, scope, exclude)
+        reuse = previous.nodes if previous else {}
+        children = []
+        for entry in scope:
+            node = manifest._hash_path(root, entry, reuse)
+            if node is not None:
+                children.append((entry, node))
+        manifest.nodes[''] = Node('tree', _tree_hash(children), children=[n for n, _ in children])
+        return manifest
+
+    def _excluded(self, rel: str, name: str) -> bool:
+        return name in EXCLUDED_NAMES or name.endswith(EXCLUDED_SUFFIXES) or rel in self.exclude
+
+    def _hash_path(self, root: Path, rel: str, reuse: Dict[str, Node]) -> Optional[Node]:
+        """Hash rel (file or directory) into self.nodes; None if absent or excluded."""
+        path = root / rel
+        try:
+            info = path.lstat()
+        except FileNotFoundError:
+            return None
+        if self._excluded(rel, path.name):
+            return None
+
+        if stat.S_ISDIR(info.st_mode):
+            children = []
+            for name in sorted(os.listdir(path)):
+                child = self._hash_path(root, _join(rel, name), reuse)
+                if child is not None:
+                    children.append((name, child))
+            node = Node('tree', _tree_hash(children), children=[n for n, _ in children])
+        else:
+            key = (info.st_size, info.st_mtime_ns, info.st_ctime_ns)
+            known = reuse.get(rel)
+            if known is not None and known.type != 'tree' and known.stat == key:
+                node = Node(known.type, known.hash, known.size, stat=key)
+            elif stat.S_ISLNK(info.st_mode):
+                target = os.readlink(path).encode('utf-8')
+                node = Node('link', hashlib.sha256(b'link\0' + target).hexdigest(), len(target), stat=key)
+            else:
+                node = Node('blob', _blob_hash(path), info.st_size, stat=key)
+        self.nodes[rel] = node
+        return node
+
+    def update(self, root: Path, paths: Iterable[str]) -> 'MerkleManifest':
+        """
+        New manifest with only paths (and their subtrees) rehashed; every
+        other node is taken as-is, then ancestors of the paths are rehashed.
+        """
+        touched = sorted({p.strip('/') for p in paths if p.strip('/')})
+        updated = MerkleManifest(dict(self.nodes), self.scope, self.exclude)
+        for rel in touched:
+            top = rel.split('/', 1)[0]
+            if top not in self.scope:
+                continue
+            for stale in list(updated._subtree(rel)):
+                del updated.nodes[stale]
+            updated._hash_path(root, rel, {})
+            updated._relink(rel)
+        return updated
+
+    def _relink(self, rel: str) -> None:
+        """After rel changed, fix each ancestor's child list and hash."""
+        while True:
+            parent, _, name = rel.rpartition('/')
+            node = self.nodes.get(parent)
+            # Copy rather than mutate: the nodes may be shared with the manifest updated from
+            node = Node('tree', '', children=list(node.children) if node else [])
+            self.nodes[parent] = node
+            names = set(node.children)
+            if rel in self.nodes:
+                names.add(name)
+            else:
+                names.discard(name)
+            node.children = sorted(names)
+            node.hash = _tree_hash((n, self.nodes[_join(parent, n)]) for n in node.children)
+            if parent == '':
+                return
+            rel = parent
+
+    # ── Queries ────────────────────────────────────────────────────────────────
+
+    def _subtree(self, rel: str) -> Iterator[str]:
+        node = self.nodes.get(rel)
+        if node is None:
+            return
+        yield rel
+        for name in node.children:
+            yield from self._subtree(_join(rel, name))
+
+    def files_under(self, rel: str) -> List[str]:
+        return [p for p in self._subtree(rel) if self.nodes[p].type != 'tree']
+
+    def verify(self, root: Path, paths: Optional[Iterable[str]] = None) -> ManifestDiff:
+        """
+        Differences between the manifest and the tree on disk.
+
+        With paths, only those are rehashed.  Otherwise every file is
+        visited, but files whose stat matches the manifest are not reread
+        (a manifest loaded from disk has no stats, so everything is).
+        """
+        if paths is not None:
+            current = self.update(root, paths)
+        else:
+            current = MerkleManifest.build(root, self.scope, previous=self, exclude=self.exclude)
+        return compare(self, current)
+
+    # ── Persistence ────────────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        nodes = {}
+        for rel in sorted(self.nodes):
+            node = self.nodes[rel]
+            nodes[rel] = [node.type, node.hash, node.size] if node.type != 'tree' else [node.type, node.hash]
+        return {
+            "version": MANIFEST_VERSION,
+            "root": self.root_hash,
+            "scope": self.scope,
+            "exclude": sorted(self.exclude),
+            "nodes": nodes,
+        }
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=1) + '\n', encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: Path) -> 'MerkleManifest':
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version: {data.get('version')}")
+        nodes = {rel: Node(*fields) for rel, fields in data['nodes'].items()}
+        # Child lists are implied by the paths
+        for rel in sorted(nodes, key=len, reverse=True):
+            if rel:
+                parent, _, name = rel.rpartition('/')
+                nodes[parent].children.append(name)
+        # Recompute directory hashes bottom-up so an edited node cannot go unnoticed
+        for rel in sorted(nodes, key=lambda r: r.count('/') if r else -1, reverse=True):
+            node = nodes[rel]
+            node.children.sort()
+            if node.type == 'tree':
+                expected = _tree_hash((n, nodes[_join(rel, n)]) for n in node.children)
+                if expected != node.hash:
+                    raise ValueError(f"Manifest node does not match its children: {rel or '.'}")
+        if nodes[''].hash != data['root']:
+            raise ValueError("Manifest root hash does not match its nodes")
+        return cls(nodes, data['scope'], data.get('exclude', []))
+
+
+def compare(old: MerkleManifest, new: MerkleManifest) -> ManifestDiff:
+    """Files added, modified and removed from old to new, skipping equal subtrees."""
+    diff = ManifestDiff()
+
+    def walk(rel: str) -> None:
+        a, b = old.nodes.get(rel), new.nodes.get(rel)
+        if a is not None and b is not None and a.type == b.type and a.hash == b.hash:
+            return
+        if a is None or b is None or (a.type == 'tree') != (b.type == 'tree'):
+            if a is not None:
+                diff.removed.extend(old.files_under(rel))
+            if b is not None:
+                diff.added.extend(new.files_under(rel))
+            return
+        if a.type != 'tree':
+            diff.modified.append(rel)
+            return
+        for name in sorted(set(a.children) | set(b.children)):
+            walk(_join(rel, name))
+
+    walk('')
+    return diff
+
+
+def default_scope() -> List[str]:
+    """Synced destinations plus protected paths plus the root plugin.json."""
+    # Imported here: sync_from_framework imports this module
+    from sync_from_framework import FrameworkSyncer
+    return sorted(
+        {m.dest.rstrip('/') for m in FrameworkSyncer.SYNC_MAPPINGS}
+        | {p.rstrip('/') for p in FrameworkSyncer.PROTECTED_PATHS}
+        | {'plugin.json'}
+    )
+
+
+def build_manifest(
+    plugin_root: Path,
+    scope: Iterable[str],
+    manifest_path: Optional[Path] = None,
+    previous: Optional[MerkleManifest] = None
+) -> MerkleManifest:
+    """Build and save the manifest of a Plugin tree (excluding the manifest itself)."""
+    manifest_path = manifest_path or plugin_root / DEFAULT_MANIFEST_PATH
+    exclude = list(UNCOMMITTED_PATHS)
+    if plugin_root in manifest_path.parents:
+        exclude.append(manifest_path.relative_to(plugin_root).as_posix())
+    manifest = MerkleManifest.build(plugin_root, scope, previous, exclude)
+    manifest.save(manifest_path)
+    logger.info(f"🌳 Merkle manifest: {manifest.file_count} files, root {manifest.root_hash[:12]}")
+    return manifest
+
+
+def _load_or_build(location: Path) -> MerkleManifest:
+    if location.is_dir():
+        return MerkleManifest.build(
+            location, default_scope(), exclude=[DEFAULT_MANIFEST_PATH.as_posix(), *UNCOMMITTED_PATHS]
+        )
+    return MerkleManifest.load(location)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Build, verify and compare Merkle manifests of the Plugin tree'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument('--manifest', type=Path, help='Manifest file path')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='Write the manifest')
+    verify_parser = subparsers.add_parser('verify', help='Check the tree against the manifest')
+    verify_parser.add_argument('paths', nargs='*', help='Only rehash these paths')
+    compare_parser = subparsers.add_parser('compare', help='Diff two manifests or trees')
+    compare_parser.add_argument('old', type=Path)
+    compare_parser.add_argument('new', type=Path)
+    show_parser = subparsers.add_parser('show', help='Print node hashes')
+    show_parser.add_argument('path', nargs='?', default='')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    manifest_path = args.manifest or args.plugin_root / DEFAULT_MANIFEST_PATH
+    try:
+        if args.command == 'build':
+            build_manifest(args.plugin_root, default_scope(), manifest_path)
+            return 0
+        if args.command == 'compare':
+            diff = compare(_load_or_build(args.old), _load_or_build(args.new))
+        else:
+            manifest = MerkleManifest.load(manifest_path)
+            if args.command == 'show':
+                for rel in manifest._subtree(args.path.strip('/')):
+                    node = manifest.nodes[rel]
+                    print(f"{node.hash[:16]}  {node.type:<4}  {rel or '.'}")
+                return 0
+            diff = manifest.verify(args.plugin_root, args.paths or None)
+    except (OSError, ValueError) as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    for label, paths in (('+', diff.added), ('~', diff.modified), ('-', diff.removed)):
+        for path in paths:
+            print(f"{label} {path}")
+    if diff.clean:
+        logger.info("✅ Trees match")
+        return 0
+    logger.info(f"❌ {len(diff.added)} added, {len(diff.modified)} modified, {len(diff.removed)} removed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
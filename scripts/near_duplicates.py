@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Near-Duplicate Analysis
+
+Lists near-duplicate markdown files and sections across the content corpus
+(commands/, agents/, modes/, core/, including nested directories), with an
+estimate of the tokens each pair spends on repeated text.
+
+Every file, and every heading section of at least MIN_SECTION_WORDS words,
+is shingled into hashed word 5-grams and sketched with the one-permutation
+MinHash from similarity.py.  LSH banding picks candidate pairs, so the work
+grows with the corpus plus the number of candidates rather than with
+every pair.  Candidates are then checked against the exact Jaccard
+similarity of their shingle sets.  Files and sections are matched
+separately.  Section pairs inside a file pair that is already reported are
+left out, and so are pairs of sections from the same file.
+
+Redundant tokens for a pair are the tokens of the smaller unit times the
+fraction of its shingles that also occur in the larger one.
+
+Usage:
+    python scripts/near_duplicates.py [OPTIONS]
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --threshold J           Minimum Jaccard similarity (default: 0.5)
+    --no-sections           Compare whole files only
+    --estimator NAME        Token estimator (bytes, chars, words, pieces)
+    --json                  Print the report as JSON
+"""
+
+import sys
+import argparse
+import json
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, List, Set, Tuple
+import logging
+
+from corpus_index import CorpusIndex
+from search_index import split_sections
+from similarity import LSHIndex, MinHasher, WORD_PATTERN, bands_for_threshold, shingles
+from token_estimator import ESTIMATORS, DEFAULT_ESTIMATOR, get_estimator
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 5
+SIGNATURE_BINS = 128
+DEFAULT_THRESHOLD = 0.5
+
+# Sections shorter than this are headings with a line or two of text;
+# matching them only reports shared boilerplate like "## Examples"
+MIN_SECTION_WORDS = 30
+
+
+@dataclass
+class Unit:
+    """A file, or one heading section of a file, compared as a whole."""
+    path: str
+    anchor: str
+    tokens: int
+    shingles: Set[int]
+
+    @property
+    def label(self) -> str:
+        return f"{self.path}#{self.anchor}" if self.anchor else self.path
+
+
+@dataclass
+class DuplicatePair:
+    a: str
+    b: str
+    jaccard: float
+    estimated: float
+    redundant_tokens: int
+
+
+def collect_units(
+    plugin_root: Path,
+    estimator: Callable[[str], int],
+    sections: bool = True
+) -> Tuple[List[Unit], List[Unit]]:
+    """File units and section units of every corpus markdown file (READMEs excluded)."""
+    files: List[Unit] = []
+    parts: List[Unit] = []
+    for _, path in CorpusIndex.corpus_files(plugin_root):
+        rel = path.relative_to(plugin_root).as_posix()
+        text = path.read_text(encoding='utf-8')
+        files.append(Unit(rel, '', estimator(text), shingles(text, SHINGLE_SIZE)))
+        if not sections:
+            continue
+        for anchor, body in split_sections(text):
+            if anchor and len(WORD_PATTERN.findall(body)) >= MIN_SECTION_WORDS:
+                parts.append(Unit(rel, anchor, estimator(body), shingles(body, SHINGLE_SIZE)))
+    return files, parts
+
+
+def find_near_duplicates(
+    units: List[Unit],
+    threshold: float = DEFAULT_THRESHOLD,
+    num_bins: int = SIGNATURE_BINS
+) -> Tuple[List[DuplicatePair], int]:
+    """
+    Pairs of units from different files at or above threshold.
+
+    Returns:
+        Pairs by redundant tokens (largest first) and the number of LSH
+        candidates checked
+    """
+    hasher = MinHasher(num_bins)
+    index = LSHIndex(num_bins, bands_for_threshold(num_bins, threshold))
+    for i, unit in enumerate(units):
+        if unit.shingles:
+            index.add(i, hasher.signature(unit.shingles))
+
+    candidates = index.candidate_pairs()
+    pairs = []
+    for i, j in candidates:
+        a, b = units[i], units[j]
+        if a.path == b.path:
+            continue
+        common = len(a.shingles & b.shingles)
+        jaccard = common / len(a.shingles | b.shingles)
+        if jaccard < threshold:
+            continue
+        smaller = a if len(a.shingles) <= len(b.shingles) else b
+        pairs.append(DuplicatePair(
+            a.label, b.label, round(jaccard, 4),
+            MinHasher.similarity(index.signatures[i], index.signatures[j]),
+            round(smaller.tokens * common / len(smaller.shingles)),
+        ))
+    pairs.sort(key=lambda p: (-p.redundant_tokens, p.a, p.b))
+    return pairs, len(candidates)
+
+
+def analyze(
+    plugin_root: Path,
+    threshold: float = DEFAULT_THRESHOLD,
+    sections: bool = True,
+    estimator_name: str = DEFAULT_ESTIMATOR
+) -> dict:
+    """Near-duplicate report for the corpus under plugin_root."""
+    start = time.perf_counter()
+    files, parts = collect_units(plugin_root, get_estimator(estimator_name), sections)
+
+    file_pairs, file_candidates = find_near_duplicates(files, threshold)
+    section_pairs, section_candidates = find_near_duplicates(parts, threshold)
+    reported = {(p.a, p.b) for p in file_pairs}
+    section_pairs = [
+        p for p in section_pairs
+        if (p.a.split('#')[0], p.b.split('#')[0]) not in reported
+        and (p.b.split('#')[0], p.a.split('#')[0]) not in reported
+    ]
+
+    return {
+        "threshold": threshold,
+        "estimator": estimator_name,
+        "files": len(files),
+        "sections": len(parts),
+        "candidates": file_candidates + section_candidates,
+        "possible_pairs": (len(files) * (len(files) - 1) + len(parts) * (len(parts) - 1)) // 2,
+        "redundant_tokens": sum(p.redundant_tokens for p in file_pairs + section_pairs),
+        "file_pairs": [asdict(p) for p in file_pairs],
+        "section_pairs": [asdict(p) for p in section_pairs],
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for title, key in (("FILES", "file_pairs"), ("SECTIONS", "section_pairs")):
+        if not report[key]:
+            continue
+        lines.append(f"{title}")
+        lines.append(f"{'jaccard':>8} {'tokens':>7}  pair")
+        for p in report[key]:
+            lines.append(f"{p['jaccard']:8.2f} {p['redundant_tokens']:7}  {p['a']}")
+            lines.append(f"{'':17}{p['b']}")
+        lines.append("")
+    return '\n'.join(lines)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='List near-duplicate files and sections in the corpus'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Minimum Jaccard similarity')
+    parser.add_argument('--no-sections', action='store_true', help='Compare whole files only')
+    parser.add_argument('--estimator', choices=sorted(ESTIMATORS), default=DEFAULT_ESTIMATOR,
+                        help='Token estimator')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if not 0 < args.threshold <= 1:
+        logger.error("❌ --threshold must be in (0, 1]")
+        return 1
+
+    report = analyze(args.plugin_root, args.threshold, not args.no_sections, args.estimator)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(format_report(report), end='')
+    logger.info(
+        f"🔍 {len(report['file_pairs'])} file and {len(report['section_pairs'])} section pairs "
+        f"≥ {report['threshold']}, ~{report['redundant_tokens']:,} redundant tokens "
+        f"({report['candidates']} candidates of {report['possible_pairs']:,} pairs, "
+        f"{report['seconds'] * 1000:.0f} ms)"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Transform Pattern Benchmark
+
+Adversarial-input benchmark for the regular expressions that run over
+arbitrary upstream Framework text: every `*_PATTERN` on ContentTransformer,
+the frontmatter parser patterns used by transform_agent, and the corpus
+index reference pattern.
+
+For each pattern, each generator builds a degenerate document (megabytes
+of slashes, unbroken word runs, heading markers without text, unclosed
+links, seeded random soup of the characters the patterns care about) at
+two sizes.  The pattern is run over both with the same operation the sync
+uses (sub or finditer), and the time ratio is compared with the size
+ratio.  Linear scanning keeps the two ratios close; quadratic
+backtracking makes the time ratio roughly the square of the size ratio.
+Any pattern above MAX_SLOWDOWN × the size ratio is reported as
+super-linear.
+
+The timing ratio needs a quiet machine, so the unit suite only runs
+`over_budget`: one pass of every pattern over every generator at
+BUDGET_SIZE characters, against an absolute BUDGET_SECONDS.  Linear
+patterns finish in milliseconds; a quadratic one needs seconds.
+
+Usage:
+    python scripts/pattern_benchmark.py [OPTIONS]
+
+Options:
+    --size N                Smaller document size in characters (default: 131072)
+    --scale N               Larger document = size × scale (default: 8)
+    --repeats N             Runs per measurement, best time kept (default: 3)
+"""
+
+import sys
+import argparse
+import random
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+import logging
+
+import frontmatter
+from corpus_index import CorpusIndex
+from sync_from_framework import ContentTransformer
+
+logger = logging.getLogger(__name__)
+
+# Allowed time growth beyond the size growth before a pattern is flagged.
+# Linear patterns land near 1×; quadratic ones near `scale`×.
+MAX_SLOWDOWN = 3.0
+
+# Single-pass budget for the unit suite: linear patterns take ~30 ms on
+# 64 KB of adversarial input, a backtracking `\w+x` takes ~10 s
+BUDGET_SIZE = 65536
+BUDGET_SECONDS = 1.0
+
+# Characters the patterns treat specially, for the random soup generator
+FUZZ_ALPHABET = "/#[]():`@-_ \n\taZ9MODE_sc:.md---"
+
+
+def _soup(n: int, seed: int = 42) -> str:
+    rng = random.Random(seed)
+    return ''.join(rng.choice(FUZZ_ALPHABET) for _ in range(n))
+
+
+def _repeat(unit: str) -> Callable[[int], str]:
+    return lambda n: (unit * (n // len(unit) + 1))[:n]
+
+
+# name → document generator of (approximately) n characters
+GENERATORS: Dict[str, Callable[[int], str]] = {
+    "slashes": _repeat("/"),
+    "slash-word-run": lambda n: "/" + "a" * (n - 2) + "!",
+    "word-run": _repeat("a"),
+    "slash-words": _repeat("/a"),
+    "spaced-slash-words": _repeat(" /ab!"),
+    "hash-run": _repeat("#"),
+    "hash-space-run": _repeat("# "),
+    "heading-lines": _repeat("### \n"),
+    "unclosed-links": _repeat("[/"),
+    "unclosed-link-word": lambda n: "[/" + "a" * (n - 2),
+    "namespace-chain": lambda n: "/sc:" + "sc:" * (n // 3),
+    "upper-run": lambda n: "A" * n,
+    "mode-run": lambda n: "MODE_" + "a" * n,
+    "agent-hyphens": _repeat("sc-a-"),
+    "frontmatter-open": lambda n: "---\n" + "name: x\n" * (n // 8),
+    "key-no-colon": lambda n: "---\n" + "a" * n + "\n---\n",
+    "newlines": _repeat("\n"),
+    "fuzz": _soup,
+}
+
+
+def transform_patterns() -> Dict[str, Tuple[re.Pattern, str]]:
+    """Every pattern run over upstream text, with the operation used on it."""
+    patterns: Dict[str, Tuple[re.Pattern, str]] = {}
+    for attr in sorted(vars(ContentTransformer)):
+        value = getattr(ContentTransformer, attr)
+        if attr.endswith('_PATTERN') and isinstance(value, re.Pattern):
+            patterns[f"ContentTransformer.{attr}"] = (value, 'sub')
+    patterns["frontmatter.FRONTMATTER_PATTERN"] = (frontmatter.FRONTMATTER_PATTERN, 'match')
+    patterns["frontmatter.KEY_PATTERN"] = (frontmatter.KEY_PATTERN, 'lines')
+    patterns["CorpusIndex.REFERENCE_PATTERN"] = (CorpusIndex.REFERENCE_PATTERN, 'finditer')
+    patterns["CorpusIndex.REFERENCE_HINT"] = (CorpusIndex.REFERENCE_HINT, 'finditer')
+    return patterns
+
+
+def _runner(pattern: re.Pattern, operation: str) -> Callable[[str], None]:
+    if operation == 'sub':
+        return lambda text: pattern.sub('', text)
+    if operation == 'match':
+        return lambda text: pattern.match(text)
+    if operation == 'lines':
+        return lambda text: [pattern.match(line) for line in text.splitlines()]
+    return lambda text: list(pattern.finditer(text))
+
+
+@dataclass
+class Measurement:
+    pattern: str
+    generator: str
+    small_seconds: float
+    large_seconds: float
+    scale: int
+
+    @property
+    def slowdown(self) -> float:
+        """Time growth relative to size growth (≈1 for linear)."""
+        if self.small_seconds <= 0:
+            return 0.0
+        return (self.large_seconds / self.small_seconds) / self.scale
+
+    @property
+    def super_linear(self) -> bool:
+        return self.slowdown > MAX_SLOWDOWN
+
+
+def _best_time(run: Callable[[str], None], text: str, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(
+    name: str,
+    pattern: re.Pattern,
+    operation: str,
+    generator: str,
+    size: int,
+    scale: int,
+    repeats: int
+) -> Measurement:
+    run = _runner(pattern, operation)
+    make = GENERATORS[generator]
+    small = _best_time(run, make(size), repeats)
+    large = _best_time(run, make(size * scale), repeats)
+    return Measurement(name, generator, small, large, scale)
+
+
+def over_budget(
+    size: int = BUDGET_SIZE,
+    seconds: float = BUDGET_SECONDS,
+    patterns: Dict[str, Tuple[re.Pattern, str]] = None
+) -> List[Tuple[str, str, float]]:
+    """Pattern/generator pairs whose single pass over size characters exceeds seconds."""
+    patterns = patterns if patterns is not None else transform_patterns()
+    slow = []
+    for name, (pattern, operation) in patterns.items():
+        run = _runner(pattern, operation)
+        for generator, make in GENERATORS.items():
+            elapsed = _best_time(run, make(size), 1)
+            if elapsed > seconds:
+                slow.append((name, generator, elapsed))
+    return slow
+
+
+def run_benchmark(
+    size: int = 131072,
+    scale: int = 8,
+    repeats: int = 3,
+    patterns: Dict[str, Tuple[re.Pattern, str]] = None
+) -> List[Measurement]:
+    """Measure every pattern against every adversarial generator."""
+    patterns = patterns if patterns is not None else transform_patterns()
+    results = []
+    for name, (pattern, operation) in patterns.items():
+        for generator in GENERATORS:
+            result = measure(name, pattern, operation, generator, size, scale, repeats)
+            if result.super_linear:
+                # Re-measure once so a scheduler hiccup doesn't fail the run
+                result = measure(name, pattern, operation, generator, size, scale, repeats)
+            results.append(result)
+    return results
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Check transform patterns stay linear on adversarial input'
+    )
+    parser.add_argument('--size', type=int, default=131072, help='Smaller document size')
+    parser.add_argument('--scale', type=int, default=8, help='Size multiplier for the larger document')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per measurement')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    results = run_benchmark(args.size, args.scale, args.repeats)
+    print(f"{'pattern':<42} {'input':<20} {'small ms':>9} {'large ms':>9} {'slowdown':>8}")
+    for r in results:
+        flag = "  ❌" if r.super_linear else ""
+        print(f"{r.pattern:<42} {r.generator:<20} {r.small_seconds * 1000:9.2f} "
+              f"{r.large_seconds * 1000:9.2f} {r.slowdown:8.2f}{flag}")
+
+    failures = [r for r in results if r.super_linear]
+    if failures:
+        logger.error(f"❌ {len(failures)} super-linear pattern/input combination(s)")
+        return 1
+    logger.info(f"✅ {len(results)} pattern/input combinations scale linearly")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
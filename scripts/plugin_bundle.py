@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Plugin Bundle
+
+Packs the Plugin content directories (commands/, agents/, modes/, core/,
+plus command-bodies/ in the stubs layout) into one file, so installing,
+hashing or loading the Plugin costs one open instead of hundreds.
+
+Format (all integers little-endian):
+
+    b"SCBUNDL1"                 magic, 8 bytes
+    uint64 header_length
+    header                      UTF-8 JSON, header_length bytes
+    data                        file contents, concatenated
+
+The header lists every entry with its path, corpus kind and name, offset
+into the data section, size, SHA-256, permission bits and frontmatter, so
+any entry is one seek + one read away once the header is loaded.  Entries
+are sorted by path and the header carries no timestamps: packing the same
+tree twice gives byte-identical bundles.
+
+Usage:
+    python scripts/plugin_bundle.py [OPTIONS] COMMAND
+
+Commands:
+    pack                    Build the bundle from the Plugin tree
+    list                    Show bundle entries
+    cat NAME                Print one entry (path or name such as sc:implement)
+    unpack DEST             Recreate the tree under DEST
+    verify                  Check every entry against its SHA-256
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --bundle PATH           Bundle file (default: dist/sc-plugin.bundle)
+"""
+
+import os
+import sys
+import argparse
+import hashlib
+import json
+import stat
+import struct
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import BinaryIO, Dict, List
+import logging
+
+import frontmatter
+from command_stubs import BODIES_DIR
+from corpus_index import CorpusIndex
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SCBUNDL1"
+FORMAT_VERSION = 1
+DEFAULT_BUNDLE_PATH = Path('dist') / 'sc-plugin.bundle'
+_LENGTH = struct.Struct('<Q')
+
+
+class BundleError(RuntimeError):
+    """Raised for malformed bundles and failed verification."""
+    pass
+
+
+@dataclass
+class BundleEntry:
+    """One file stored in a bundle."""
+    path: str
+    kind: str
+    name: str
+    offset: int
+    size: int
+    sha256: str
+    mode: int
+    frontmatter: Dict[str, str] = field(default_factory=dict)
+
+
+def _collect(plugin_root: Path) -> List[tuple]:
+    """(relative path, kind, absolute path) for every file in the corpus dirs."""
+    files = []
+    # Deferred command bodies ship alongside their stubs
+    for dirname, kind in CorpusIndex.CORPUS_DIRS + [(BODIES_DIR, "command")]:
+        directory = plugin_root / dirname
+        if not directory.is_dir():
+            continue
+        for path in directory.rglob('*'):
+            if path.is_file() and not path.is_symlink():
+                files.append((path.relative_to(plugin_root).as_posix(), kind, path))
+    return sorted(files)
+
+
+def pack(plugin_root: Path, output: Path) -> List[BundleEntry]:
+    """Write a bundle of plugin_root's content directories to output."""
+    entries: List[BundleEntry] = []
+    blobs: List[bytes] = []
+    offset = 0
+    # Corpus markdown files, nested ones included, are named like the index
+    # names them; READMEs and other files keep their path as name
+    nodes = {
+        path.relative_to(plugin_root).as_posix()
+        for _, path in CorpusIndex.corpus_files(plugin_root)
+    }
+    for rel, kind, path in _collect(plugin_root):
+        data = path.read_bytes()
+        header_fields: Dict[str, str] = {}
+        name = rel
+        if rel in nodes:
+            text = data.decode('utf-8')
+            name = CorpusIndex.node_name(kind, path, text)
+            header = frontmatter.parse(text)
+            if header:
+                header_fields = {key: header.get(key) for key in header.keys()}
+        entries.append(BundleEntry(
+            path=rel,
+            kind=kind,
+            name=name,
+            offset=offset,
+            size=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            mode=stat.S_IMODE(path.stat().st_mode),
+            frontmatter=header_fields,
+        ))
+        blobs.append(data)
+        offset += len(data)
+
+    header = json.dumps(
+        {"version": FORMAT_VERSION, "entries": [asdict(e) for e in entries]},
+        ensure_ascii=False, sort_keys=True, separators=(',', ':')
+    ).encode('utf-8')
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(output.name + '.tmp')
+    with open(tmp, 'wb') as handle:
+        handle.write(MAGIC)
+        handle.write(_LENGTH.pack(len(header)))
+        handle.write(header)
+        for blob in blobs:
+            handle.write(blob)
+    os.replace(tmp, output)
+    return entries
+
+
+class BundleReader:
+    """Random-access reader; the header is loaded once on open."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._handle: BinaryIO = open(path, 'rb')
+        try:
+            magic = self._handle.read(len(MAGIC))
+            if magic != MAGIC:
+                raise BundleError(f"Not a plugin bundle: {path}")
+            (length,) = _LENGTH.unpack(self._handle.read(_LENGTH.size))
+            header = json.loads(self._handle.read(length).decode('utf-8'))
+        except (struct.error, ValueError) as e:
+            self._handle.close()
+            raise BundleError(f"Corrupt bundle header: {path}") from e
+        if header.get('version') != FORMAT_VERSION:
+            self._handle.close()
+            raise BundleError(f"Unsupported bundle version: {header.get('version')}")
+
+        self._data_start = len(MAGIC) + _LENGTH.size + length
+        self.entries: List[BundleEntry] = [BundleEntry(**e) for e in header['entries']]
+        self._by_key: Dict[str, BundleEntry] = {}
+        for entry in self.entries:
+            self._by_key[entry.path] = entry
+            self._by_key.setdefault(entry.name, entry)
+
+    def __enter__(self) -> 'BundleReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def entry(self, key: str) -> BundleEntry:
+        """Entry by path (commands/sc-build.md) or corpus name (sc:build)."""
+        try:
+            return self._by_key[key]
+        except KeyError:
+            raise BundleError(f"No such entry: {key}") from None
+
+    def read(self, key: str, verify: bool = False) -> bytes:
+        """Content of one entry: one seek, one read."""
+        entry = self.entry(key)
+        self._handle.seek(self._data_start + entry.offset)
+        data = self._handle.read(entry.size)
+        if verify and hashlib.sha256(data).hexdigest() != entry.sha256:
+            raise BundleError(f"Checksum mismatch: {entry.path}")
+        return data
+
+    def verify(self) -> List[str]:
+        """Paths whose content does not match the recorded SHA-256."""
+        bad = []
+        for entry in self.entries:
+            try:
+                self.read(entry.path, verify=True)
+            except BundleError:
+                bad.append(entry.path)
+        return bad
+
+    def unpack(self, dest: Path) -> int:
+        """Recreate every entry (content and permission bits) under dest."""
+        root = dest.resolve()
+        for entry in self.entries:
+            target = dest / entry.path
+            if root not in target.resolve().parents:
+                raise BundleError(f"Entry escapes destination: {entry.path}")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(self.read(entry.path, verify=True))
+            os.chmod(target, entry.mode)
+        return len(self.entries)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Pack the Plugin content into a single indexed bundle file'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument('--bundle', type=Path, help='Bundle file path')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('pack', help='Build the bundle')
+    subparsers.add_parser('list', help='Show bundle entries')
+    cat_parser = subparsers.add_parser('cat', help='Print one entry')
+    cat_parser.add_argument('name')
+    unpack_parser = subparsers.add_parser('unpack', help='Recreate the tree')
+    unpack_parser.add_argument('dest', type=Path)
+    subparsers.add_parser('verify', help='Check every entry against its SHA-256')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    bundle_path = args.bundle or args.plugin_root / DEFAULT_BUNDLE_PATH
+    if args.command == 'pack':
+        entries = pack(args.plugin_root, bundle_path)
+        logger.info(
+            f"📦 Packed {len(entries)} files into {bundle_path} "
+            f"({bundle_path.stat().st_size:,} bytes)"
+        )
+        return 0
+
+    try:
+        with BundleReader(bundle_path) as reader:
+            if args.command == 'list':
+                for entry in reader.entries:
+                    print(f"{entry.size:>8}  {entry.sha256[:12]}  {entry.kind:<8} {entry.name:<32} {entry.path}")
+            elif args.command == 'cat':
+                sys.stdout.buffer.write(reader.read(args.name, verify=True))
+            elif args.command == 'unpack':
+                count = reader.unpack(args.dest)
+                logger.info(f"📂 Unpacked {count} files into {args.dest}")
+            elif args.command == 'verify':
+                bad = reader.verify()
+                for path in bad:
+                    logger.error(f"❌ Checksum mismatch: {path}")
+                if bad:
+                    return 1
+                logger.info(f"✅ {len(reader.entries)} entries verified")
+    except BundleError as e:
+        logger.error(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
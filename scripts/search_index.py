@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Full-Text Search Index
+
+BM25-ranked search over commands, agents and modes, for /sc:recommend,
+/sc:select-tool, /sc:help and anything else that has to find the right
+file among dozens.  The sync builds an inverted index once and saves it as
+compact JSON; queries then touch only the posting lists of their terms.
+
+Each posting records the term frequency in a document and which of its
+sections (markdown headings) contain the term, so hits come back with the
+anchors of the matching sections.  Frontmatter name and description count
+extra (FIELD_BOOST) since they summarize the whole file.
+
+Rebuilds are incremental: documents whose SHA-256 is unchanged keep their
+postings, and only added or edited files are tokenized.
+
+Tokens are lowercase ASCII word runs; CJK runs are split into character
+bigrams so Japanese trigger phrases are searchable without a dictionary.
+
+Usage:
+    python scripts/search_index.py [OPTIONS] COMMAND
+
+Commands:
+    build                   Build or incrementally update the index
+    query TEXT              Print ranked matches for TEXT
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --index PATH            Index file (default: .claude-plugin/search-index.json)
+    --kind KIND             query: restrict to command, agent or mode (repeatable)
+    --limit N               query: number of results (default: 10)
+"""
+
+import sys
+import argparse
+import hashlib
+import json
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+import frontmatter
+from corpus_index import CorpusIndex
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_PATH = Path('.claude-plugin') / 'search-index.json'
+INDEXED_KINDS = ("command", "agent", "mode")
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+FIELD_BOOST = 3
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9_]+|[\u3040-\u30ff\u3400-\u9fff\uf900-\ufaff]+')
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; CJK runs become overlapping bigrams."""
+    tokens = []
+    for run in TOKEN_PATTERN.findall(text.lower()):
+        if run[0].isascii():
+            tokens.append(run)
+        elif len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def slugify(heading: str) -> str:
+    """GitHub-style anchor for a heading."""
+    slug = re.sub(r'[^\w\- ]', '', heading.strip().lower())
+    return slug.replace(' ', '-')
+
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """
+    Split markdown into (anchor, text) sections at headings.
+
+    The first section (anchor '') holds everything before the first
+    heading, including frontmatter.  Headings inside code fences are text.
+    """
+    sections: List[Tuple[str, List[str]]] = [('', [])]
+    in_fence = False
+    for line in text.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_PATTERN.match(line)
+        if match:
+            sections.append((slugify(match.group(2)), [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(anchor, '\n'.join(lines)) for anchor, lines in sections]
+
+
+@dataclass
+class Document:
+    """One indexed corpus file."""
+    kind: str
+    name: str
+    path: str
+    sha256: str
+    length: int
+    sections: List[str]
+
+
+@dataclass
+class SearchHit:
+    kind: str
+    name: str
+    path: str
+    score: float
+    sections: List[str] = field(default_factory=list)
+
+
+class SearchIndex:
+    """Inverted index with BM25 scoring."""
+
+    def __init__(self):
+        self.documents: List[Document] = []
+        # term → [[doc, tf, [section, ...]], ...]
+        self.postings: Dict[str, List[list]] = {}
+
+    # ── Building ───────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def corpus_files(plugin_root: Path) -> Iterable[Tuple[str, Path]]:
+        return CorpusIndex.corpus_files(plugin_root, INDEXED_KINDS)
+
+    def update(self, plugin_root: Path) -> Dict[str, int]:
+        """
+        Bring the index in line with the corpus on disk.
+
+        Returns:
+            Counts of added, updated, removed and unchanged documents
+        """
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        known = {doc.path: (i, doc) for i, doc in enumerate(self.documents)}
+        keep: Dict[int, Document] = {}
+        fresh: List[Tuple[str, Path, str, str]] = []
+
+        for kind, path in self.corpus_files(plugin_root):
+            rel = path.relative_to(plugin_root).as_posix()
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            previous = known.pop(rel, None)
+            if previous and previous[1].sha256 == digest and previous[1].kind == kind:
+                keep[previous[0]] = previous[1]
+                counts['unchanged'] += 1
+            else:
+                fresh.append((kind, path, data.decode('utf-8'), digest))
+                counts['updated' if previous else 'added'] += 1
+        counts['removed'] = len(known)
+
+        # Renumber surviving documents and drop postings of everything else
+        remap = {old: new for new, old in enumerate(sorted(keep))}
+        self.documents = [keep[old] for old in sorted(keep)]
+        postings: Dict[str, List[list]] = {}
+        for term, entries in self.postings.items():
+            kept = [[remap[e[0]], e[1], e[2]] for e in entries if e[0] in remap]
+            if kept:
+                postings[term] = kept
+        self.postings = postings
+
+        for kind, path, text, digest in fresh:
+            self._add(kind, path.relative_to(plugin_root).as_posix(), path, text, digest)
+        return counts
+
+    def _add(self, kind: str, rel: str, path: Path, text: str, digest: str) -> None:
+        doc_id = len(self.documents)
+        sections = split_sections(text)
+        term_freq: Counter = Counter()
+        term_sections: Dict[str, List[int]] = defaultdict(list)
+        for number, (_, section_text) in enumerate(sections):
+            section_terms = Counter(tokenize(section_text))
+            term_freq.update(section_terms)
+            for term in section_terms:
+                term_sections[term].append(number)
+
+        header = frontmatter.parse(text)
+        if header:
+            summary = f"{header.get('name', '')} {header.get('description', '')}"
+            for term in tokenize(summary):
+                term_freq[term] += FIELD_BOOST - 1
+
+        for term, tf in term_freq.items():
+            self.postings.setdefault(term, []).append([doc_id, tf, term_sections.get(term, [0])])
+
+        self.documents.append(Document(
+            kind=kind,
+            name=CorpusIndex.node_name(kind, path, text),
+            path=rel,
+            sha256=digest,
+            length=sum(term_freq.values()),
+            sections=[anchor for anchor, _ in sections],
+        ))
+
+    # ── Querying ───────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        kinds: Optional[Iterable[str]] = None
+    ) -> List[SearchHit]:
+        """Top documents for query by BM25, with matching section anchors."""
+        if not self.documents:
+            return []
+        wanted = set(kinds) if kinds else None
+        total = len(self.documents)
+        avgdl = sum(d.length for d in self.documents) / total
+
+        scores: Dict[int, float] = defaultdict(float)
+        section_hits: Dict[int, Counter] = defaultdict(Counter)
+        for term in set(tokenize(query)):
+            entries = self.postings.get(term)
+            if not entries:
+                continue
+            idf = math.log(1 + (total - len(entries) + 0.5) / (len(entries) + 0.5))
+            for doc_id, tf, sections in entries:
+                doc = self.documents[doc_id]
+                if wanted and doc.kind not in wanted:
+                    continue
+                norm = K1 * (1 - B + B * doc.length / avgdl)
+                scores[doc_id] += idf * tf * (K1 + 1) / (tf + norm)
+                section_hits[doc_id].update(sections)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        for doc_id, score in ranked:
+            doc = self.documents[doc_id]
+            anchors = [
+                doc.sections[number]
+                for number, _ in section_hits[doc_id].most_common()
+                if doc.sections[number]
+            ]
+            hits.append(SearchHit(doc.kind, doc.name, doc.path, round(score, 4), anchors[:3]))
+        return hits
+
+    # ── Persistence ────────────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "documents": [
+                [d.kind, d.name, d.path, d.sha256, d.length, d.sections]
+                for d in self.documents
+            ],
+            "postings": dict(sorted(self.postings.items())),
+        }
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')) + '\n',
+            encoding='utf-8'
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'SearchIndex':
+        """Load a saved index; a missing or outdated file gives an empty index."""
+        index = cls()
+        if not path.exists():
+            return index
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') != INDEX_VERSION:
+            logger.info("ℹ️  Search index format changed — rebuilding from scratch")
+            return index
+        index.documents = [Document(*row) for row in data['documents']]
+        index.postings = data['postings']
+        return index
+
+
+def build_index(plugin_root: Path, index_path: Optional[Path] = None) -> Dict[str, int]:
+    """Incrementally rebuild the saved index for a Plugin tree."""
+    index_path = index_path or plugin_root / DEFAULT_INDEX_PATH
+    start = time.perf_counter()
+    index = SearchIndex.load(index_path)
+    counts = index.update(plugin_root)
+    index.save(index_path)
+    logger.info(
+        f"🔎 Search index: {len(index.documents)} documents, {len(index.postings)} terms "
+        f"(+{counts['added']} ~{counts['updated']} -{counts['removed']}, "
+        f"{(time.perf_counter() - start) * 1000:.1f} ms)"
+    )
+    return counts
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Build and query the BM25 search index of the Plugin corpus'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument('--index', type=Path, help='Index file path')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='Build or incrementally update the index')
+    query_parser = subparsers.add_parser('query', help='Print ranked matches')
+    query_parser.add_argument('text', nargs='+')
+    query_parser.add_argument('--kind', action='append', choices=INDEXED_KINDS)
+    query_parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    index_path = args.index or args.plugin_root / DEFAULT_INDEX_PATH
+    if args.command == 'build':
+        build_index(args.plugin_root, index_path)
+        return 0
+
+    start = time.perf_counter()
+    index = SearchIndex.load(index_path)
+    if not index.documents:
+        logger.error(f"❌ No search index at {index_path} — run 'build' first")
+        return 1
+    hits = index.search(' '.join(args.text), args.limit, args.kind)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for hit in hits:
+        anchors = ', '.join(f"#{a}" for a in hit.sections)
+        print(f"{hit.score:7.3f}  {hit.kind:<8} {hit.name:<32} {hit.path}  {anchors}")
+    logger.info(f"⚡ {len(hits)} result(s) in {elapsed_ms:.1f} ms (including load)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Content Similarity Sketches
+
+Near-duplicate detection primitives shared by the sync and analysis scripts:
+
+- shingle hashing: text → set of 64-bit hashes of overlapping word n-grams
+- one-permutation MinHash: a fixed-size signature computed with ONE hash
+  per shingle (values are split into bins by their top bits and the minimum
+  per bin is kept), so sketching is linear in document size
+- LSH banding: signatures are cut into bands; documents sharing any band
+  land in the same bucket, which finds candidate pairs without comparing
+  every document against every other
+
+Estimated Jaccard similarity of two documents is the fraction of equal
+signature slots.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+_HASH_BITS = 64
+_MASK = (1 << _HASH_BITS) - 1
+
+
+def hash64(data: str) -> int:
+    """Stable 64-bit hash (process-independent, unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(data.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def shingles(text: str, size: int = 5) -> Set[int]:
+    """Hashed word n-grams of text; short texts yield a single shingle."""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) <= size:
+        return {hash64(' '.join(words))} if words else set()
+    return {hash64(' '.join(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """One-permutation MinHash with rotation densification."""
+
+    def __init__(self, num_bins: int = 64):
+        if num_bins & (num_bins - 1):
+            raise ValueError("num_bins must be a power of two")
+        self.num_bins = num_bins
+        self._shift = _HASH_BITS - (num_bins.bit_length() - 1)
+        self._low_mask = (1 << self._shift) - 1
+
+    def signature(self, hashes: Iterable[int]) -> Tuple[int, ...]:
+        """Signature of a shingle-hash set (all-empty sets get an all-max signature)."""
+        bins = [_MASK] * self.num_bins
+        empty = True
+        for value in hashes:
+            slot = value >> self._shift
+            low = value & self._low_mask
+            if low < bins[slot]:
+                bins[slot] = low
+            empty = False
+        if empty:
+            return tuple(bins)
+
+        # Densify: an empty bin borrows the nearest non-empty bin to its right,
+        # offset by the distance so borrowed values stay distinguishable
+        filled = [b != _MASK for b in bins]
+        result = list(bins)
+        for i in range(self.num_bins):
+            if not filled[i]:
+                j = 1
+                while not filled[(i + j) % self.num_bins]:
+                    j += 1
+                result[i] = bins[(i + j) % self.num_bins] + j * (self._low_mask + 1)
+        return tuple(result)
+
+    def text_signature(self, text: str, shingle_size: int = 5) -> Tuple[int, ...]:
+        return self.signature(shingles(text, shingle_size))
+
+    @staticmethod
+    def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        if not a:
+            return 0.0
+        return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def bands_for_threshold(num_bins: int, threshold: float) -> int:
+    """
+    Number of LSH bands whose S-curve midpoint (1/b)^(1/r) is closest to
+    (and not above) the similarity threshold.
+    """
+    best = 1
+    for bands in range(1, num_bins + 1):
+        if num_bins % bands:
+            continue
+        rows = num_bins // bands
+        if (1 / bands) ** (1 / rows) <= threshold:
+            return bands
+        best = bands
+    return best
+
+
+class LSHIndex:
+    """Banded locality-sensitive hash index over MinHash signatures."""
+
+    def __init__(self, num_bins: int = 64, bands: int = 32):
+        if num_bins % bands:
+            raise ValueError("bands must divide num_bins")
+        self.bands = bands
+        self.rows = num_bins // bands
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self.signatures: Dict[Hashable, Tuple[int, ...]] = {}
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: Hashable, signature: Tuple[int, ...]) -> None:
+        self.signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].append(key)
+
+    def query(self, signature: Tuple[int, ...]) -> Set[Hashable]:
+        """Keys sharing at least one band with signature."""
+        found: Set[Hashable] = set()
+        for band, band_key in self._band_keys(signature):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+    def candidate_pairs(self) -> Set[Tuple[Hashable, Hashable]]:
+        """All unordered key pairs sharing at least one bucket."""
+        pairs: Set[Tuple[Hashable, Hashable]] = set()
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                if len(keys) < 2:
+                    continue
+                ordered = sorted(keys, key=str)
+                for i, a in enumerate(ordered):
+                    for b in ordered[i + 1:]:
+                        pairs.add((a, b))
+        return pairs
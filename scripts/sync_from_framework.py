@@ -14,23 +14,51 @@ Options:
     --framework-repo URL    Framework repository URL
     --plugin-root PATH      Plugin repository root path
     --dry-run               Preview changes without applying
+    --resume                Continue an interrupted sync from its checkpoint
+    --rollback              Swap synced directories back to their previous generation
+    --cache-dir PATH        Build cache directory (default: .sync-cache)
+    --no-cache              Bypass the build cache
+    --layout full|stubs     Command layout (stubs: frontmatter stubs + command-bodies/)
     --output-report PATH    Save sync report to file
 """
 
+import os
 import sys
 import argparse
 import tempfile
 import shutil
 import hashlib
+import inspect
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Sequence, Set, Tuple, Optional
 import json
 import re
 import subprocess
-from dataclasses import dataclass, asdict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows: no reflink ioctl
+    fcntl = None
+
+import frontmatter
+from corpus_index import scan_markdown, validate_corpus
+from merkle_manifest import MerkleManifest, build_manifest
+from backup_store import BackupStore, RetentionPolicy
+from build_cache import DEFAULT_CACHE_DIR, BuildCache, make_key, tree_id
+from closure_packs import write_packs
+from command_stubs import BODIES_DIR, remove_bodies, split_commands
+from similarity import LSHIndex, MinHasher, bands_for_threshold
+from search_index import build_index
+from staging import StagedDirectory
+from trigger_router import compile_router
+from sync_journal import JOURNAL_FILENAME, SyncJournal
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +67,39 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Linux ioctl that clones a file's extents (btrfs, xfs, ...) instead of copying
+FICLONE = 0x40049409
+COPY_BUFSIZE = 1024 * 1024
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(COPY_BUFSIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def level_prefix(depth: int, filename_prefix: str, nested_prefixes: Sequence[str] = ()) -> str:
+    """
+    Filename prefix for files `depth` directories below the mapped root.
+
+    nested_prefixes[0] applies one level down, [1] two levels down, and the
+    last entry to every deeper level; without any, every level uses
+    filename_prefix.
+    """
+    if depth == 0 or not nested_prefixes:
+        return filename_prefix
+    return nested_prefixes[min(depth, len(nested_prefixes)) - 1]
+
+
+def prefixed_path(rel: str, filename_prefix: str, nested_prefixes: Sequence[str] = ()) -> str:
+    """Destination path of a source file: its level's prefix on the filename."""
+    parent, _, name = rel.rpartition('/')
+    name = f"{level_prefix(rel.count('/'), filename_prefix, nested_prefixes)}{name}"
+    return f"{parent}/{name}" if parent else name
+
+
 class ProtectionViolationError(RuntimeError):
     """Raised when sync would overwrite a Plugin-owned file listed in PROTECTED_PATHS."""
     pass
@@ -58,6 +119,10 @@ class SyncResult:
     mcp_servers_merged: int
     warnings: List[str]
     errors: List[str]
+    duration_seconds: float = 0.0
+    mapping_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    layout: str = "full"
+    layout_stats: Dict[str, object] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -70,7 +135,6 @@ class ContentTransformer:
     COMMAND_HEADER_PATTERN = re.compile(r'^(#+\s+)/(\w+)', re.MULTILINE)
     COMMAND_REF_PATTERN = re.compile(r'(?<![/\w])/(\w+)(?=\s|$|:|`|\)|\])')
     LINK_REF_PATTERN = re.compile(r'\[/(\w+)\]')
-    FRONTMATTER_NAME_PATTERN = re.compile(r'^name:\s*(.+)$', re.MULTILINE)
 
     @staticmethod
     def transform_command(content: str, filename: str) -> str:
@@ -128,48 +192,177 @@ class ContentTransformer:
         """
         logger.debug(f"Transforming agent: {filename}")
 
-        # Parse frontmatter
-        frontmatter_pattern = re.compile(
-            r'^---\n(.*?)\n---',
-            re.DOTALL | re.MULTILINE
-        )
-
-        match = frontmatter_pattern.search(content)
-        if not match:
+        header = frontmatter.parse(content)
+        if header is None:
             logger.warning(f"No frontmatter found in agent: {filename}")
             return content
 
-        frontmatter = match.group(1)
-
         # Transform name field (add sc- prefix if not already present)
-        def add_prefix(match):
-            name = match.group(1).strip()
-            if not name.startswith('sc-'):
-                return f'name: sc-{name}'
-            return match.group(0)
-
-        frontmatter = ContentTransformer.FRONTMATTER_NAME_PATTERN.sub(
-            add_prefix,
-            frontmatter
-        )
+        name = header.get('name')
+        if name and not name.startswith('sc-'):
+            header.set('name', f'sc-{name}')
 
-        # Replace frontmatter
-        content = frontmatter_pattern.sub(
-            f'---\n{frontmatter}\n---',
-            content,
-            count=1
+        # Splice only the header span back into the document
+        return header.apply(content)
+
+    @classmethod
+    def rules_digest(cls) -> str:
+        """Digest of the transformation code; any rule change gives a new value."""
+        source = inspect.getsource(cls) + inspect.getsource(frontmatter)
+        return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+class RenameDetector:
+    """
+    Pairs outputs removed by a sync with outputs it adds, by content.
+
+    Exact matches are found through a content-hash index; near-identical
+    content through MinHash signatures bucketed with LSH, so pairing is
+    near-linear in the number of files instead of pairwise diffing.
+    """
+
+    # Same default as git's rename detection (-M50%)
+    SIMILARITY_THRESHOLD = 0.5
+    SIGNATURE_BINS = 64
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.hasher = MinHasher(self.SIGNATURE_BINS)
+
+    def detect(
+        self,
+        removed: Dict[str, str],
+        added: Dict[str, str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Match removed files to added files.
+
+        Args:
+            removed: old filename → content of files the sync would delete
+            added: new filename → content of files the sync would create
+
+        Returns:
+            (old filename, new filename) pairs, each file used at most once
+        """
+        pairs: List[Tuple[str, str]] = []
+
+        # Pass 1: identical content
+        by_hash: Dict[str, List[str]] = {}
+        for name in sorted(removed):
+            digest = hashlib.sha256(removed[name].encode('utf-8')).hexdigest()
+            by_hash.setdefault(digest, []).append(name)
+
+        unmatched_added = []
+        for name in sorted(added):
+            digest = hashlib.sha256(added[name].encode('utf-8')).hexdigest()
+            if by_hash.get(digest):
+                pairs.append((by_hash[digest].pop(0), name))
+            else:
+                unmatched_added.append(name)
+
+        matched_old = {old for old, _ in pairs}
+        unmatched_removed = [n for n in sorted(removed) if n not in matched_old]
+        if not unmatched_removed or not unmatched_added:
+            return pairs
+
+        # Pass 2: near-identical content via LSH candidates
+        index = LSHIndex(
+            self.SIGNATURE_BINS,
+            bands_for_threshold(self.SIGNATURE_BINS, self.threshold)
         )
+        for name in unmatched_removed:
+            index.add(name, self.hasher.text_signature(removed[name]))
+
+        scored = []
+        for name in unmatched_added:
+            signature = self.hasher.text_signature(added[name])
+            for old in index.query(signature):
+                score = MinHasher.similarity(index.signatures[old], signature)
+                if score >= self.threshold:
+                    scored.append((score, old, name))
+
+        used_old, used_new = set(), set()
+        for score, old, new in sorted(scored, key=lambda t: (-t[0], t[1], t[2])):
+            if old not in used_old and new not in used_new:
+                pairs.append((old, new))
+                used_old.add(old)
+                used_new.add(new)
+
+        return pairs
+
+
+@dataclass(frozen=True)
+class SyncMapping:
+    """
+    One Framework directory tree synced into one Plugin directory.
+
+    Subdirectories are mirrored.  Files directly in `source` get
+    filename_prefix; nested_prefixes sets the prefix per deeper level (see
+    level_prefix).  A level whose prefix is empty owns every markdown file
+    at that level, so stale-file cleanup may remove any of them.
+    """
+    name: str
+    source: str
+    dest: str
+    filename_prefix: str = "sc-"
+    transform: Optional[str] = None
+    nested_prefixes: Tuple[str, ...] = ()
+
+    # Transformer names usable in a mapping's `transform` field
+    TRANSFORMERS = {
+        "command": ContentTransformer.transform_command,
+        "agent": ContentTransformer.transform_agent,
+    }
 
-        return content
+    def transform_fn(self):
+        """Resolve the transformer name to its function (None = copy as-is)."""
+        if self.transform is None:
+            return None
+        try:
+            return self.TRANSFORMERS[self.transform]
+        except KeyError:
+            raise ValueError(
+                f"Unknown transformer '{self.transform}' for mapping '{self.name}'"
+            ) from None
+
+    def output_path(self, rel: str) -> str:
+        """Path under dest of the output for source file rel (relative to source)."""
+        return prefixed_path(rel, self.filename_prefix, self.nested_prefixes)
+
+    def cache_key(self, source_tree: str) -> str:
+        """Build cache key for this mapping's output from a given source subtree."""
+        return make_key(
+            source_tree, self.filename_prefix, '/'.join(self.nested_prefixes),
+            self.transform or '', ContentTransformer.rules_digest()
+        )
 
 
 class FileSyncer:
     """Handles file synchronization with git integration."""
 
-    def __init__(self, plugin_root: Path, dry_run: bool = False):
+    # git mv takes the index lock; mappings syncing concurrently must take turns
+    _git_lock = threading.Lock()
+
+    def __init__(
+        self,
+        plugin_root: Path,
+        dry_run: bool = False,
+        journal: Optional[SyncJournal] = None,
+        build_cache: Optional[BuildCache] = None
+    ):
         self.plugin_root = plugin_root
         self.dry_run = dry_run
+        self.journal = journal
+        self.build_cache = build_cache
         self.git_available = self._check_git()
+        self.rename_detector = RenameDetector()
+        # Set while syncing into untracked staging directories: renames are
+        # plain renames there, and stage_renames() records them afterwards
+        self.defer_git_renames = False
+        self.deferred_renames: List[Tuple[Path, Path]] = []
+
+    def _journal_key(self, path: Path) -> str:
+        return path.relative_to(self.plugin_root).as_posix()
 
     def _check_git(self) -> bool:
         """Check if git is available and repo is initialized."""
@@ -190,21 +383,47 @@ class FileSyncer:
         source_dir: Path,
         dest_dir: Path,
         filename_prefix: str = "",
-        transform_fn=None
+        transform_fn=None,
+        cache_key: Optional[str] = None,
+        cache_name: str = "",
+        nested_prefixes: Sequence[str] = ()
     ) -> Dict[str, int]:
         """
-        Sync directory with namespace prefix and transformation.
+        Sync a directory tree with namespace prefixes and transformation.
+
+        Markdown files are mirrored at every depth; each file gets its
+        level's prefix (see level_prefix).  Stale outputs — files carrying
+        their level's prefix with no source — are removed anywhere in the
+        destination tree, along with directories that leaves empty.
+
+        Renames are detected two ways so history is preserved with git mv:
+        an unprefixed file becoming prefixed, and upstream renames or moves
+        (foo.md → bar.md, foo.md → sub/foo.md) paired by content via
+        RenameDetector.  With defer_git_renames, they are plain renames
+        kept for stage_renames().
+
+        With a journal, each finished write is checkpointed; files the
+        journal already covers (and that still match on disk) are neither
+        re-read, re-transformed nor rewritten.
+
+        With a build cache and cache_key, the transformed outputs are taken
+        from the cache when present (no reads or transforms), and stored
+        there after a full transform otherwise.
 
         Args:
             source_dir: Source directory path
             dest_dir: Destination directory path
             filename_prefix: Prefix to add to filenames (e.g., 'sc-')
             transform_fn: Optional content transformation function
+            cache_key: Build cache key of the source tree + transformation
+            cache_name: Label recorded with a stored cache entry
+            nested_prefixes: Prefixes for files in subdirectories, by depth
 
         Returns:
-            Statistics dict with counts of synced/modified files
+            Statistics dict with counts of synced/modified/renamed files and
+            of outputs served from the build cache
         """
-        stats = {'synced': 0, 'modified': 0, 'renamed': 0}
+        stats = {'synced': 0, 'modified': 0, 'renamed': 0, 'cached': 0}
 
         if not source_dir.exists():
             logger.warning(f"Source directory not found: {source_dir}")
@@ -212,56 +431,187 @@ class FileSyncer:
 
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-        # Get existing files in dest (with sc- prefix)
-        existing_files = {f.name: f for f in dest_dir.glob('*.md')}
-        synced_files = set()
-
-        for source_file in source_dir.glob('*.md'):
-            # Apply filename prefix
-            new_name = f"{filename_prefix}{source_file.name}"
-            synced_files.add(new_name)
-            dest_file = dest_dir / new_name
+        # Existing outputs, keyed by path relative to dest_dir; "owned" ones
+        # carry their level's prefix and are the sync's to rename or remove
+        existing_files = {rel: dest_dir / rel for rel in scan_markdown(dest_dir)}
+        owned = {
+            rel for rel in existing_files
+            if rel.rpartition('/')[2].startswith(
+                level_prefix(rel.count('/'), filename_prefix, nested_prefixes)
+            )
+        }
 
-            # Read and transform content
+        # Read and transform all content first so renames can be paired;
+        # outputs maps destination rel → (source rel, content)
+        outputs: Dict[str, Tuple[str, str]] = {}
+        completed: Set[str] = set()
+        use_cache = self.build_cache is not None and cache_key is not None
+        cached = self.build_cache.get(cache_key) if use_cache else None
+        for source_rel in scan_markdown(source_dir):
+            new_rel = prefixed_path(source_rel, filename_prefix, nested_prefixes)
+            dest_file = dest_dir / new_rel
+            if self.journal and self.journal.write_done(self._journal_key(dest_file), dest_file):
+                completed.add(new_rel)
+                stats['modified'] += 1
+                continue
+            if cached is not None and source_rel in cached:
+                outputs[new_rel] = (source_rel, cached[source_rel])
+                stats['cached'] += 1
+                continue
+            source_file = source_dir / source_rel
             content = source_file.read_text(encoding='utf-8')
             if transform_fn:
                 content = transform_fn(content, source_file.name)
+            outputs[new_rel] = (source_rel, content)
+
+        # Only a complete output set is worth caching (not a resumed partial one)
+        if use_cache and cached is None and not completed and not self.dry_run:
+            self.build_cache.put(cache_key, cache_name, {
+                source_rel: content for source_rel, content in outputs.values()
+            })
+
+        synced_files = set(outputs) | completed
+        moved_files = self._rename_moved_files(
+            dest_dir, owned, existing_files, outputs, stats, completed
+        )
+
+        for new_rel, (source_rel, content) in outputs.items():
+            dest_file = dest_dir / new_rel
+            if not self.dry_run:
+                dest_file.parent.mkdir(parents=True, exist_ok=True)
 
             # Check if file exists with different name (needs git mv)
-            old_unprefixed = source_file.name
-            old_file_path = dest_dir / old_unprefixed
+            old_file_path = dest_dir / source_rel
 
-            if old_file_path.exists() and new_name != old_unprefixed:
+            if old_file_path.exists() and new_rel != source_rel:
                 # File needs renaming: use git mv to preserve history
-                if self.git_available:
-                    self._git_mv(old_file_path, dest_file)
-                    stats['renamed'] += 1
-                else:
-                    # Fallback to regular rename
-                    if not self.dry_run:
-                        old_file_path.rename(dest_file)
-                    stats['renamed'] += 1
-                    logger.info(f"  📝 Renamed: {old_unprefixed} → {new_name}")
+                self._move(old_file_path, dest_file)
+                stats['renamed'] += 1
 
             # Write content
             if not self.dry_run:
                 dest_file.write_text(content, encoding='utf-8')
+                if self.journal:
+                    self.journal.record_write(self._journal_key(dest_file), content)
 
             if dest_file.exists():
                 stats['modified'] += 1
             else:
                 stats['synced'] += 1
 
-        # Remove files that no longer exist in source
-        # (only remove files with prefix that aren't in synced set)
-        for filename, filepath in existing_files.items():
-            if filename.startswith(filename_prefix) and filename not in synced_files:
-                if not self.dry_run:
-                    filepath.unlink()
-                logger.info(f"  🗑️  Removed: {filepath.relative_to(self.plugin_root)}")
+        # Remove owned files that no longer exist in source, at any depth
+        emptied: Set[Path] = set()
+        for rel in sorted(owned - synced_files - moved_files):
+            filepath = existing_files[rel]
+            if not self.dry_run:
+                filepath.unlink()
+                if self.journal:
+                    self.journal.record_remove(self._journal_key(filepath))
+                emptied.add(filepath.parent)
+            logger.info(f"  🗑️  Removed: {filepath.relative_to(self.plugin_root)}")
+        if emptied:
+            self._remove_empty_dirs(dest_dir, emptied)
 
         return stats
 
+    @staticmethod
+    def _remove_empty_dirs(root: Path, directories: Set[Path]) -> None:
+        """Remove directories (deepest first) and their parents up to root once empty."""
+        for directory in sorted(directories, key=lambda d: len(d.parts), reverse=True):
+            while directory != root and directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+                directory = directory.parent
+
+    def _rename_moved_files(
+        self,
+        dest_dir: Path,
+        owned: Set[str],
+        existing_files: Dict[str, Path],
+        outputs: Dict[str, Tuple[str, str]],
+        stats: Dict[str, int],
+        completed: Set[str] = frozenset()
+    ) -> Set[str]:
+        """
+        Move files that upstream renamed, so the write lands on their history.
+
+        Returns:
+            Paths (relative to dest_dir) of the old files that were moved
+        """
+        removed = {
+            rel: existing_files[rel].read_text(encoding='utf-8')
+            for rel in owned
+            if rel not in outputs and rel not in completed
+        }
+        added = {
+            rel: content
+            for rel, (source_rel, content) in outputs.items()
+            if rel not in existing_files and source_rel not in existing_files
+        }
+        if not removed or not added:
+            return set()
+
+        moved = set()
+        for old_rel, new_rel in self.rename_detector.detect(removed, added):
+            old_path = dest_dir / old_rel
+            new_path = dest_dir / new_rel
+            if not self.dry_run:
+                new_path.parent.mkdir(parents=True, exist_ok=True)
+            self._move(old_path, new_path)
+            if self.journal and not self.dry_run:
+                self.journal.record_rename(self._journal_key(old_path), self._journal_key(new_path))
+            stats['renamed'] += 1
+            moved.add(old_rel)
+        return moved
+
+    def _move(self, old_path: Path, new_path: Path) -> None:
+        """Rename a synced file, through git mv when it can run here."""
+        if self.git_available and not self.defer_git_renames:
+            self._git_mv(old_path, new_path)
+            return
+        if not self.dry_run:
+            old_path.rename(new_path)
+            if self.defer_git_renames:
+                self.deferred_renames.append((old_path, new_path))
+        logger.info(f"  📝 Renamed: {old_path.name} → {new_path.name}")
+
+    def stage_renames(self, generations: Dict[Path, Path]) -> int:
+        """
+        Record deferred renames in the git index once staging is live.
+
+        generations maps each staging directory to the live directory it
+        became.  Removing the old path from the index and adding the new
+        one is what git mv does, so history follows the file the same way.
+
+        Returns:
+            Number of renames staged
+        """
+        renames, self.deferred_renames = self.deferred_renames, []
+        if not renames or not self.git_available:
+            return 0
+
+        def live_path(path: Path) -> str:
+            for staging, live in generations.items():
+                if staging in path.parents:
+                    return str(live / path.relative_to(staging))
+            return str(path)
+
+        try:
+            with self._git_lock:
+                subprocess.run(
+                    ['git', 'rm', '--cached', '--quiet', '--ignore-unmatch', '--',
+                     *(live_path(old) for old, _ in renames)],
+                    cwd=self.plugin_root, check=True, capture_output=True
+                )
+                subprocess.run(
+                    ['git', 'add', '--', *(live_path(new) for _, new in renames)],
+                    cwd=self.plugin_root, check=True, capture_output=True
+                )
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"  ⚠️  Could not stage renames in git: {e}")
+            return 0
+        logger.info(f"  📝 Staged {len(renames)} rename(s) in git")
+        return len(renames)
+
     def _git_mv(self, old_path: Path, new_path: Path):
         """Use git mv to preserve history."""
         if self.dry_run:
@@ -269,49 +619,149 @@ class FileSyncer:
             return
 
         try:
-            subprocess.run(
-                ['git', 'mv', str(old_path), str(new_path)],
-                cwd=self.plugin_root,
-                check=True,
-                capture_output=True
-            )
+            with self._git_lock:
+                subprocess.run(
+                    ['git', 'mv', str(old_path), str(new_path)],
+                    cwd=self.plugin_root,
+                    check=True,
+                    capture_output=True
+                )
             logger.info(f"  📝 Renamed (git mv): {old_path.name} → {new_path.name}")
         except subprocess.CalledProcessError as e:
             # Fallback to regular rename
             logger.warning(f"  ⚠️  Git mv failed, using regular rename: {e}")
             old_path.rename(new_path)
 
-    def copy_directory(self, source_dir: Path, dest_dir: Path) -> int:
+    def copy_directory(
+        self,
+        source_dir: Path,
+        dest_dir: Path,
+        hardlink: bool = False
+    ) -> Dict[str, int]:
         """
         Copy directory contents as-is (no transformation).
 
+        Files already present with the same content are skipped: equal size
+        and mtime count as unchanged, and equal size with a different mtime
+        is settled by hashing both sides.  Copies go through a temporary
+        name and os.replace, using a reflink or copy_file_range where the
+        filesystem supports it.
+
         Args:
             source_dir: Source directory path
             dest_dir: Destination directory path
+            hardlink: Link files instead of copying (same filesystem only;
+                falls back to copying across devices)
 
         Returns:
-            Number of files copied
+            Statistics dict: copied, linked, skipped, hashed (skip decisions
+            that needed a content hash) and bytes (bytes written)
         """
+        stats = {'copied': 0, 'linked': 0, 'skipped': 0, 'hashed': 0, 'bytes': 0}
+
         if not source_dir.exists():
             logger.warning(f"Source directory not found: {source_dir}")
-            return 0
+            return stats
 
         dest_dir.mkdir(parents=True, exist_ok=True)
-        count = 0
 
-        for source_file in source_dir.glob('**/*'):
-            if source_file.is_file():
-                rel_path = source_file.relative_to(source_dir)
-                dest_file = dest_dir / rel_path
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
+        for source_file in sorted(source_dir.glob('**/*')):
+            if not source_file.is_file():
+                continue
+            rel_path = source_file.relative_to(source_dir)
+            dest_file = dest_dir / rel_path
+            source_stat = source_file.stat()
+
+            if self._unchanged(source_file, source_stat, dest_file, stats):
+                stats['skipped'] += 1
+                continue
+
+            if self.dry_run:
+                stats['linked' if hardlink else 'copied'] += 1
+                continue
+
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest_file.with_name(f".{dest_file.name}.copy-tmp")
+            tmp.unlink(missing_ok=True)
+            method = None
+            if hardlink:
+                try:
+                    os.link(source_file, tmp)
+                    method = 'hardlink'
+                except OSError:
+                    pass
+            if method is None:
+                method = self._clone_file(source_file, tmp, source_stat.st_size)
+                shutil.copystat(source_file, tmp)
+                stats['bytes'] += source_stat.st_size
+            # Replace rather than write in place: dest may be a hardlink of source
+            os.replace(tmp, dest_file)
+
+            stats['linked' if method == 'hardlink' else 'copied'] += 1
+            logger.debug(f"  📄 Copied ({method}): {rel_path}")
+
+        return stats
+
+    def _unchanged(
+        self,
+        source_file: Path,
+        source_stat: os.stat_result,
+        dest_file: Path,
+        stats: Dict[str, int]
+    ) -> bool:
+        """Whether dest_file already holds source_file's content."""
+        try:
+            dest_stat = dest_file.stat()
+        except FileNotFoundError:
+            return False
+        if (dest_stat.st_dev, dest_stat.st_ino) == (source_stat.st_dev, source_stat.st_ino):
+            return True
+        if dest_stat.st_size != source_stat.st_size:
+            return False
+        if dest_stat.st_mtime_ns == source_stat.st_mtime_ns:
+            return True
 
-                if not self.dry_run:
-                    shutil.copy2(source_file, dest_file)
+        # Same size, different mtime: only the content can tell
+        stats['hashed'] += 1
+        if _file_sha256(source_file) != _file_sha256(dest_file):
+            return False
+        # Align the mtime so the next run decides without hashing
+        if not self.dry_run:
+            os.utime(dest_file, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        return True
 
-                count += 1
-                logger.debug(f"  📄 Copied: {rel_path}")
+    @staticmethod
+    def _clone_file(source: Path, dest: Path, size: int) -> str:
+        """
+        Copy source to a new file dest, cheapest way first.
 
-        return count
+        Returns:
+            'reflink', 'copy_file_range' or 'copy'
+        """
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                    return 'reflink'
+                except OSError:
+                    pass
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    copied = 0
+                    while copied < size:
+                        sent = os.copy_file_range(src.fileno(), dst.fileno(), size - copied)
+                        if sent == 0:
+                            break
+                        copied += sent
+                    if copied == size:
+                        return 'copy_file_range'
+                except OSError:
+                    pass
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+            shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+        return 'copy'
 
 
 class PluginJsonGenerator:
@@ -436,20 +886,28 @@ class McpMerger:
 
         return merged, warnings
 
-    def backup_current(self) -> Optional[Path]:
-        """Create backup of current plugin.json."""
+    def backup_current(self, policy: Optional[RetentionPolicy] = None) -> Optional[Path]:
+        """
+        Snapshot current plugin.json into the deduplicated backup store.
+
+        Identical content is stored once; the retention policy then evicts
+        old snapshots and their unreferenced blobs.
+
+        Returns:
+            Path of the compressed blob holding the snapshot
+        """
         plugin_json = self.plugin_root / 'plugin.json'
         if not plugin_json.exists():
             return None
 
-        backup_dir = self.plugin_root / 'backups'
-        backup_dir.mkdir(exist_ok=True)
-
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_path = backup_dir / f'plugin.json.{timestamp}.backup'
+        store = BackupStore(self.plugin_root / 'backups')
+        snapshot = store.backup(plugin_json)
+        evicted = store.prune(policy or RetentionPolicy())
 
-        shutil.copy2(plugin_json, backup_path)
-        logger.info(f"📦 Backup created: {backup_path}")
+        backup_path = store.blob_path(snapshot.blob)
+        logger.info(f"📦 Backup created: {snapshot.id} → {backup_path.relative_to(self.plugin_root)}")
+        if evicted:
+            logger.info(f"🧹 Retention evicted {len(evicted)} old snapshot(s)")
 
         return backup_path
 
@@ -461,11 +919,21 @@ class FrameworkSyncer:
     # What to pull from Framework and transform for Plugin distribution.
     # Symmetric pair with PROTECTED_PATHS below: a path appears in one or the other,
     # never both.
-    SYNC_MAPPINGS = {
-        "src/superclaude/commands": "commands",   # /cmd → /sc:cmd, sc- prefix
-        "src/superclaude/agents":   "agents",     # name → sc-name in frontmatter
+    #
+    # Each mapping runs as its own pipeline, concurrently with the others.
+    # Adding a synced directory is one entry here; `transform` names a key of
+    # SyncMapping.TRANSFORMERS (None copies content unchanged).
+    SYNC_MAPPINGS: List[SyncMapping] = [
+        # /cmd → /sc:cmd, sc- prefix
+        SyncMapping("commands", "src/superclaude/commands", "commands", transform="command"),
+        # name → sc-name in frontmatter
+        SyncMapping("agents", "src/superclaude/agents", "agents", transform="agent"),
         # core/ and modes/ are intentionally absent — they live in PROTECTED_PATHS
-    }
+    ]
+
+    # Output layouts for commands/: complete files, or frontmatter stubs with
+    # the bodies deferred to command-bodies/ (see command_stubs.py)
+    LAYOUTS = ("full", "stubs")
 
     # ── PROTECTED PATHS ────────────────────────────────────────────────────────
     # Plugin-owned files and directories that must NEVER be overwritten by sync,
@@ -504,17 +972,32 @@ class FrameworkSyncer:
         self,
         framework_repo: str,
         plugin_root: Path,
-        dry_run: bool = False
+        dry_run: bool = False,
+        resume: bool = False,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        layout: str = "full"
     ):
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown layout '{layout}' (expected one of {', '.join(self.LAYOUTS)})")
         self.framework_repo = framework_repo
         self.plugin_root = plugin_root
         self.dry_run = dry_run
+        self.resume = resume
+        self.build_cache: Optional[BuildCache] = (
+            BuildCache(cache_dir or plugin_root / DEFAULT_CACHE_DIR) if use_cache else None
+        )
+        self.journal: Optional[SyncJournal] = None
+        self.resumed = False
         self.temp_dir = None
         self.warnings = []
         self.errors = []
+        self.mapping_stats: Dict[str, Dict[str, int]] = {}
+        self.layout = layout
 
     def sync(self) -> SyncResult:
         """Execute full sync workflow."""
+        started = time.perf_counter()
         try:
             logger.info("🔄 Starting Framework sync...")
 
@@ -526,27 +1009,53 @@ class FrameworkSyncer:
             logger.info(f"📦 Framework version: {framework_version}")
             logger.info(f"📝 Framework commit: {framework_commit[:8]}")
 
-            # Step 2: Snapshot protected files BEFORE any changes
-            protection_snapshot = self._snapshot_protected_files()
+            # Checkpoint journal: completed steps and file writes are recorded
+            # so an interrupted run can be resumed with --resume
+            self.journal = self._open_journal(framework_commit)
+
+            # Step 2: Create backup (writes to backups/, so it runs before the
+            # protection snapshot rather than being flagged by it)
+            self._run_step('backup', self._create_backup)
 
-            # Step 3: Create backup
-            self._create_backup()
+            # Step 3: Snapshot protected files BEFORE any content changes
+            protection_snapshot = self._snapshot_protected_files()
 
             # Step 4: Transform and sync content
-            stats = self._sync_content(framework_path)
+            content = self._run_step('content', lambda: {
+                'stats': self._sync_content(framework_path),
+                'mapping_stats': self.mapping_stats,
+            })
+            stats = content['stats']
+            self.mapping_stats = content['mapping_stats']
 
             # Step 5: Verify protected files were NOT touched
             self._validate_protected_files(protection_snapshot)
 
             # Step 6: Generate plugin.json
-            self._generate_plugin_json(framework_version)
+            self._run_step('plugin_json', lambda: self._generate_plugin_json(framework_version))
 
-            # Step 7: Merge MCP configurations
-            mcp_merged = self._merge_mcp_configs(framework_path)
+            # Step 7: Apply the output layout before anything indexes the
+            # corpus, so stubs resolve to the bodies written here
+            layout_stats = self._run_step('layout', self._apply_layout) or {}
 
-            # Step 8: Validate sync results
+            # Step 8: Rebuild the search index, trigger router and per-command
+            # closure packs for the synced corpus
+            self._run_step('search_index', self._build_search_index)
+            self._run_step('trigger_router', self._compile_trigger_router)
+            self._run_step('closure_packs', self._build_closure_packs)
+
+            # Step 9: Merge MCP configurations
+            mcp_merged = self._run_step('mcp', lambda: self._merge_mcp_configs(framework_path))
+
+            # Step 10: Validate sync results
             self._validate_sync()
 
+            # Step 11: Emit the Merkle manifest of the final tree (protected files
+            # unchanged since the snapshot are not rehashed)
+            self._run_step('manifest', lambda: self._write_manifest(protection_snapshot))
+
+            if self.journal:
+                self.journal.complete()
             logger.info("✅ Sync completed successfully!")
 
             return SyncResult(
@@ -560,7 +1069,11 @@ class FrameworkSyncer:
                 agents_transformed=stats['agents'],
                 mcp_servers_merged=mcp_merged,
                 warnings=self.warnings,
-                errors=self.errors
+                errors=self.errors,
+                duration_seconds=round(time.perf_counter() - started, 3),
+                mapping_stats=self.mapping_stats,
+                layout=self.layout,
+                layout_stats=layout_stats
             )
 
         except ProtectionViolationError as e:
@@ -596,58 +1109,66 @@ class FrameworkSyncer:
                 errors=self.errors
             )
         finally:
+            if self.journal:
+                self.journal.close()
             self._cleanup()
 
-    # ── Protection helpers ─────────────────────────────────────────────────────
+    # ── Checkpointing ──────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _hash_file(path: Path) -> str:
-        """Return SHA-256 hex digest of a file's contents."""
-        h = hashlib.sha256()
-        h.update(path.read_bytes())
-        return h.hexdigest()
+    def _open_journal(self, framework_commit: str) -> Optional[SyncJournal]:
+        """Resume the checkpoint for this commit, or start a new one."""
+        if self.dry_run:
+            return None
+        path = self.plugin_root / JOURNAL_FILENAME
+        if self.resume:
+            journal = SyncJournal.resume(path, framework_commit)
+            if journal:
+                self.resumed = True
+                return journal
+        elif path.exists():
+            logger.info("ℹ️  Discarding checkpoint of a previous interrupted sync (use --resume to continue it)")
+        return SyncJournal.start(path, framework_commit)
+
+    def _run_step(self, name: str, fn):
+        """Run a sync step unless the journal shows it finished; record its result."""
+        if self.journal and self.journal.step_done(name):
+            logger.info(f"⏭️  Step already completed: {name}")
+            return self.journal.steps[name]
+        value = fn()
+        if self.journal:
+            self.journal.record_step(name, value)
+        return value
+
+    # ── Protection helpers ─────────────────────────────────────────────────────
 
-    def _snapshot_protected_files(self) -> Dict[str, str]:
+    def _snapshot_protected_files(self) -> MerkleManifest:
         """
-        Hash every file that lives under a PROTECTED_PATHS entry.
+        Merkle-hash every file that lives under a PROTECTED_PATHS entry.
 
         Called BEFORE sync begins so we have a baseline to compare against.
 
         Returns:
-            Mapping of relative-path-string → SHA-256 hex digest.
-        """
-        snapshot: Dict[str, str] = {}
-        for protected in self.PROTECTED_PATHS:
-            target = self.plugin_root / protected
-            if target.is_file():
-                rel = protected
-                snapshot[rel] = self._hash_file(target)
-            elif target.is_dir():
-                for f in sorted(target.rglob('*')):
-                    if f.is_file():
-                        rel = str(f.relative_to(self.plugin_root))
-                        snapshot[rel] = self._hash_file(f)
-        logger.info(f"🔒 Protection snapshot: {len(snapshot)} Plugin-owned files hashed")
+            Manifest of the protected paths (remembering each file's stat).
+        """
+        snapshot = MerkleManifest.build(self.plugin_root, self.PROTECTED_PATHS)
+        logger.info(f"🔒 Protection snapshot: {snapshot.file_count} Plugin-owned files hashed")
         return snapshot
 
-    def _validate_protected_files(self, snapshot: Dict[str, str]) -> None:
+    def _validate_protected_files(self, snapshot: MerkleManifest) -> None:
         """
-        Re-hash every file from the snapshot and compare.
+        Re-check the snapshot against the tree.
 
-        Called AFTER sync to verify no protected file was touched.
+        Called AFTER sync to verify no protected file was touched.  Only
+        files whose size, mtime or ctime changed are rehashed.
 
         Raises:
             ProtectionViolationError: if any protected file was modified or deleted.
         """
-        violations: List[str] = []
-        for rel_path, original_hash in snapshot.items():
-            current = self.plugin_root / rel_path
-            if not current.exists():
-                violations.append(f"DELETED  : {rel_path}")
-            else:
-                current_hash = self._hash_file(current)
-                if current_hash != original_hash:
-                    violations.append(f"MODIFIED : {rel_path}")
+        diff = snapshot.verify(self.plugin_root)
+        violations: List[str] = (
+            [f"DELETED  : {rel_path}" for rel_path in diff.removed]
+            + [f"MODIFIED : {rel_path}" for rel_path in diff.modified]
+        )
 
         if violations:
             msg = (
@@ -658,7 +1179,7 @@ class FrameworkSyncer:
             logger.error(msg)
             raise ProtectionViolationError(msg)
 
-        logger.info(f"🔒 Protection check passed — {len(snapshot)} Plugin-owned files unchanged")
+        logger.info(f"🔒 Protection check passed — {snapshot.file_count} Plugin-owned files unchanged")
 
     # ── Core sync workflow ─────────────────────────────────────────────────────
 
@@ -731,11 +1252,78 @@ class FrameworkSyncer:
         if backup_path:
             logger.info(f"✅ Backup created: {backup_path}")
 
+    def _check_mappings(self) -> None:
+        """Refuse mappings that target a protected path or share a destination."""
+        seen: Set[str] = set()
+        for mapping in self.SYNC_MAPPINGS:
+            dest = mapping.dest.rstrip('/') + '/'
+            for protected in self.PROTECTED_PATHS:
+                if dest.startswith(protected) or protected.startswith(dest):
+                    raise ProtectionViolationError(
+                        f"Sync mapping '{mapping.name}' targets protected path {protected}"
+                    )
+            if dest in seen:
+                raise ValueError(f"Sync mapping '{mapping.name}' reuses destination {mapping.dest}")
+            seen.add(dest)
+            mapping.transform_fn()
+
+    def _sync_mapping(
+        self,
+        file_syncer: FileSyncer,
+        framework_path: Path,
+        mapping: SyncMapping,
+        dest_dir: Path
+    ) -> Dict[str, int]:
+        """Run one mapping's pipeline into dest_dir and return its stats."""
+        source_dir = framework_path / mapping.source
+        if not source_dir.exists():
+            logger.warning(f"⚠️  {mapping.name}: source not found: {mapping.source}")
+            return {'synced': 0, 'modified': 0, 'renamed': 0, 'cached': 0}
+
+        logger.info(f"📝 Syncing {mapping.name}...")
+        cache_key = None
+        if file_syncer.build_cache is not None:
+            cache_key = mapping.cache_key(tree_id(framework_path, mapping.source))
+        mapping_stats = file_syncer.sync_directory(
+            source_dir,
+            dest_dir,
+            filename_prefix=mapping.filename_prefix,
+            transform_fn=mapping.transform_fn(),
+            cache_key=cache_key,
+            cache_name=mapping.name,
+            nested_prefixes=mapping.nested_prefixes
+        )
+        transformed = mapping_stats['synced'] + mapping_stats['modified']
+        from_cache = f" ({mapping_stats['cached']} from build cache)" if mapping_stats['cached'] else ""
+        logger.info(f"✅ {mapping.name.capitalize()}: {transformed} transformed{from_cache}")
+        return mapping_stats
+
     def _sync_content(self, framework_path: Path) -> Dict[str, int]:
-        """Sync and transform content from Framework."""
-        logger.info("🔄 Syncing content...")
+        """
+        Sync and transform content from Framework, one pipeline per mapping.
 
-        file_syncer = FileSyncer(self.plugin_root, self.dry_run)
+        Each mapping is built in a staging copy of its destination; only when
+        every pipeline has succeeded are the staging directories swapped in.
+        A failure leaves the live tree untouched.
+        """
+        logger.info("🔄 Syncing content...")
+        self._check_mappings()
+
+        file_syncer = FileSyncer(self.plugin_root, self.dry_run, self.journal, self.build_cache)
+        # Mappings an interrupted run already swapped in are done; staging
+        # them again would copy the new tree over their rollback target
+        swapped = self._swapped_mappings()
+        pending = [m for m in self.SYNC_MAPPINGS if m.name not in swapped]
+        for name in swapped:
+            logger.info(f"⏭️  Already swapped in: {name}")
+        staged: Dict[str, StagedDirectory] = {}
+        if not self.dry_run:
+            for mapping in pending:
+                staged[mapping.name] = StagedDirectory(self.plugin_root / mapping.dest)
+                staged[mapping.name].prepare(keep_existing=self.resumed)
+            # Staging directories are untracked, so git mv cannot run there;
+            # renames are staged in git once the swap is committed
+            file_syncer.defer_git_renames = True
         stats = {
             'files_synced': 0,
             'files_modified': 0,
@@ -743,39 +1331,28 @@ class FrameworkSyncer:
             'agents': 0
         }
 
-        # Sync commands with transformation
-        logger.info("📝 Syncing commands...")
-        source_commands = framework_path / 'src/superclaude/commands'
-        dest_commands = self.plugin_root / 'commands'
-
-        if source_commands.exists():
-            cmd_stats = file_syncer.sync_directory(
-                source_commands,
-                dest_commands,
-                filename_prefix='sc-',
-                transform_fn=ContentTransformer.transform_command
-            )
-            stats['commands'] = cmd_stats['synced'] + cmd_stats['modified']
-            stats['files_synced'] += cmd_stats['synced']
-            stats['files_modified'] += cmd_stats['modified']
-            logger.info(f"✅ Commands: {stats['commands']} transformed")
-
-        # Sync agents with transformation
-        logger.info("📝 Syncing agents...")
-        source_agents = framework_path / 'src/superclaude/agents'
-        dest_agents = self.plugin_root / 'agents'
-
-        if source_agents.exists():
-            agent_stats = file_syncer.sync_directory(
-                source_agents,
-                dest_agents,
-                filename_prefix='sc-',
-                transform_fn=ContentTransformer.transform_agent
-            )
-            stats['agents'] = agent_stats['synced'] + agent_stats['modified']
-            stats['files_synced'] += agent_stats['synced']
-            stats['files_modified'] += agent_stats['modified']
-            logger.info(f"✅ Agents: {stats['agents']} transformed")
+        workers = max(1, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                mapping.name: pool.submit(
+                    self._sync_mapping, file_syncer, framework_path, mapping,
+                    staged[mapping.name].staging if staged else self.plugin_root / mapping.dest
+                )
+                for mapping in pending
+            }
+            # result() re-raises a failed pipeline's exception here
+            self.mapping_stats = {
+                m.name: swapped[m.name] if m.name in swapped else futures[m.name].result()
+                for m in self.SYNC_MAPPINGS
+            }
+
+        self._commit_staged(staged)
+        file_syncer.stage_renames({d.staging: d.live for d in staged.values()})
+
+        for name, mapping_stats in self.mapping_stats.items():
+            stats[name] = mapping_stats['synced'] + mapping_stats['modified']
+            stats['files_synced'] += mapping_stats['synced']
+            stats['files_modified'] += mapping_stats['modified']
 
         # core/ and modes/ are in PROTECTED_PATHS — Plugin maintains its own versions.
         # They are intentionally excluded from SYNC_MAPPINGS and will never be
@@ -785,6 +1362,55 @@ class FrameworkSyncer:
 
         return stats
 
+    def _commit_staged(self, staged: Dict[str, StagedDirectory]) -> None:
+        """
+        Swap every staged directory in, undoing earlier swaps if one fails.
+
+        Each swap is journaled with its mapping's stats as soon as it is
+        done (and cleared again if undone), so a resumed run knows which
+        directories are already live.
+        """
+        committed: List[str] = []
+        try:
+            for name, directory in staged.items():
+                directory.commit()
+                committed.append(name)
+                if self.journal:
+                    self.journal.record_step(f"swap/{name}", self.mapping_stats[name])
+        except OSError:
+            for name in reversed(committed):
+                staged[name].rollback()
+                if self.journal:
+                    self.journal.record_step(f"swap/{name}", None)
+            raise
+
+    def _swapped_mappings(self) -> Dict[str, Dict[str, int]]:
+        """Stats of the mappings the journal shows already swapped in, by name."""
+        if not self.journal:
+            return {}
+        return {
+            m.name: self.journal.steps[f"swap/{m.name}"]
+            for m in self.SYNC_MAPPINGS
+            if self.journal.steps.get(f"swap/{m.name}")
+        }
+
+    def rollback(self) -> List[str]:
+        """
+        Swap each synced directory with its previous generation.
+
+        Returns:
+            Destinations that were rolled back
+        """
+        rolled_back = []
+        for mapping in self.SYNC_MAPPINGS:
+            directory = StagedDirectory(self.plugin_root / mapping.dest)
+            if directory.previous.exists():
+                directory.rollback()
+                rolled_back.append(mapping.dest)
+            else:
+                logger.warning(f"⚠️  No previous generation of {mapping.dest}/")
+        return rolled_back
+
     def _generate_plugin_json(self, framework_version: str):
         """Generate plugin.json from synced commands."""
         logger.info("📄 Generating plugin.json...")
@@ -793,6 +1419,56 @@ class FrameworkSyncer:
         plugin_json = generator.generate(framework_version)
         generator.write(plugin_json, self.dry_run)
 
+    def _build_search_index(self) -> Optional[Dict[str, int]]:
+        """Incrementally update .claude-plugin/search-index.json."""
+        if self.dry_run:
+            logger.info("[DRY RUN] Would update search index")
+            return None
+        return build_index(self.plugin_root)
+
+    def _compile_trigger_router(self) -> Optional[int]:
+        """Recompile .claude-plugin/trigger-router.json; returns the phrase count."""
+        if self.dry_run:
+            logger.info("[DRY RUN] Would compile trigger router")
+            return None
+        return len(compile_router(self.plugin_root).phrases)
+
+    def _build_closure_packs(self) -> Optional[int]:
+        """Write .claude-plugin/closure-packs.json; returns the pack count."""
+        if self.dry_run:
+            logger.info("[DRY RUN] Would derive closure packs")
+            return None
+        return len(write_packs(self.plugin_root)['packs'])
+
+    def _apply_layout(self) -> Optional[dict]:
+        """
+        Split commands into stubs and deferred bodies (stubs layout), or drop
+        bodies left by an earlier stubs sync (full layout).
+
+        Returns:
+            The upfront-bytes report of the split, for the stubs layout
+        """
+        if self.layout == "full":
+            removed = remove_bodies(self.plugin_root, self.dry_run)
+            if removed is not None:
+                logger.info(f"🧹 Full layout: removed {removed} deferred bodies from {BODIES_DIR}/")
+            return None
+
+        report = split_commands(self.plugin_root, self.dry_run)
+        prefix = "[DRY RUN] Would defer" if self.dry_run else "📉 Deferred"
+        logger.info(f"{prefix} command bodies to {BODIES_DIR}/: {report.summary()}")
+        return report.to_dict()
+
+    def _write_manifest(self, previous: Optional[MerkleManifest] = None) -> Optional[str]:
+        """Write .claude-plugin/merkle-manifest.json; returns the root hash."""
+        if self.dry_run:
+            logger.info("[DRY RUN] Would write Merkle manifest")
+            return None
+        scope = [m.dest for m in self.SYNC_MAPPINGS] + self.PROTECTED_PATHS + ['plugin.json']
+        if self.layout == "stubs":
+            scope.append(BODIES_DIR)
+        return build_manifest(self.plugin_root, scope, previous=previous).root_hash
+
     def _merge_mcp_configs(self, framework_path: Path) -> int:
         """Merge MCP configurations from Framework."""
         logger.info("🔗 Merging MCP configurations...")
@@ -856,6 +1532,12 @@ class FrameworkSyncer:
             sc_agents = list(agents_dir.glob('sc-*.md'))
             logger.info(f"✅ Found {len(sc_agents)} sc- prefixed agents")
 
+        # Check cross-references between commands, agents and modes
+        _, index_warnings = validate_corpus(self.plugin_root)
+        for warning in index_warnings:
+            logger.warning(f"⚠️  {warning}")
+            self.warnings.append(warning)
+
         # Check plugin.json
         plugin_json_path = self.plugin_root / '.claude-plugin' / 'plugin.json'
         if plugin_json_path.exists():
@@ -892,6 +1574,32 @@ def main():
         default=False,
         help='Preview changes without applying'
     )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue an interrupted sync from its checkpoint'
+    )
+    parser.add_argument(
+        '--rollback',
+        action='store_true',
+        help='Swap synced directories back to their previous generation'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        help='Build cache directory (default: <plugin-root>/.sync-cache)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Transform everything without reading or filling the build cache'
+    )
+    parser.add_argument(
+        '--layout',
+        choices=FrameworkSyncer.LAYOUTS,
+        default='full',
+        help='Command output layout: complete files, or frontmatter stubs plus deferred bodies'
+    )
     parser.add_argument(
         '--output-report',
         type=Path,
@@ -915,9 +1623,18 @@ def main():
     syncer = FrameworkSyncer(
         framework_repo=args.framework_repo,
         plugin_root=args.plugin_root,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        resume=args.resume,
+        cache_dir=args.cache_dir,
+        use_cache=not args.no_cache,
+        layout=args.layout
     )
 
+    if args.rollback:
+        rolled_back = syncer.rollback()
+        logger.info(f"↩️  Rolled back: {', '.join(rolled_back) or 'nothing'}")
+        sys.exit(0 if rolled_back else 1)
+
     result = syncer.sync()
 
     # Output report
@@ -939,6 +1656,10 @@ def main():
     print(f"Commands Transformed: {result.commands_transformed}")
     print(f"Agents Transformed: {result.agents_transformed}")
     print(f"MCP Servers Merged: {result.mcp_servers_merged}")
+    if result.layout_stats:
+        stats = result.layout_stats
+        print(f"Upfront Command Bytes: {stats['full_bytes']:,} → {stats['stub_bytes']:,} "
+              f"(−{stats['reduction']:.1%}, stubs layout)")
 
     if result.warnings:
         print(f"\n⚠️  Warnings: {len(result.warnings)}")
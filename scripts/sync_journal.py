@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Sync Checkpoint Journal
+
+Append-only record of the operations a Framework sync has completed, so an
+interrupted run can be resumed instead of restarted.  The journal is a JSON
+Lines file: a header naming the Framework commit being synced, then one
+record per finished file write, rename or removal, and one per finished
+sync step.  Every record is flushed and fsynced before the next operation
+starts, so after a crash the journal never claims more than was done.
+
+A resumed run trusts a write record only if the file on disk still has the
+recorded SHA-256; anything else is redone.
+
+Record shapes:
+    {"type": "header", "framework_commit": "...", "started": "..."}
+    {"type": "write", "path": "commands/sc-build.md", "sha256": "..."}
+    {"type": "rename", "path": "commands/sc-new.md", "from": "commands/sc-old.md"}
+    {"type": "remove", "path": "commands/sc-gone.md"}
+    {"type": "step", "name": "plugin_json", "value": null}
+"""
+
+import os
+import hashlib
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = '.sync-checkpoint.jsonl'
+
+
+def sha256_text(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class SyncJournal:
+    """Checkpoint journal for one sync of one Framework commit."""
+
+    def __init__(self, path: Path, framework_commit: str):
+        self.path = path
+        self.framework_commit = framework_commit
+        self.writes: Dict[str, str] = {}
+        self.renames: Dict[str, str] = {}
+        self.removes: Set[str] = set()
+        self.steps: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._handle = None
+
+    # ── Opening ────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def start(cls, path: Path, framework_commit: str) -> 'SyncJournal':
+        """Begin a fresh journal, discarding any previous one."""
+        journal = cls(path, framework_commit)
+        journal._handle = open(path, 'w', encoding='utf-8')
+        journal._append({
+            "type": "header",
+            "framework_commit": framework_commit,
+            "started": datetime.now().isoformat(timespec='seconds'),
+        })
+        return journal
+
+    @classmethod
+    def resume(cls, path: Path, framework_commit: str) -> Optional['SyncJournal']:
+        """
+        Reopen a journal for the same Framework commit.
+
+        Returns None when there is no journal or it belongs to another
+        commit; the caller then starts fresh.
+        """
+        if not path.exists():
+            logger.info("ℹ️  No checkpoint to resume from — starting fresh")
+            return None
+
+        journal = cls(path, framework_commit)
+        with open(path, encoding='utf-8') as handle:
+            lines = handle.read().splitlines()
+        if not lines:
+            return None
+        try:
+            header = json.loads(lines[0])
+        except json.JSONDecodeError:
+            logger.warning("⚠️  Checkpoint header unreadable — starting fresh")
+            return None
+        if header.get('framework_commit') != framework_commit:
+            logger.warning(
+                f"⚠️  Checkpoint is for Framework commit "
+                f"{str(header.get('framework_commit'))[:8]}, not {framework_commit[:8]} — starting fresh"
+            )
+            return None
+
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from the crash; everything before it stands
+                break
+            journal._replay(record)
+
+        journal._handle = open(path, 'a', encoding='utf-8')
+        logger.info(
+            f"⏯️  Resuming sync: {len(journal.writes)} write(s), "
+            f"{len(journal.steps)} step(s) already done"
+        )
+        return journal
+
+    def _replay(self, record: Dict[str, Any]) -> None:
+        kind = record.get('type')
+        if kind == 'write':
+            self.writes[record['path']] = record['sha256']
+        elif kind == 'rename':
+            self.renames[record['path']] = record['from']
+        elif kind == 'remove':
+            self.removes.add(record['path'])
+        elif kind == 'step':
+            self.steps[record['name']] = record.get('value')
+
+    # ── Recording ──────────────────────────────────────────────────────────────
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._handle.write(json.dumps(record, sort_keys=True) + '\n')
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            self._replay(record)
+
+    def record_write(self, path: str, content: str) -> None:
+        self._append({"type": "write", "path": path, "sha256": sha256_text(content)})
+
+    def record_rename(self, old_path: str, new_path: str) -> None:
+        self._append({"type": "rename", "path": new_path, "from": old_path})
+
+    def record_remove(self, path: str) -> None:
+        self._append({"type": "remove", "path": path})
+
+    def record_step(self, name: str, value: Any = None) -> None:
+        self._append({"type": "step", "name": name, "value": value})
+
+    # ── Queries ────────────────────────────────────────────────────────────────
+
+    def write_done(self, path: str, file_path: Path) -> bool:
+        """True when path was written and the file on disk still matches."""
+        expected = self.writes.get(path)
+        if expected is None or not file_path.exists():
+            return False
+        return hashlib.sha256(file_path.read_bytes()).hexdigest() == expected
+
+    def step_done(self, name: str) -> bool:
+        return name in self.steps
+
+    # ── Closing ────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+
+    def complete(self) -> None:
+        """The sync finished: the checkpoint is no longer needed."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Section-Level Token Profiler
+
+Splits every command, agent, mode and core file into its markdown heading
+hierarchy and attributes an estimated token cost to each section, so we can
+see which sections of which files drive context cost instead of only the
+per-category totals reported by benchmark/detailed-analysis.sh.
+
+Outputs:
+    - a ranked "hot sections" table (self tokens, inclusive tokens, share)
+    - collapsed stacks (`category;file;# H1;## H2 tokens`) consumable by
+      flamegraph.pl, speedscope, inferno and similar tools
+
+Usage:
+    python scripts/token_profiler.py [OPTIONS]
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --estimator NAME        Token estimator (bytes, chars, words, pieces)
+    --top N                 Number of hot sections to print (default: 25)
+    --collapsed PATH        Write collapsed stacks to file
+    --json PATH             Write the full section profile as JSON
+"""
+
+import sys
+import argparse
+import json
+import re
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+import logging
+
+from corpus_index import scan_markdown
+from token_estimator import ESTIMATORS, DEFAULT_ESTIMATOR, get_estimator
+
+logger = logging.getLogger(__name__)
+
+# Categories profiled, in report order
+PROFILED_DIRS = ["commands", "agents", "modes", "core"]
+
+
+@dataclass
+class Section:
+    """One heading and the text up to the next heading."""
+    category: str
+    file: str
+    heading: str
+    level: int
+    line: int
+    self_tokens: int = 0
+    total_tokens: int = 0
+    path: List[str] = field(default_factory=list)
+    children: List['Section'] = field(default_factory=list, repr=False)
+
+    def walk(self) -> Iterator['Section']:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.pop('children')
+        return data
+
+
+class SectionProfiler:
+    """Builds per-section token profiles of markdown files."""
+
+    HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+    FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+    FRONTMATTER_HEADING = "(frontmatter)"
+    PREAMBLE_HEADING = "(preamble)"
+
+    def __init__(self, estimator: Callable[[str], int]):
+        self.estimator = estimator
+
+    def profile_text(self, text: str, category: str, filename: str) -> Section:
+        """
+        Split text into a heading tree rooted at a file-level section.
+
+        Headings inside fenced code blocks are ignored.  Text before the first
+        heading is attributed to a preamble (or frontmatter) child section.
+        """
+        root = Section(category, filename, filename, 0, 1)
+        stack = [root]
+        lines = text.splitlines(keepends=True)
+        buffer: List[str] = []
+        current = root
+        in_fence = False
+        start = 0
+
+        if lines and lines[0].rstrip('\n') == '---':
+            for i in range(1, len(lines)):
+                if lines[i].rstrip('\n') == '---':
+                    front = Section(category, filename, self.FRONTMATTER_HEADING, 1, 1)
+                    front.self_tokens = self.estimator(''.join(lines[:i + 1]))
+                    root.children.append(front)
+                    start = i + 1
+                    break
+
+        for lineno in range(start, len(lines)):
+            line = lines[lineno]
+            if self.FENCE_PATTERN.match(line):
+                in_fence = not in_fence
+            heading = None if in_fence else self.HEADING_PATTERN.match(line)
+            if heading is None:
+                buffer.append(line)
+                continue
+
+            self._flush(current, buffer, root)
+            buffer = [line]
+            level = len(heading.group(1))
+            while stack[-1].level >= level:
+                stack.pop()
+            current = Section(category, filename, heading.group(2), level, lineno + 1)
+            stack[-1].children.append(current)
+            stack.append(current)
+
+        self._flush(current, buffer, root)
+        self._finalize(root, [category])
+        return root
+
+    def _flush(self, current: Section, buffer: List[str], root: Section) -> None:
+        if not buffer:
+            return
+        tokens = self.estimator(''.join(buffer))
+        if current is root:
+            if not ''.join(buffer).strip():
+                # Blank lines after the frontmatter stay with the frontmatter
+                if root.children:
+                    root.children[-1].self_tokens += tokens
+                return
+            preamble = Section(root.category, root.file, self.PREAMBLE_HEADING, 1, 1)
+            preamble.self_tokens = tokens
+            root.children.append(preamble)
+        else:
+            current.self_tokens += tokens
+
+    def _finalize(self, section: Section, parent_path: List[str]) -> int:
+        # Collapsed-stack frames must not contain the ';' separator
+        section.path = parent_path + [section.heading.replace(';', ',')]
+        section.total_tokens = section.self_tokens + sum(
+            self._finalize(child, section.path) for child in section.children
+        )
+        return section.total_tokens
+
+    def profile_tree(self, plugin_root: Path) -> List[Section]:
+        """Profile every markdown file of the profiled categories, nested ones included."""
+        roots = []
+        for category in PROFILED_DIRS:
+            directory = plugin_root / category
+            for rel in scan_markdown(directory):
+                text = (directory / rel).read_text(encoding='utf-8')
+                roots.append(self.profile_text(text, category, rel))
+        return roots
+
+
+def hot_sections(roots: List[Section], top: Optional[int] = None) -> List[Section]:
+    """Non-root sections ranked by self tokens, highest first."""
+    sections = [s for root in roots for s in root.walk() if s.level > 0]
+    sections.sort(key=lambda s: (-s.self_tokens, s.file, s.line))
+    return sections[:top] if top else sections
+
+
+def collapsed_stacks(roots: List[Section]) -> List[str]:
+    """
+    Lines in Brendan Gregg's collapsed-stack format.
+
+    Each line carries the section's self tokens, so a flamegraph built from
+    them shows inclusive cost per frame.
+    """
+    return [
+        f"{';'.join(section.path)} {section.self_tokens}"
+        for root in roots
+        for section in root.walk()
+        if section.self_tokens > 0
+    ]
+
+
+def format_table(sections: List[Section], grand_total: int) -> str:
+    """Render the hot-sections ranking as a fixed-width text table."""
+    rows = [f"{'rank':>4}  {'self':>7}  {'incl':>7}  {'share':>6}  location"]
+    for rank, section in enumerate(sections, 1):
+        share = (section.self_tokens * 100 / grand_total) if grand_total else 0.0
+        heading = section.heading if len(section.heading) <= 60 else section.heading[:57] + '...'
+        rows.append(
+            f"{rank:>4}  {section.self_tokens:>7}  {section.total_tokens:>7}  "
+            f"{share:>5.1f}%  {section.category}/{section.file}:{section.line} "
+            f"{'#' * section.level} {heading}"
+        )
+    return '\n'.join(rows)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Attribute estimated token cost to markdown sections'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument(
+        '--estimator',
+        choices=sorted(ESTIMATORS),
+        default=DEFAULT_ESTIMATOR,
+        help='Token estimator'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=25,
+        help='Number of hot sections to print'
+    )
+    parser.add_argument(
+        '--collapsed',
+        type=Path,
+        help='Write collapsed stacks to file'
+    )
+    parser.add_argument(
+        '--json',
+        type=Path,
+        help='Write the full section profile as JSON'
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    profiler = SectionProfiler(get_estimator(args.estimator))
+    roots = profiler.profile_tree(args.plugin_root)
+    grand_total = sum(root.total_tokens for root in roots)
+
+    if args.collapsed:
+        args.collapsed.write_text('\n'.join(collapsed_stacks(roots)) + '\n', encoding='utf-8')
+        logger.info(f"🔥 Collapsed stacks saved to: {args.collapsed}")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "estimator": args.estimator,
+            "total_tokens": grand_total,
+            "sections": [s.to_dict() for s in hot_sections(roots)],
+        }, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        logger.info(f"📊 Profile saved to: {args.json}")
+
+    print(f"\nHOT SECTIONS ({args.estimator} estimator, {grand_total} tokens across {len(roots)} files)")
+    print("=" * 60)
+    print(format_table(hot_sections(roots, args.top), grand_total))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Trigger Router
+
+Routes a request to the agents and modes whose `## Triggers` /
+`## Activation Triggers` sections match it.  At sync time the trigger
+bullets are compiled into a phrase table; at load time the phrases are
+built into an Aho-Corasick automaton, so routing a request is one pass
+over its characters no matter how many phrases there are.
+
+Phrases come from each trigger bullet:
+- quoted text ("どこまで進んでた", "could we"), code spans and flags
+  (`--brainstorm`, /sc:research), and short comma lists
+  ("brainstorm, explore, discuss") are explicit phrases (weight 2)
+- the remaining prose and bold labels contribute their content words
+  (weight 1)
+
+ASCII phrases only match on word boundaries; CJK phrases match anywhere.
+A target's score is the summed weight of the distinct phrases it matched.
+
+Usage:
+    python scripts/trigger_router.py [OPTIONS] COMMAND
+
+Commands:
+    compile                 Extract trigger phrases and save the table
+    route TEXT              Print candidate agents and modes for TEXT
+
+Options:
+    --plugin-root PATH      Plugin repository root path
+    --table PATH            Phrase table (default: .claude-plugin/trigger-router.json)
+    --limit N               route: number of candidates (default: 5)
+"""
+
+import sys
+import argparse
+import json
+import re
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+from corpus_index import CorpusIndex
+
+logger = logging.getLogger(__name__)
+
+TABLE_VERSION = 1
+DEFAULT_TABLE_PATH = Path('.claude-plugin') / 'trigger-router.json'
+ROUTED_KINDS = ("agent", "mode")
+
+PHRASE_WEIGHT = 2
+KEYWORD_WEIGHT = 1
+
+TRIGGER_HEADING = re.compile(r'^#{2,6}\s+.*trigger', re.IGNORECASE)
+HEADING = re.compile(r'^#{1,6}\s')
+BULLET = re.compile(r'^\s*(?:[-*+]|\d+\.)\s+(.*)$')
+QUOTED = re.compile(r'"([^"]+)"|“([^”]+)”|「([^」]+)」')
+CODE_SPAN = re.compile(r'`([^`]+)`')
+FLAG = re.compile(r'(?<![\w-])(--[a-z][\w-]*|/sc:[\w-]+)')
+BOLD = re.compile(r'\*\*([^*]+)\*\*')
+WORD = re.compile(r'[a-z][a-z-]*[a-z]')
+CJK = re.compile(r'[\u3040-\u30ff\u3400-\u9fff\uf900-\ufaff]')
+
+# Words that say nothing about which agent or mode fits
+STOPWORDS = frozenset("""
+    about above after again against also always any and are auto based been
+    before being between both but can could does doing during each either
+    from further have having into its just like more most much must need
+    needed needs other over same should some such than that their them then
+    there these they this those through under until very what when where
+    which while will with within without would your activates activation
+    request requests requested requirement requirements requiring required
+    context contexts tasks task operations operation work working benefit
+    benefiting involving multiple complex explicit manual immediate regular
+    """.split())
+
+
+def normalize(phrase: str) -> str:
+    phrase = phrase.strip().strip('.…').strip()
+    return ' '.join(phrase.lower().split())
+
+
+def trigger_bullets(text: str) -> Iterable[str]:
+    """Bullet lines under any heading that mentions triggers."""
+    in_triggers = False
+    for line in text.splitlines():
+        if HEADING.match(line):
+            in_triggers = bool(TRIGGER_HEADING.match(line))
+            continue
+        if in_triggers:
+            match = BULLET.match(line)
+            if match:
+                yield match.group(1)
+
+
+def extract_phrases(bullet: str) -> Dict[str, int]:
+    """Phrase → weight for one trigger bullet."""
+    phrases: Dict[str, int] = {}
+
+    def add(phrase: str, weight: int) -> None:
+        phrase = normalize(phrase)
+        if len(phrase) >= 2 and (len(phrase) >= 3 or CJK.search(phrase)):
+            phrases[phrase] = max(weight, phrases.get(phrase, 0))
+
+    for match in QUOTED.finditer(bullet):
+        add(next(g for g in match.groups() if g), PHRASE_WEIGHT)
+    for match in CODE_SPAN.finditer(bullet):
+        add(match.group(1), PHRASE_WEIGHT)
+    rest = CODE_SPAN.sub(' ', QUOTED.sub(' ', bullet))
+    for match in FLAG.finditer(rest):
+        add(match.group(1), PHRASE_WEIGHT)
+    rest = FLAG.sub(' ', rest)
+
+    label = ''
+    bold = BOLD.match(rest.strip())
+    if bold:
+        label = bold.group(1)
+        rest = rest.strip()[bold.end():].lstrip(':').strip()
+    elif ':' in rest:
+        label, rest = rest.split(':', 1)
+
+    items = [item.strip() for item in rest.split(',')]
+    if len(items) > 1 and all(len(item.split()) <= 3 for item in items if item):
+        for item in items:
+            add(item, PHRASE_WEIGHT)
+        rest = ''
+
+    for word in WORD.findall(f"{label} {rest}".lower()):
+        if len(word) >= 4 and word not in STOPWORDS:
+            add(word, KEYWORD_WEIGHT)
+    return phrases
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher over characters."""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for number, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(number)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def finditer(self, text: str) -> Iterable[Tuple[int, int]]:
+        """Yield (end index exclusive, pattern number) for every occurrence."""
+        state = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for number in out[state]:
+                yield index + 1, number
+
+
+@dataclass
+class Route:
+    kind: str
+    name: str
+    path: str
+    score: int
+    matched: List[str] = field(default_factory=list)
+
+
+class TriggerRouter:
+    """Trigger phrase table plus its compiled automaton."""
+
+    def __init__(self, targets: List[List[str]], phrases: Dict[str, List[List[int]]]):
+        # targets: [kind, name, path]; phrases: phrase → [[target, weight], ...]
+        self.targets = targets
+        self.phrases = phrases
+        self._patterns = sorted(phrases)
+        self._automaton = AhoCorasick(self._patterns)
+
+    @classmethod
+    def compile(cls, plugin_root: Path) -> 'TriggerRouter':
+        """Extract trigger phrases from agents and modes."""
+        targets: List[List[str]] = []
+        phrases: Dict[str, List[List[int]]] = defaultdict(list)
+        for kind, path in CorpusIndex.corpus_files(plugin_root, ROUTED_KINDS):
+            text = path.read_text(encoding='utf-8')
+            weights: Dict[str, int] = {}
+            for bullet in trigger_bullets(text):
+                for phrase, weight in extract_phrases(bullet).items():
+                    weights[phrase] = max(weight, weights.get(phrase, 0))
+            if not weights:
+                continue
+            target = len(targets)
+            targets.append([kind, CorpusIndex.node_name(kind, path, text),
+                            path.relative_to(plugin_root).as_posix()])
+            for phrase, weight in weights.items():
+                phrases[phrase].append([target, weight])
+        return cls(targets, dict(phrases))
+
+    def route(self, text: str, limit: int = 5) -> List[Route]:
+        """Candidate agents and modes for text, best first."""
+        lowered = text.lower()
+        matched: Dict[int, Dict[str, int]] = defaultdict(dict)
+        for end, number in self._automaton.finditer(lowered):
+            phrase = self._patterns[number]
+            start = end - len(phrase)
+            if not self._on_boundary(lowered, start, end, phrase):
+                continue
+            for target, weight in self.phrases[phrase]:
+                matched[target][phrase] = weight
+
+        routes = [
+            Route(*self.targets[target], score=sum(found.values()),
+                  matched=sorted(found, key=lambda p: (-found[p], p)))
+            for target, found in matched.items()
+        ]
+        routes.sort(key=lambda r: (-r.score, r.name))
+        return routes[:limit]
+
+    @staticmethod
+    def _on_boundary(text: str, start: int, end: int, phrase: str) -> bool:
+        def is_word(char: str) -> bool:
+            return char.isascii() and (char.isalnum() or char == '_')
+
+        if is_word(phrase[0]) and start > 0 and is_word(text[start - 1]):
+            return False
+        if is_word(phrase[-1]) and end < len(text) and is_word(text[end]):
+            return False
+        return True
+
+    # ── Persistence ────────────────────────────────────────────────────────────
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": TABLE_VERSION,
+            "targets": self.targets,
+            "phrases": dict(sorted(self.phrases.items())),
+        }
+        path.write_text(
+            json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n',
+            encoding='utf-8'
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['TriggerRouter']:
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') != TABLE_VERSION:
+            return None
+        return cls(data['targets'], data['phrases'])
+
+
+def compile_router(plugin_root: Path, table_path: Optional[Path] = None) -> TriggerRouter:
+    """Compile the trigger table for a Plugin tree and save it."""
+    start = time.perf_counter()
+    router = TriggerRouter.compile(plugin_root)
+    router.save(table_path or plugin_root / DEFAULT_TABLE_PATH)
+    logger.info(
+        f"🧭 Trigger router: {len(router.phrases)} phrases for {len(router.targets)} "
+        f"agents/modes ({(time.perf_counter() - start) * 1000:.1f} ms)"
+    )
+    return router
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Compile trigger phrases and route requests to agents and modes'
+    )
+    parser.add_argument(
+        '--plugin-root',
+        type=Path,
+        default=Path.cwd(),
+        help='Plugin repository root path'
+    )
+    parser.add_argument('--table', type=Path, help='Phrase table path')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('compile', help='Extract trigger phrases and save the table')
+    route_parser = subparsers.add_parser('route', help='Print candidate agents and modes')
+    route_parser.add_argument('text', nargs='+')
+    route_parser.add_argument('--limit', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    table_path = args.table or args.plugin_root / DEFAULT_TABLE_PATH
+    if args.command == 'compile':
+        compile_router(args.plugin_root, table_path)
+        return 0
+
+    router = TriggerRouter.load(table_path)
+    if router is None:
+        logger.info("ℹ️  No compiled table — compiling from the corpus")
+        router = TriggerRouter.compile(args.plugin_root)
+    start = time.perf_counter()
+    routes = router.route(' '.join(args.text), args.limit)
+    elapsed_us = (time.perf_counter() - start) * 1e6
+    for route in routes:
+        print(f"{route.score:4d}  {route.kind:<6} {route.name:<28} {', '.join(route.matched[:6])}")
+    logger.info(f"⚡ {len(routes)} candidate(s) in {elapsed_us:.0f} µs")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Test suite for backup_store.py
+
+Run tests with:
+    python -m pytest tests/test_backup_store.py -v
+"""
+
+import unittest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from backup_store import BackupError, BackupStore, RetentionPolicy
+from sync_from_framework import McpMerger
+
+
+class TestBackupStore(unittest.TestCase):
+    """Test deduplication, retention and restore."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        self.plugin_json = self.root / "plugin.json"
+        self.plugin_json.write_text('{"version": "1"}\n')
+        self.store = BackupStore(self.root / "backups")
+
+    def blobs(self):
+        return sorted((self.root / "backups" / "objects").glob("*/*.gz"))
+
+    def test_identical_snapshots_share_one_blob(self):
+        """Test unchanged content is stored once."""
+        first = self.store.backup(self.plugin_json, when=datetime(2026, 2, 1, 10))
+        second = self.store.backup(self.plugin_json, when=datetime(2026, 2, 1, 11))
+
+        self.assertEqual(first.blob, second.blob)
+        self.assertEqual(len(self.store.snapshots), 2)
+        self.assertEqual(len(self.blobs()), 1)
+
+    def test_restore_round_trip(self):
+        """Test restore brings back the exact bytes of a snapshot."""
+        snapshot = self.store.backup(self.plugin_json)
+        self.plugin_json.write_text('{"version": "2"}\n')
+
+        reopened = BackupStore(self.root / "backups")
+        reopened.restore(reopened.get(snapshot.id), self.plugin_json)
+        self.assertEqual(self.plugin_json.read_text(), '{"version": "1"}\n')
+
+    def test_corrupted_blob_detected(self):
+        """Test restore refuses a blob whose hash no longer matches."""
+        import gzip
+        snapshot = self.store.backup(self.plugin_json)
+        self.store.blob_path(snapshot.blob).write_bytes(gzip.compress(b"tampered"))
+        with self.assertRaises(BackupError):
+            self.store.read(snapshot)
+
+    def test_retention_evicts_and_collects_garbage(self):
+        """Test keep-last/daily/weekly rules and blob garbage collection."""
+        start = datetime(2026, 1, 1, 12)
+        for day in range(30):
+            self.plugin_json.write_text(f'{{"day": {day}}}\n')
+            self.store.backup(self.plugin_json, when=start + timedelta(days=day))
+
+        evicted = self.store.prune(RetentionPolicy(keep_last=2, keep_daily=3, keep_weekly=4))
+
+        kept = sorted(s.created[:10] for s in self.store.snapshots)
+        # Last 3 days (covers keep_last=2) plus the Sundays closing 3 earlier
+        # ISO weeks (the current week is already covered by 2026-01-30)
+        self.assertEqual(kept, ["2026-01-11", "2026-01-18", "2026-01-25",
+                                "2026-01-28", "2026-01-29", "2026-01-30"])
+        self.assertEqual(len(evicted), 24)
+        self.assertEqual(len(self.blobs()), 6)
+
+    def test_import_legacy(self):
+        """Test plugin.json.<ts>.backup files become snapshots."""
+        legacy = self.root / "backups" / "plugin.json.20260212_001931.backup"
+        legacy.parent.mkdir(exist_ok=True)
+        legacy.write_text('{"legacy": true}\n')
+
+        self.assertEqual(self.store.import_legacy(), 1)
+        self.assertEqual(self.store.import_legacy(), 0)
+        self.assertEqual(self.store.get("20260212_001931").file, "plugin.json")
+
+    def test_mcp_merger_backup(self):
+        """Test McpMerger.backup_current writes into the store."""
+        merger = McpMerger(self.root)
+        path = merger.backup_current()
+        merger.backup_current()
+
+        self.assertTrue(path.exists())
+        self.assertEqual(len(BackupStore(self.root / "backups").snapshots), 2)
+        self.assertEqual(len(self.blobs()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Test suite for benchmark_history.py
+
+Run tests with:
+    python -m pytest tests/test_benchmark_history.py -v
+"""
+
+import unittest
+import sys
+import json
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from benchmark_history import HistoryStore, flatten_metrics, parse_thresholds
+
+
+class TestHistoryStore(unittest.TestCase):
+    """Test ingestion and regression detection."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        self.results = self.root / "results"
+        self.results.mkdir()
+        self.store = HistoryStore(self.root / "history.sqlite", self.root)
+
+    def tearDown(self):
+        self.store.close()
+
+    def write_result(self, name: str, data: dict) -> Path:
+        path = self.results / name
+        path.write_text(json.dumps(data))
+        return path
+
+    def test_flatten_metrics(self):
+        """Test numeric leaves become dotted metric names."""
+        data = {"a": {"b": 1, "c": "text", "d": True}, "e": 2.5}
+        self.assertEqual(dict(flatten_metrics(data)), {"a.b": 1.0, "e": 2.5})
+
+    def test_ingest_is_idempotent(self):
+        """Test re-ingesting the same files adds nothing."""
+        self.write_result("benchmark_20251121_121132.json",
+                          {"timestamp": "20251121_121132", "git_commit": "abc",
+                           "plugin_metrics": {"estimated_tokens": 100}})
+        self.assertEqual(self.store.ingest([self.results]), 1)
+        self.assertEqual(self.store.ingest([self.results]), 0)
+        self.assertEqual(
+            self.store.series("plugin_metrics.estimated_tokens"),
+            [("benchmark", "2025-11-21T12:11:32", "abc", 100.0)]
+        )
+
+    def test_token_regression_detected(self):
+        """Test token growth beyond the threshold is flagged."""
+        for stamp, tokens in [("20251101_000000", 1000), ("20251102_000000", 1200)]:
+            self.write_result(f"benchmark_{stamp}.json",
+                              {"timestamp": stamp, "git_commit": stamp,
+                               "plugin_metrics": {"estimated_tokens": tokens}})
+        self.store.ingest([self.results])
+
+        regressions = self.store.detect_regressions(parse_thresholds([]))
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0].metric, "plugin_metrics.estimated_tokens")
+        self.assertAlmostEqual(regressions[0].change_pct, 20.0)
+
+        relaxed = self.store.detect_regressions(
+            parse_thresholds(["plugin_metrics.estimated_tokens=50"])
+        )
+        self.assertEqual(relaxed, [])
+
+    def test_glob_overrides_win_over_defaults(self):
+        """Test a broad user glob takes precedence over a default threshold."""
+        for stamp, tokens in [("20251101_000000", 1000), ("20251102_000000", 1030)]:
+            self.write_result(f"benchmark_{stamp}.json",
+                              {"timestamp": stamp, "git_commit": stamp,
+                               "plugin_metrics": {"estimated_tokens": tokens}})
+        self.store.ingest([self.results])
+
+        self.assertEqual(self.store.detect_regressions(parse_thresholds([])), [])
+        for override in ("*tokens=1", "plugin_metrics.*=1"):
+            regressions = self.store.detect_regressions(parse_thresholds([override]))
+            self.assertEqual([r.threshold_pct for r in regressions], [1.0], override)
+
+    def test_malformed_threshold(self):
+        """Test malformed overrides raise ValueError, not an argparse error."""
+        for bad in ("no-equals", "=5", "tokens=lots"):
+            with self.assertRaises(ValueError):
+                parse_thresholds([bad])
+
+    def test_sync_latency_regression(self):
+        """Test sync reports feed the duration series."""
+        for i, duration in enumerate([10.0, 20.0]):
+            self.write_result(f"sync-report-{i}.json", {
+                "success": True, "timestamp": f"2026-02-1{i}T16:00:00",
+                "framework_commit": "f", "files_synced": 1,
+                "duration_seconds": duration,
+            })
+        self.store.ingest([self.results])
+
+        regressions = self.store.detect_regressions(parse_thresholds([]))
+        self.assertEqual([(r.kind, r.metric) for r in regressions],
+                         [("sync_report", "duration_seconds")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Test suite for build_cache.py
+
+Run tests with:
+    python -m pytest tests/test_build_cache.py -v
+"""
+
+import subprocess
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from build_cache import BuildCache, make_key, tree_id
+
+
+class TestBuildCache(unittest.TestCase):
+    """Test storing, restoring and evicting output sets"""
+
+    def setUp(self):
+        self.root = Path(mkdtemp()) / '.sync-cache'
+
+    def test_round_trip_across_instances(self):
+        """Test an output set survives reopening the cache"""
+        key = make_key("git:abc", "sc-", "command", "rules")
+        BuildCache(self.root).put(key, "commands", {"build.md": "# /sc:build\n", "日本.md": "テスト"})
+
+        cache = BuildCache(self.root)
+        self.assertEqual(cache.get(key), {"build.md": "# /sc:build\n", "日本.md": "テスト"})
+        self.assertIsNone(cache.get(make_key("git:other")))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_key_depends_on_every_part(self):
+        """Test changing any key part gives a different key"""
+        base = make_key("tree", "sc-", "command", "rules")
+        self.assertEqual(base, make_key("tree", "sc-", "command", "rules"))
+        self.assertNotEqual(base, make_key("tree", "sc-", "command", "rules2"))
+        self.assertNotEqual(base, make_key("tree", "sc-", "agent", "rules"))
+
+    def test_evicts_least_recently_used(self):
+        """Test the size cap evicts the entry used longest ago"""
+        cache = BuildCache(self.root)
+        payload = {"f.md": "x" * 50}
+        cache.put("a" * 64, "m", payload)
+        cache.put("b" * 64, "m", payload)
+        size = cache.entries["a" * 64].size
+        cache.entries["a" * 64].last_used = 1
+        cache.entries["b" * 64].last_used = 2
+        cache.get("a" * 64)  # a is now the most recently used
+
+        cache.max_bytes = size * 2
+        cache.put("c" * 64, "m", payload)
+        self.assertEqual(set(cache.entries), {"a" * 64, "c" * 64})
+        self.assertFalse(cache.entry_path("b" * 64).exists())
+
+        evicted = cache.prune(max_bytes=0)
+        self.assertEqual(len(evicted), 2)
+        self.assertEqual(cache.total_bytes, 0)
+
+    def test_corrupt_entry_is_dropped(self):
+        """Test an unreadable entry counts as a miss and is removed"""
+        cache = BuildCache(self.root)
+        key = "d" * 64
+        cache.put(key, "m", {"f.md": "text"})
+        cache.entry_path(key).write_bytes(b"not gzip")
+        self.assertIsNone(cache.get(key))
+        self.assertNotIn(key, BuildCache(self.root).entries)
+
+
+class TestTreeId(unittest.TestCase):
+    """Test source subtree ids"""
+
+    def setUp(self):
+        self.repo = Path(mkdtemp())
+        (self.repo / "src/commands").mkdir(parents=True)
+        (self.repo / "src/commands/build.md").write_text("# /build\n")
+
+    def test_content_digest_outside_git(self):
+        """Test the id follows content when there is no repository"""
+        first = tree_id(self.repo, "src/commands")
+        self.assertTrue(first.startswith("sha256:"))
+        self.assertEqual(first, tree_id(self.repo, "src/commands"))
+        (self.repo / "src/commands/build.md").write_text("# /build v2\n")
+        self.assertNotEqual(first, tree_id(self.repo, "src/commands"))
+
+    def test_git_tree_id_when_clean(self):
+        """Test a committed subtree is identified by its git tree id"""
+        def git(*args):
+            return subprocess.run(['git', *args], cwd=self.repo, check=True,
+                                  capture_output=True, text=True).stdout.strip()
+        git('init', '-q')
+        git('add', '.')
+        git('-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-q', '-m', 'init')
+
+        self.assertEqual(tree_id(self.repo, "src/commands"), f"git:{git('rev-parse', 'HEAD:src/commands')}")
+        # Uncommitted edits must not be hidden behind the committed tree id
+        (self.repo / "src/commands/build.md").write_text("edited\n")
+        self.assertTrue(tree_id(self.repo, "src/commands").startswith("sha256:"))
+
+
+if __name__ == '__main__':
+    unittest.main()
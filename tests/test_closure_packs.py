@@ -0,0 +1,73 @@
+"""
+Test suite for closure_packs.py
+
+Run tests with:
+    python -m pytest tests/test_closure_packs.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from closure_packs import build_packs, load_packs, pack_files, write_packs
+
+
+def write_tree(root: Path, files: dict):
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+
+
+class TestClosurePacks(unittest.TestCase):
+    """Test per-command dependency closures."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        write_tree(self.root, {
+            "commands/sc-pm.md": "# /sc:pm\n\nDelegate to @agent-sc-pm-agent, then /sc:implement.\n",
+            "commands/sc-implement.md": "# /sc:implement\n\nFollow RULES.md.\n",
+            "agents/sc-pm-agent.md": (
+                "---\nname: sc-pm-agent\n---\n\nUses MODE_Brainstorming.md and /sc:pm.\n"
+            ),
+            "modes/MODE_Brainstorming.md": "# Brainstorming\n",
+            "core/RULES.md": "# Rules\n",
+        })
+
+    def test_transitive_closure_stops_at_commands(self):
+        """Test packs follow agents into modes but not into other commands."""
+        manifest = build_packs(self.root)
+
+        self.assertEqual(
+            pack_files(manifest, "/sc:pm"),
+            ["commands/sc-pm.md", "agents/sc-pm-agent.md", "modes/MODE_Brainstorming.md"]
+        )
+        self.assertEqual(manifest["packs"]["sc:pm"]["commands"], ["sc:implement"])
+        self.assertEqual(pack_files(manifest, "implement"),
+                         ["commands/sc-implement.md", "core/RULES.md"])
+
+    def test_token_totals(self):
+        """Test a pack's total is the sum of its files and below the corpus total."""
+        manifest = build_packs(self.root)
+        pack = manifest["packs"]["sc:pm"]
+
+        self.assertEqual(pack["tokens"], sum(tokens for _, _, tokens in pack["files"]))
+        self.assertLess(pack["tokens"], manifest["corpus_tokens"])
+
+    def test_write_and_load(self):
+        """Test the written manifest loads back and unknown commands raise."""
+        path = self.root / ".claude-plugin" / "closure-packs.json"
+        written = write_packs(self.root)
+
+        self.assertEqual(load_packs(path), written)
+        self.assertIsNone(load_packs(self.root / "missing.json"))
+        with self.assertRaises(KeyError):
+            pack_files(written, "sc:missing")
+
+
+if __name__ == '__main__':
+    unittest.main()
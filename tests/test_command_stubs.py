@@ -0,0 +1,143 @@
+"""
+Test suite for command_stubs.py
+
+Run tests with:
+    python -m pytest tests/test_command_stubs.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from closure_packs import DEFAULT_PACKS_PATH, load_packs, pack_files
+from command_stubs import BODIES_DIR, command_file, join_commands, make_stub, split_commands
+from content_registry import ContentRegistry
+from corpus_index import validate_corpus
+from plugin_bundle import BundleReader, pack
+from sync_from_framework import FrameworkSyncer
+
+PM = '---\ndescription: "Project manager"\npersonas: [pm-agent]\n---\n\n# /sc:pm\n\n' + "Spec line.\n" * 200
+
+
+class TestCommandStubs(unittest.TestCase):
+    """Test the stub + deferred body layout."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        (self.root / "commands").mkdir()
+        (self.root / "commands" / "sc-pm.md").write_text(PM)
+        (self.root / "commands" / "sc-bare.md").write_text("# /sc:bare\n\nNo frontmatter.\n")
+
+    def test_stub_keeps_frontmatter_only(self):
+        """Test a stub is the frontmatter plus a one-line pointer."""
+        stub = make_stub(PM, "command-bodies/sc-pm.md")
+        self.assertTrue(stub.startswith('---\ndescription: "Project manager"\npersonas: [pm-agent]\n---\n\n'))
+        self.assertIn("command-bodies/sc-pm.md", stub)
+        self.assertNotIn("Spec line.", stub)
+        self.assertEqual(stub.count("\n"), 6)
+
+    def test_split_reports_upfront_reduction(self):
+        """Test split writes stubs and bodies and reports the bytes saved."""
+        report = split_commands(self.root)
+
+        self.assertEqual(report.commands, 2)
+        self.assertEqual(report.full_bytes, len(PM) + len("# /sc:bare\n\nNo frontmatter.\n"))
+        self.assertEqual(report.stub_bytes,
+                         sum(p.stat().st_size for p in (self.root / "commands").iterdir()))
+        self.assertGreater(report.reduction, 0.8)
+        self.assertEqual((self.root / BODIES_DIR / "sc-pm.md").read_text(), PM)
+        self.assertIn("description:", (self.root / "commands" / "sc-pm.md").read_text())
+
+        # A command smaller than its stub would be stays whole
+        self.assertEqual(report.files["sc-bare.md"], [28, 28])
+        self.assertFalse((self.root / BODIES_DIR / "sc-bare.md").exists())
+
+    def test_report_only_writes_nothing(self):
+        """Test a dry run measures without touching the tree."""
+        report = split_commands(self.root, dry_run=True)
+        self.assertEqual(report.commands, 2)
+        self.assertEqual((self.root / "commands" / "sc-pm.md").read_text(), PM)
+        self.assertFalse((self.root / BODIES_DIR).exists())
+
+    def test_split_is_idempotent_and_drops_stale_bodies(self):
+        """Test splitting stubs again keeps bodies; removed commands lose theirs."""
+        (self.root / "commands" / "sc-old.md").write_text(PM)
+        first = split_commands(self.root)
+        self.assertTrue((self.root / BODIES_DIR / "sc-old.md").exists())
+        (self.root / "commands" / "sc-old.md").unlink()
+        second = split_commands(self.root)
+
+        self.assertEqual(second.files["sc-pm.md"], first.files["sc-pm.md"])
+        self.assertEqual((self.root / BODIES_DIR / "sc-pm.md").read_text(), PM)
+        self.assertFalse((self.root / BODIES_DIR / "sc-old.md").exists())
+
+    def test_join_restores_full_files(self):
+        """Test join puts the exact original files back."""
+        split_commands(self.root)
+        self.assertEqual(join_commands(self.root), 1)
+        self.assertEqual((self.root / "commands" / "sc-pm.md").read_text(), PM)
+        self.assertFalse((self.root / BODIES_DIR).exists())
+
+    def test_command_file_resolves_stubs_only(self):
+        """Test a stub resolves to its body; a full file ignores a stale body."""
+        split_commands(self.root)
+        stub = self.root / "commands" / "sc-pm.md"
+        self.assertEqual(command_file(self.root, stub), self.root / BODIES_DIR / "sc-pm.md")
+        bare = self.root / "commands" / "sc-bare.md"
+        self.assertEqual(command_file(self.root, bare), bare)
+
+        stub.write_text(PM)
+        self.assertEqual(command_file(self.root, stub), stub)
+
+
+class TestStubsLayoutSync(unittest.TestCase):
+    """Test a stubs-layout sync serves the full command text downstream."""
+
+    def setUp(self):
+        self.framework = Path(mkdtemp())
+        self.plugin = Path(mkdtemp())
+        source = self.framework / "src/superclaude"
+        (source / "commands").mkdir(parents=True)
+        (source / "agents").mkdir(parents=True)
+        (source / "commands" / "pm.md").write_text(PM + "Delegate to @agent-sc-planner.\n")
+        (source / "agents" / "planner.md").write_text("---\nname: planner\n---\n\n# Planner\n")
+
+        syncer = FrameworkSyncer("unused", self.plugin, layout="stubs")
+        syncer._sync_content(self.framework)
+        syncer._apply_layout()
+        syncer._build_closure_packs()
+        self.body = (self.plugin / BODIES_DIR / "sc-pm.md").read_text()
+
+    def test_stub_written(self):
+        """Test the command file is a stub and the body holds the full text."""
+        self.assertNotIn("Spec line.", (self.plugin / "commands" / "sc-pm.md").read_text())
+        self.assertIn("Spec line.", self.body)
+
+    def test_packs_list_body(self):
+        """Test closure packs point at the body and follow its references."""
+        manifest = load_packs(self.plugin / DEFAULT_PACKS_PATH)
+        self.assertEqual(pack_files(manifest, "sc:pm"),
+                         [f"{BODIES_DIR}/sc-pm.md", "agents/sc-planner.md"])
+
+    def test_registry_and_index_read_body(self):
+        """Test the registry serves the body and validation sees its references."""
+        registry = ContentRegistry.open(self.plugin)
+        self.assertEqual(registry.body(registry.get_command("sc:pm")), self.body)
+        _, warnings = validate_corpus(self.plugin)
+        self.assertEqual(warnings, [])
+
+    def test_bundle_serves_body(self):
+        """Test the bundle ships the body under the command's name."""
+        bundle = self.plugin / "plugin.bundle"
+        pack(self.plugin, bundle)
+        with BundleReader(bundle) as reader:
+            self.assertEqual(reader.read("sc:pm").decode(), self.body)
+            self.assertIn(f"{BODIES_DIR}/sc-pm.md", [e.path for e in reader.entries])
+
+
+if __name__ == '__main__':
+    unittest.main()
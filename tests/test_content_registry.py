@@ -0,0 +1,98 @@
+"""
+Test suite for content_registry.py
+
+Run tests with:
+    python -m pytest tests/test_content_registry.py -v
+"""
+
+import os
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from content_registry import BodyCache, ContentRegistry, read_header
+
+
+class TestContentRegistry(unittest.TestCase):
+    """Test lookups, lazy bodies and invalidation."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        (self.root / "commands").mkdir()
+        (self.root / "agents").mkdir()
+        (self.root / "modes").mkdir()
+        self.command = self.root / "commands" / "sc-implement.md"
+        self.command.write_text("---\nname: implement\ncategory: workflow\n---\n# /sc:implement\nbody\n")
+        (self.root / "agents" / "sc-helper.md").write_text("---\nname: sc-helper\n---\nagent body\n")
+        (self.root / "modes" / "MODE_Focus.md").write_text("# Focus Mode\n")
+        self.registry = ContentRegistry.open(self.root)
+
+    def touch(self, path, text):
+        # Bump mtime explicitly so the change is visible on coarse-mtime filesystems
+        stat = path.stat()
+        path.write_text(text)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_lookups(self):
+        """Test commands, agents and modes resolve by name and alias."""
+        self.assertEqual(self.registry.get_command("sc:implement").get("category"), "workflow")
+        self.assertIs(self.registry.get_command("implement"), self.registry.get_command("sc:implement"))
+        self.assertIsNotNone(self.registry.get_agent("helper"))
+        self.assertIsNotNone(self.registry.get_mode("MODE_Focus"))
+        self.assertIsNone(self.registry.get_command("sc:missing"))
+        self.assertEqual(len(self.registry), 3)
+
+    def test_header_read_stops_at_frontmatter(self):
+        """Test only the frontmatter is read at open time."""
+        self.assertEqual(read_header(self.command), "---\nname: implement\ncategory: workflow\n---\n")
+        self.assertEqual(len(self.registry.cache), 0)
+
+    def test_body_cached_until_file_changes(self):
+        """Test bodies are cached and reloaded when mtime changes."""
+        entry = self.registry.get_command("sc:implement")
+        self.assertIn("body", self.registry.body(entry))
+        self.registry.body(entry)
+        self.assertEqual(self.registry.cache.hits, 1)
+
+        self.touch(self.command, "---\nname: implement\ncategory: quality\n---\nnew body\n")
+        self.assertEqual(self.registry.body(entry), "---\nname: implement\ncategory: quality\n---\nnew body\n")
+        self.assertEqual(self.registry.get_command("sc:implement").get("category"), "quality")
+
+    def test_deleted_file_disappears(self):
+        """Test a deleted file is dropped on next lookup."""
+        self.command.unlink()
+        self.assertIsNone(self.registry.get_command("sc:implement"))
+
+    def test_nested_files(self):
+        """Test files in nested directories are registered on refresh."""
+        nested = self.root / "agents" / "ContextEngineering"
+        nested.mkdir()
+        (nested / "sc-context-agent.md").write_text("---\nname: sc-context-agent\n---\n")
+        (nested / "README.md").write_text("# Overview\n")
+        self.registry.refresh()
+        self.assertIsNotNone(self.registry.get_agent("context-agent"))
+        self.assertEqual(len(self.registry), 4)
+
+
+class TestBodyCache(unittest.TestCase):
+    """Test byte-bounded LRU eviction."""
+
+    def test_eviction_order(self):
+        """Test least recently used bodies are evicted first."""
+        cache = BodyCache(max_bytes=10)
+        cache.put(Path("a"), (1, 4), "aaaa")
+        cache.put(Path("b"), (1, 4), "bbbb")
+        cache.get(Path("a"), (1, 4))
+        cache.put(Path("c"), (1, 4), "cccc")
+
+        self.assertEqual(cache.paths(), [Path("a"), Path("c")])
+        self.assertEqual(cache.current_bytes, 8)
+        self.assertIsNone(cache.get(Path("a"), (2, 4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Test suite for context_simulator.py
+
+Run tests with:
+    python -m pytest tests/test_context_simulator.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from context_simulator import (
+    ContextSimulator, CorpusCosts, ScenarioError, load_scenarios, parse_steps
+)
+
+
+class TestContextSimulator(unittest.TestCase):
+    """Test scenario parsing and strategy costing."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        files = {
+            "commands/sc-implement.md": "---\ndescription: i\n---\n" + "i" * 400 + " /sc:test, MODE_Brainstorming.md\n",
+            "commands/sc-test.md": "---\ndescription: t\n---\n" + "t" * 800 + "\n",
+            "agents/sc-python-expert.md": "---\nname: sc-python-expert\n---\n" + "p" * 1600 + "\n",
+            "modes/MODE_Brainstorming.md": "b" * 160,
+        }
+        for rel, text in files.items():
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+        self.costs = CorpusCosts.from_tree(self.root, "chars")
+
+    def cost(self, node_id: str) -> int:
+        return self.costs.full[self.costs.ids.index(node_id)]
+
+    def test_parse_steps(self):
+        """Test session sentences resolve to corpus items."""
+        steps = parse_steps(
+            "invokes /sc:implement then /sc:test with sc-python-expert", self.costs
+        )
+        self.assertEqual(
+            [self.costs.ids[i] for i in steps],
+            ["command/sc:implement", "command/sc:test", "agent/sc-python-expert"]
+        )
+        with self.assertRaises(ScenarioError):
+            parse_steps("invokes /sc:nonexistent", self.costs)
+
+    def test_strategies(self):
+        """Test startup and on-demand cost per loading strategy."""
+        scenarios = load_scenarios(
+            {"scenarios": ["invokes /sc:implement with sc-python-expert"]}, self.costs
+        )
+        report = ContextSimulator(self.costs).run(scenarios, sessions=100)
+        strategies = report["strategies"]
+
+        self.assertEqual(report["unique_sessions"], 1)
+        self.assertEqual(strategies["upfront"]["startup_tokens"], sum(self.costs.full))
+        self.assertEqual(strategies["upfront"]["mean_on_demand_tokens"], 0)
+        self.assertEqual(strategies["lazy"]["startup_tokens"], 0)
+        invoked = self.cost("command/sc:implement") + self.cost("agent/sc-python-expert")
+        self.assertEqual(strategies["lazy"]["mean_total_tokens"], invoked)
+        # Closure pulls in the referenced mode but stops at /sc:test, like a closure pack
+        self.assertEqual(
+            strategies["closure"]["mean_total_tokens"], invoked + self.cost("mode/MODE_Brainstorming")
+        )
+        # Stubs trade startup cost for smaller on-demand loads
+        stubs = strategies["frontmatter_stubs"]
+        self.assertGreater(stubs["startup_tokens"], 0)
+        self.assertLess(stubs["mean_on_demand_tokens"], invoked)
+
+    def test_random_sessions_are_reproducible(self):
+        """Test the seed fixes the synthetic session mix."""
+        scenarios = load_scenarios({"scenarios": [{"random_commands": [1, 2]}]}, self.costs)
+        simulator = ContextSimulator(self.costs)
+        self.assertEqual(
+            simulator.sample(scenarios, 500, seed=3),
+            simulator.sample(scenarios, 500, seed=3)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
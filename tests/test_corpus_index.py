@@ -0,0 +1,122 @@
+"""
+Test suite for corpus_index.py
+
+Run tests with:
+    python -m pytest tests/test_corpus_index.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from corpus_index import CorpusIndex, validate_corpus
+
+
+def write_tree(root: Path, files: dict):
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+
+
+class TestCorpusIndex(unittest.TestCase):
+    """Test cross-reference graph construction."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        write_tree(self.root, {
+            "commands/sc-pm.md": (
+                "---\ndescription: PM\npersonas: [pm-agent, architect]\n---\n\n"
+                "# /sc:pm\n\nThen run /sc:sc:implement or /sc:missing.\n"
+                "Follows MODE_Brainstorming.md and RULES.md.\n"
+            ),
+            "commands/sc-implement.md": "# /sc:implement\n\nAsk @agent-ghost.\n",
+            "agents/sc-pm-agent.md": "---\nname: sc-pm-agent\n---\n\nUse `/sc:pm`.\n",
+            "agents/sc-lonely.md": "---\nname: sc-lonely\n---\n\nNobody calls me.\n",
+            "modes/MODE_Brainstorming.md": "# Brainstorming\n",
+            "core/RULES.md": "# Rules\n",
+        })
+
+    def test_nodes_and_edges(self):
+        """Test every corpus file becomes a node with resolved edges."""
+        index = CorpusIndex.build(self.root)
+
+        self.assertIn("command/sc:pm", index.nodes)
+        self.assertIn("agent/sc-pm-agent", index.nodes)
+        self.assertEqual(
+            index.edges["command/sc:pm"],
+            {"command/sc:implement", "agent/sc-pm-agent",
+             "mode/MODE_Brainstorming", "core/RULES"}
+        )
+        self.assertEqual(index.edges["agent/sc-pm-agent"], {"command/sc:pm"})
+
+    def test_dangling_references(self):
+        """Test unresolved commands and agent mentions are reported."""
+        index = CorpusIndex.build(self.root)
+
+        self.assertEqual(
+            index.dangling_references(),
+            [("commands/sc-implement.md", "agent/ghost"),
+             ("commands/sc-pm.md", "command/sc:missing")]
+        )
+        # Abstract personas are not agents and never dangle
+        self.assertNotIn("agent/architect", index.dangling["command/sc:pm"])
+
+    def test_orphans(self):
+        """Test unreferenced agents are reported as orphans."""
+        index = CorpusIndex.build(self.root)
+        self.assertEqual(index.orphans(), ["agent/sc-lonely"])
+
+    def test_closure(self):
+        """Test closures follow edges transitively and can be limited by kind."""
+        index = CorpusIndex.build(self.root)
+
+        self.assertIn("command/sc:implement", index.closure("agent/sc-pm-agent"))
+        self.assertEqual(
+            index.closure("command/sc:pm", ("agent", "mode", "core")),
+            {"command/sc:pm", "agent/sc-pm-agent", "mode/MODE_Brainstorming", "core/RULES"}
+        )
+
+    def test_nested_files(self):
+        """Test files in nested directories are nodes; nested READMEs are not."""
+        write_tree(self.root, {
+            "agents/ContextEngineering/sc-context-agent.md": "---\nname: sc-context-agent\n---\n",
+            "agents/ContextEngineering/README.md": "Overview of /sc:gone\n",
+            "commands/sc-implement.md": "# /sc:implement\n\nAsk @agent-context-agent.\n",
+        })
+        index = CorpusIndex.build(self.root)
+
+        node = index.nodes["agent/sc-context-agent"]
+        self.assertEqual(Path(node.path).as_posix(), "agents/ContextEngineering/sc-context-agent.md")
+        self.assertEqual(index.edges["command/sc:implement"], {"agent/sc-context-agent"})
+        self.assertNotIn(("agents/ContextEngineering/README.md", "command/sc:gone"),
+                         index.dangling_references())
+        self.assertNotIn("agent/README", index.nodes)
+
+    def test_validate_corpus_warnings(self):
+        """Test validation warns per dangling reference and only logs orphans."""
+        with self.assertLogs('corpus_index', level='DEBUG') as logs:
+            _, warnings = validate_corpus(self.root)
+        self.assertEqual(len(warnings), 2)
+        self.assertTrue(any("sc:missing" in w for w in warnings))
+        self.assertFalse(any("sc-lonely" in w for w in warnings))
+        self.assertTrue(any("Orphaned node: agent/sc-lonely" in line for line in logs.output))
+
+    def test_scan_references_matches_full_scan(self):
+        """Test the prefiltered scan finds exactly what the full pattern finds."""
+        text = "".join(
+            (self.root / rel).read_text(encoding='utf-8')
+            for rel in ("commands/sc-pm.md", "commands/sc-implement.md", "agents/sc-pm-agent.md")
+        ) + "no hints here\nsc-x-y MODE_Flow.md\n/sc:end"
+        self.assertEqual(
+            [m.span() for m in CorpusIndex.scan_references(text)],
+            [m.span() for m in CorpusIndex.REFERENCE_PATTERN.finditer(text)]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
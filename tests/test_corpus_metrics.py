@@ -0,0 +1,96 @@
+"""
+Test suite for corpus_metrics.py
+
+Run tests with:
+    python -m pytest tests/test_corpus_metrics.py -v
+"""
+
+import unittest
+import sys
+import json
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from corpus_metrics import (
+    CorpusWalker, MetricsReport, SCHEMA_VERSION, collect_metrics, percentile, write_report
+)
+
+
+class TestPercentile(unittest.TestCase):
+    """Test nearest-rank percentiles."""
+
+    def test_percentiles(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile([7], 95), 7)
+        self.assertEqual(percentile([], 50), 0)
+
+
+class TestCorpusMetrics(unittest.TestCase):
+    """Test single-pass metric collection."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        files = {
+            "commands/sc-help.md": 400,
+            "commands/sc-build.md": 800,
+            "agents/sc-backend-architect.md": 1200,
+            "modes/MODE_Brainstorming.md": 40,
+            "core/RULES.md": 80,
+            "README.md": 100,
+            "scripts/tool.py": 999,
+            ".git/objects/blob.md": 5000,
+        }
+        for rel, size in files.items():
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x" * size)
+
+    def test_serial_and_parallel_walks_agree(self):
+        """Test the thread-pool walk lists the same files."""
+        serial = CorpusWalker(self.root).walk()
+        parallel = CorpusWalker(self.root, workers=4).walk()
+        self.assertEqual(serial, parallel)
+        self.assertNotIn(".git/objects/blob.md", [s.rel_path for s in serial])
+
+    def test_script_metrics(self):
+        """Test the metrics the shell scripts computed."""
+        report = MetricsReport(CorpusWalker(self.root).walk()).build()
+
+        metrics = report["plugin_metrics"]
+        self.assertEqual(metrics["markdown_files"], 6)
+        self.assertEqual(metrics["markdown_size_bytes"], 2620)
+        self.assertEqual(metrics["estimated_tokens"], 655)
+        self.assertEqual(metrics["commands"], 2)
+
+        commands = report["component_breakdown"]["commands"]
+        self.assertEqual(commands["total_bytes"], 1200)
+        self.assertEqual(commands["avg_tokens"], 150)
+
+        help_scenario = report["usage_scenarios"]["scenario_1_help_command"]
+        self.assertEqual(help_scenario["mcp_tokens"], 100)
+        self.assertEqual(help_scenario["overhead_tokens"], 555)
+
+    def test_distributions(self):
+        """Test per-category p50/p95 distributions."""
+        report = MetricsReport(CorpusWalker(self.root).walk()).build()
+        commands = report["distributions"]["commands"]
+        self.assertEqual(commands["size_bytes"]["p50"], 400)
+        self.assertEqual(commands["size_bytes"]["p95"], 800)
+        self.assertEqual(commands["tokens"]["p95"], 200)
+
+    def test_write_report(self):
+        """Test schema-versioned JSON is written to the results dir."""
+        report = collect_metrics(self.root)
+        path = write_report(report, self.root / "benchmark" / "results")
+        data = json.loads(path.read_text())
+        self.assertEqual(data["schema_version"], SCHEMA_VERSION)
+        self.assertTrue(path.name.startswith("metrics_"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Test suite for delta_update.py
+
+Run tests with:
+    python -m pytest tests/test_delta_update.py -v
+"""
+
+import subprocess
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from delta_update import (
+    DeltaError, apply_ops, apply_package, create_package, line_ops,
+    read_directory, read_git_ref, read_package, write_package
+)
+
+
+def make_tree(root: Path, files: dict) -> Path:
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return root
+
+
+OLD = {
+    "plugin.json": b'{"version": "4.4.0"}\n',
+    "commands/sc-build.md": b"".join(b"line %d\n" % i for i in range(200)),
+    "commands/sc-gone.md": b"bye\n",
+    "core/logo.bin": b"\x89PNG\x00\x01",
+    "README.md": b"not shipped\n",
+}
+NEW = {
+    "plugin.json": b'{"version": "4.4.1"}\n',
+    "commands/sc-build.md": OLD["commands/sc-build.md"].replace(b"line 100\n", b"changed\n"),
+    "commands/sc-new.md": b"# /sc:new\n",
+    "core/logo.bin": b"\x89PNG\x00\x02",
+    "README.md": b"edited but not shipped\n",
+}
+
+
+class TestLineOps(unittest.TestCase):
+    """Test the line edit scripts."""
+
+    def test_round_trip(self):
+        """Test applying ops to the old text gives the new text exactly."""
+        old = "a\nb\nc\nd"
+        new = "a\nx\nc\nd\ne\n"
+        self.assertEqual(apply_ops(old, line_ops(old, new)), new)
+
+
+class TestDeltaPackage(unittest.TestCase):
+    """Test package creation and in-place application."""
+
+    def setUp(self):
+        self.old = make_tree(Path(mkdtemp()), OLD)
+        self.new = make_tree(Path(mkdtemp()), NEW)
+
+    def test_package_contents(self):
+        """Test only shipped changes are included, as patches where smaller."""
+        package = create_package(read_directory(self.old), read_directory(self.new))
+        ops = {c["path"]: c["op"] for c in package["changes"]}
+
+        self.assertEqual(ops, {
+            "commands/sc-build.md": "patch",
+            "commands/sc-gone.md": "remove",
+            "commands/sc-new.md": "add",
+            "core/logo.bin": "replace",
+            "plugin.json": "replace",
+        })
+        self.assertEqual((package["from"]["plugin_version"], package["to"]["plugin_version"]),
+                         ("4.4.0", "4.4.1"))
+
+    def test_apply_in_place(self):
+        """Test applying a written package reproduces the new tree."""
+        path = self.old / "delta.json.gz"
+        write_package(create_package(read_directory(self.old), read_directory(self.new)), path)
+
+        counts = apply_package(read_package(path), self.old)
+        self.assertEqual(counts, {"written": 4, "removed": 1})
+        self.assertEqual(read_directory(self.old), read_directory(self.new))
+
+    def test_wrong_base_refused(self):
+        """Test a tree that is not the package base is left untouched."""
+        package = create_package(read_directory(self.old), read_directory(self.new))
+        (self.old / "commands/sc-gone.md").write_bytes(b"locally edited\n")
+        before = read_directory(self.old)
+
+        with self.assertRaises(DeltaError):
+            apply_package(package, self.old)
+        self.assertEqual(read_directory(self.old), before)
+
+    def test_unsafe_paths_refused(self):
+        """Test paths leaving the shipped tree are rejected before anything is written."""
+        package = create_package(read_directory(self.old), read_directory(self.new))
+        outside = self.old.parent / f"{self.old.name}-escaped.md"
+        for path in (f"../{outside.name}", str(outside), "README.md", "commands/../../x.md"):
+            package["changes"].append({"path": path, "op": "add", "after": "0", "text": "x"})
+            with self.assertRaises(DeltaError):
+                apply_package(package, self.old)
+            package["changes"].pop()
+        self.assertFalse(outside.exists())
+        self.assertEqual(read_directory(self.old), read_directory(make_tree(Path(mkdtemp()), OLD)))
+
+    def test_missing_or_changed_targets_refused(self):
+        """Test patch targets must exist and match the change's before hash."""
+        package = create_package(read_directory(self.old), read_directory(self.new))
+        patch = next(c for c in package["changes"] if c["op"] == "patch")
+
+        missing = dict(patch, path="commands/sc-missing.md")
+        with self.assertRaisesRegex(DeltaError, "does not exist"):
+            apply_package(dict(package, changes=[missing]), self.old)
+
+        stale = dict(patch, before="0" * 64)
+        with self.assertRaisesRegex(DeltaError, "differs"):
+            apply_package(dict(package, changes=[stale]), self.old)
+        self.assertEqual(read_directory(self.old), read_directory(make_tree(Path(mkdtemp()), OLD)))
+
+    def test_git_ref_matches_directory(self):
+        """Test reading a git ref gives the same files as the checkout."""
+        run = lambda *cmd: subprocess.run(cmd, cwd=self.old, check=True, capture_output=True)
+        run("git", "init", "-q")
+        run("git", "add", ".")
+        run("git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "x")
+        self.assertEqual(read_git_ref(self.old, "HEAD"), read_directory(self.old))
+
+
+if __name__ == '__main__':
+    unittest.main()
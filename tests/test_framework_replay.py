@@ -0,0 +1,136 @@
+"""
+Test suite for framework_replay.py
+
+Run tests with:
+    python -m pytest tests/test_framework_replay.py -v
+"""
+
+import subprocess
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from framework_replay import (
+    FrameworkReplay, bisect, first_change, first_warning, make_predicate
+)
+
+COMMANDS = "src/superclaude/commands"
+AGENTS = "src/superclaude/agents"
+
+
+class TestFrameworkReplay(unittest.TestCase):
+    """Replay a small Framework history from the object store"""
+
+    def git(self, *args) -> str:
+        return subprocess.run(
+            ['git', '-c', 'user.name=t', '-c', 'user.email=t@t', *args],
+            cwd=self.repo, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    def commit(self, message: str, files: dict) -> str:
+        for rel, text in files.items():
+            path = self.repo / rel
+            if text is None:
+                path.unlink()
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', message)
+        return self.git('rev-parse', 'HEAD')
+
+    def setUp(self):
+        self.repo = Path(mkdtemp())
+        self.git('init', '-q')
+        self.c0 = self.commit("initial", {
+            f"{COMMANDS}/build.md": "# /build\nSee /test\n",
+            f"{COMMANDS}/nested/deep.md": "# /deep\n",
+            f"{COMMANDS}/nested/skip.txt": "not markdown\n",
+            f"{AGENTS}/helper.md": "---\nname: helper\n---\nbody\n",
+            "README.md": "outside the mappings\n",
+        })
+        self.c1 = self.commit("docs only", {"README.md": "edited\n"})
+        self.c2 = self.commit("mention lint", {f"{COMMANDS}/build.md": "# /build\nSee /lint\n"})
+        self.c3 = self.commit("add broken agent", {f"{AGENTS}/broken.md": "no header\n"})
+        self.c4 = self.commit("drop helper", {f"{AGENTS}/helper.md": None})
+        self.replay = FrameworkReplay(self.repo)
+
+    def test_commits_include_baseline(self):
+        """Test A..B lists A first, then every later commit in order"""
+        self.assertEqual(self.replay.commits(f"{self.c0}..HEAD"), [self.c0, self.c1, self.c2, self.c3, self.c4])
+        self.assertEqual(self.replay.commits("HEAD"), [self.c4])
+
+    def test_state_transforms_in_memory(self):
+        """Test outputs match what a sync would write, without a checkout"""
+        state = self.replay.state(self.c0)
+        self.assertEqual(
+            set(state.outputs),
+            {"commands/sc-build.md", "commands/nested/sc-deep.md", "agents/sc-helper.md"}
+        )
+        self.assertIn("See /sc:test", state.outputs["commands/sc-build.md"])
+        self.assertIn("name: sc-helper", state.outputs["agents/sc-helper.md"])
+
+    def test_hidden_directories_skipped(self):
+        """Test markdown under a dot-directory is not replayed, as the sync never writes it"""
+        commit = self.commit("hidden draft", {f"{COMMANDS}/.hidden/x.md": "# /x\n"})
+        self.assertNotIn("commands/.hidden/sc-x.md", self.replay.state(commit).outputs)
+        self.assertTrue(next(self.replay.changes([self.c4, commit])).empty)
+
+    def test_unchanged_blobs_are_reused(self):
+        """Test each distinct file version is transformed once"""
+        list(self.replay.replay(self.replay.commits(f"{self.c0}..HEAD")))
+        # build.md ×2 versions, nested/deep.md, helper.md, broken.md
+        self.assertEqual(self.replay.transforms, 5)
+        # 16 file occurrences across the five commits
+        self.assertEqual(self.replay.reused, 16 - 5)
+
+    def test_first_change_and_log(self):
+        """Test the commit that changed an output is found, docs-only commits are empty"""
+        commits = self.replay.commits(f"{self.c0}..HEAD")
+        change = first_change(self.replay, commits, "commands/sc-build.md")
+        self.assertEqual(change.state.commit, self.c2)
+        self.assertEqual(change.modified, ["commands/sc-build.md"])
+
+        changes = list(FrameworkReplay(self.repo).changes(commits))
+        self.assertTrue(changes[0].empty)
+        self.assertEqual(changes[3].removed, ["agents/sc-helper.md"])
+        self.assertIsNone(first_change(self.replay, commits, "commands/sc-missing.md"))
+
+    def test_first_warning(self):
+        """Test the commit introducing a transform warning is reported"""
+        change = first_warning(self.replay, self.replay.commits(f"{self.c0}..HEAD"), "frontmatter")
+        self.assertEqual(change.state.commit, self.c3)
+        self.assertEqual(len(change.new_warnings), 1)
+        self.assertIn("broken.md", change.new_warnings[0])
+
+    def test_bisect(self):
+        """Test binary search finds the first commit matching the predicate"""
+        commits = self.replay.commits(f"{self.c0}..{self.c4}")
+        state, tested = bisect(self.replay, commits, make_predicate(
+            contains=("commands/sc-build.md", "/sc:lint")
+        ))
+        self.assertEqual(state.commit, self.c2)
+        self.assertLessEqual(tested, 4)
+
+        state, _ = bisect(self.replay, commits, make_predicate(lacks=("agents/sc-helper.md", "sc-helper")))
+        self.assertEqual(state.commit, self.c4)
+
+    def test_bisect_rejects_inconsistent_endpoints(self):
+        """Test a predicate already true at the good commit is an error"""
+        commits = self.replay.commits(f"{self.c0}..{self.c4}")
+        with self.assertRaises(ValueError):
+            bisect(self.replay, commits, make_predicate(contains=("commands/sc-build.md", "/sc:build")))
+
+    def test_exec_predicate(self):
+        """Test a shell command runs inside the materialized tree"""
+        commits = self.replay.commits(f"{self.c0}..{self.c4}")
+        state, _ = bisect(self.replay, commits, make_predicate(exec_command="test ! -f agents/sc-broken.md"))
+        self.assertEqual(state.commit, self.c3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Test suite for frontmatter.py and its users
+
+Run tests with:
+    python -m pytest tests/test_frontmatter.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import frontmatter
+from clean_command_names import clean_name_attributes
+
+
+DOCUMENT = """---
+name: implement
+description: "Feature implementation"
+mcp-servers: [context7, sequential]
+personas: [architect, "qa-specialist"]
+---
+
+# /sc:implement
+
+name: this body line is not frontmatter
+"""
+
+
+class TestFrontmatter(unittest.TestCase):
+    """Test parsing and span-splicing edits."""
+
+    def test_parse(self):
+        """Test scalar and list values are read from the header."""
+        header = frontmatter.parse(DOCUMENT)
+        self.assertEqual(header.get('name'), 'implement')
+        self.assertEqual(header.get('description'), 'Feature implementation')
+        self.assertEqual(header.get_list('personas'), ['architect', 'qa-specialist'])
+        self.assertEqual(header.keys(), ['name', 'description', 'mcp-servers', 'personas'])
+        self.assertEqual(DOCUMENT[slice(*header.span)].count('\n'), 4)
+
+    def test_no_frontmatter(self):
+        """Test documents without a leading header return None."""
+        self.assertIsNone(frontmatter.parse("# Title\n\n---\nname: x\n---\n"))
+
+    def test_edit_splices_header_only(self):
+        """Test edits leave the body untouched."""
+        header = frontmatter.parse(DOCUMENT)
+        header.set('name', 'sc-implement')
+        header.set('category', 'workflow')
+        result = header.apply(DOCUMENT)
+
+        body_start = DOCUMENT.index('\n---\n') + 5
+        self.assertTrue(result.endswith(DOCUMENT[body_start:]))
+        self.assertIn("name: sc-implement\n", result)
+        self.assertIn("category: workflow\n---\n", result)
+
+    def test_unmodified_apply_is_identity(self):
+        """Test apply returns the same object when nothing changed."""
+        header = frontmatter.parse(DOCUMENT)
+        self.assertIs(header.apply(DOCUMENT), DOCUMENT)
+
+    def test_clean_name_attributes_ignores_body(self):
+        """Test name cleanup only touches the frontmatter."""
+        cleaned, modified = clean_name_attributes(DOCUMENT)
+        self.assertTrue(modified)
+        self.assertNotIn("name: implement\n", cleaned)
+        self.assertIn("name: this body line is not frontmatter", cleaned)
+
+        _, modified_again = clean_name_attributes(cleaned)
+        self.assertFalse(modified_again)
+
+
+class TestBatchEditor(unittest.TestCase):
+    """Test parallel directory edits."""
+
+    def test_edit_directory(self):
+        """Test only changed files are rewritten and outcomes are reported."""
+        root = Path(mkdtemp())
+        (root / "a.md").write_text("---\nname: a\n---\nbody\n")
+        (root / "b.md").write_text("---\ndescription: b\n---\nbody\n")
+        (root / "c.md").write_text("no header\n")
+        untouched_mtime = (root / "b.md").stat().st_mtime_ns
+
+        result = frontmatter.edit_directory(root, lambda fm, path: fm.remove('name'), workers=2)
+
+        self.assertEqual(result.modified, [root / "a.md"])
+        self.assertEqual(result.unchanged, [root / "b.md"])
+        self.assertEqual(result.no_frontmatter, [root / "c.md"])
+        self.assertEqual(result.processed, 3)
+        self.assertEqual((root / "a.md").read_text(), "---\n---\nbody\n")
+        self.assertEqual((root / "b.md").stat().st_mtime_ns, untouched_mtime)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Test suite for merkle_manifest.py
+
+Run tests with:
+    python -m pytest tests/test_merkle_manifest.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+from unittest import mock
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import merkle_manifest
+from merkle_manifest import MerkleManifest, build_manifest, compare
+
+SCOPE = ["commands", "agents", "core", "README.md", ".claude-plugin"]
+
+
+def make_tree(root: Path) -> Path:
+    files = {
+        "commands/sc-build.md": "# /sc:build\n",
+        "commands/sc-test.md": "# /sc:test\n",
+        "agents/sc-helper.md": "---\nname: sc-helper\n---\n",
+        "agents/ContextEngineering/notes.md": "nested\n",
+        "core/RULES.md": "rules\n",
+        "README.md": "readme\n",
+        "scripts/not-in-scope.py": "print()\n",
+        ".sync-cache/index.json": "{}",
+    }
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return root
+
+
+class TestMerkleManifest(unittest.TestCase):
+    """Merkle manifest build, verify and compare"""
+
+    def setUp(self):
+        self.root = make_tree(Path(mkdtemp()))
+        self.manifest = MerkleManifest.build(self.root, SCOPE)
+
+    def test_scope_and_exclusions(self):
+        """Test only scoped paths are covered and scratch state is skipped"""
+        self.assertEqual(self.manifest.file_count, 6)
+        self.assertIn("agents/ContextEngineering/notes.md", self.manifest.nodes)
+        self.assertNotIn("scripts/not-in-scope.py", self.manifest.nodes)
+        self.assertNotIn(".sync-cache/index.json", self.manifest.nodes)
+
+    def test_root_hash_is_content_only(self):
+        """Test an identical copy has the same root hash and a change propagates up"""
+        other = make_tree(Path(mkdtemp()))
+        self.assertEqual(MerkleManifest.build(other, SCOPE).root_hash, self.manifest.root_hash)
+
+        (other / "agents/ContextEngineering/notes.md").write_text("changed\n")
+        changed = MerkleManifest.build(other, SCOPE)
+        self.assertNotEqual(changed.root_hash, self.manifest.root_hash)
+        self.assertNotEqual(changed.nodes["agents"].hash, self.manifest.nodes["agents"].hash)
+        self.assertEqual(changed.nodes["commands"].hash, self.manifest.nodes["commands"].hash)
+
+    def test_verify_rehashes_only_changed_files(self):
+        """Test unchanged files are trusted by stat and not reread"""
+        (self.root / "commands/sc-build.md").write_text("# /sc:build v2\n")
+        (self.root / "core/RULES.md").unlink()
+        (self.root / "commands/sc-new.md").write_text("new\n")
+
+        with mock.patch.object(merkle_manifest, '_blob_hash', wraps=merkle_manifest._blob_hash) as hashed:
+            diff = self.manifest.verify(self.root)
+        self.assertEqual(diff.modified, ["commands/sc-build.md"])
+        self.assertEqual(diff.removed, ["core/RULES.md"])
+        self.assertEqual(diff.added, ["commands/sc-new.md"])
+        self.assertEqual(hashed.call_count, 2)
+
+    def test_verify_touched_paths_only(self):
+        """Test update rehashes just the named paths and matches a full rebuild"""
+        (self.root / "agents/ContextEngineering/notes.md").write_text("edited\n")
+        (self.root / "agents/sc-new.md").write_text("new\n")
+
+        with mock.patch.object(merkle_manifest, '_blob_hash', wraps=merkle_manifest._blob_hash) as hashed:
+            updated = self.manifest.update(self.root, ["agents/ContextEngineering", "agents/sc-new.md"])
+        self.assertEqual(hashed.call_count, 2)
+        self.assertEqual(updated.root_hash, MerkleManifest.build(self.root, SCOPE).root_hash)
+        # The original manifest is left untouched
+        self.assertEqual(self.manifest.root_hash, MerkleManifest.build(make_tree(Path(mkdtemp())), SCOPE).root_hash)
+
+        diff = self.manifest.verify(self.root, ["agents"])
+        self.assertEqual((diff.added, diff.modified), (["agents/sc-new.md"], ["agents/ContextEngineering/notes.md"]))
+
+    def test_compare_skips_equal_subtrees(self):
+        """Test compare only visits nodes on the path to a change"""
+        other = make_tree(Path(mkdtemp()))
+        (other / "core/RULES.md").write_text("tuned\n")
+        new = MerkleManifest.build(other, SCOPE)
+
+        with mock.patch.object(MerkleManifest, 'files_under', wraps=new.files_under) as listed:
+            diff = compare(self.manifest, new)
+        self.assertEqual(diff.modified, ["core/RULES.md"])
+        listed.assert_not_called()
+
+    def test_save_load_round_trip(self):
+        """Test a saved manifest loads, excludes itself and verifies offline"""
+        path = self.root / ".claude-plugin/merkle-manifest.json"
+        saved = build_manifest(self.root, SCOPE, path)
+        self.assertNotIn(".claude-plugin/merkle-manifest.json", saved.nodes)
+        self.assertNotIn("mtime", path.read_text())
+
+        loaded = MerkleManifest.load(path)
+        self.assertEqual(loaded.root_hash, saved.root_hash)
+        self.assertTrue(loaded.verify(self.root).clean)
+        (self.root / "README.md").write_text("tampered\n")
+        self.assertEqual(loaded.verify(self.root).modified, ["README.md"])
+
+    def test_saved_manifest_skips_uncommitted_paths(self):
+        """Test backups/ and the sync commit marker never make the manifest stale"""
+        for rel in ("backups/index.json", "docs/.framework-sync-commit", "docs/GUIDE.md"):
+            (self.root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (self.root / rel).write_text("v1\n")
+        path = self.root / ".claude-plugin/merkle-manifest.json"
+        saved = build_manifest(self.root, SCOPE + ["backups", "docs"], path)
+        self.assertIn("docs/GUIDE.md", saved.nodes)
+        self.assertNotIn("backups", saved.nodes)
+        self.assertNotIn("docs/.framework-sync-commit", saved.nodes)
+
+        (self.root / "backups/objects.gz").write_text("new backup\n")
+        (self.root / "docs/.framework-sync-commit").write_text("abc123\n")
+        self.assertTrue(MerkleManifest.load(path).verify(self.root).clean)
+
+    def test_load_rejects_inconsistent_root(self):
+        """Test a manifest whose nodes don't add up to its root is refused"""
+        path = self.root / "m.json"
+        self.manifest.save(path)
+        path.write_text(path.read_text().replace(self.manifest.nodes["README.md"].hash, "0" * 64))
+        with self.assertRaises(ValueError):
+            MerkleManifest.load(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Test suite for near_duplicates.py
+
+Run tests with:
+    python -m pytest tests/test_near_duplicates.py -v
+"""
+
+import random
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from near_duplicates import analyze
+
+WORDS = ("alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu nu xi "
+         "omicron pi rho sigma tau upsilon phi chi psi omega").split()
+
+
+def prose(seed: int, count: int = 120) -> str:
+    """Deterministic word salad, distinct for distinct seeds."""
+    rng = random.Random(seed)
+    return ' '.join(f"{rng.choice(WORDS)}{rng.randrange(10)}" for _ in range(count))
+
+
+def write_tree(root: Path, files: dict):
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+
+
+class TestNearDuplicates(unittest.TestCase):
+    """Test near-duplicate pairs across files and sections."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        base = prose(1)
+        write_tree(self.root, {
+            "agents/sc-research.md": f"# Research\n\n{base}\n",
+            "agents/sc-research-agent.md": f"# Research Agent\n\n{base} {prose(2, 10)}\n",
+            "agents/nested/sc-other.md": f"# Other\n\n{prose(3)}\n",
+            "core/FLAGS.md": f"# Flags\n\n{prose(4)}\n\n## Priority Rules\n\n{prose(5, 60)}\n",
+            "commands/sc-help.md": f"# /sc:help\n\n{prose(6)}\n\n## Priority Rules\n\n{prose(5, 60)}\n",
+        })
+
+    def test_file_pairs(self):
+        """Test near-identical files are paired with their redundant tokens."""
+        report = analyze(self.root)
+
+        self.assertEqual(len(report["file_pairs"]), 1)
+        pair = report["file_pairs"][0]
+        self.assertEqual({pair["a"], pair["b"]},
+                         {"agents/sc-research.md", "agents/sc-research-agent.md"})
+        self.assertGreater(pair["jaccard"], 0.8)
+        smaller = (self.root / "agents/sc-research.md").stat().st_size
+        self.assertGreater(pair["redundant_tokens"], smaller // 5)
+        self.assertLessEqual(pair["redundant_tokens"], smaller)
+
+    def test_section_pairs(self):
+        """Test a shared section is found across otherwise different files."""
+        report = analyze(self.root)
+
+        self.assertEqual(
+            [(p["a"], p["b"]) for p in report["section_pairs"]],
+            [("commands/sc-help.md#priority-rules", "core/FLAGS.md#priority-rules")]
+        )
+        self.assertEqual(report["section_pairs"][0]["jaccard"], 1.0)
+        self.assertLess(report["candidates"], report["possible_pairs"])
+
+    def test_no_sections(self):
+        """Test --no-sections compares whole files only."""
+        report = analyze(self.root, sections=False)
+        self.assertEqual(report["sections"], 0)
+        self.assertEqual(report["section_pairs"], [])
+
+    def test_readmes_and_hidden_directories_skipped(self):
+        """Test only files the corpus index sees are compared."""
+        write_tree(self.root, {
+            "commands/sc-README.md": f"# Commands\n\n{prose(7)}\n",
+            "agents/sc-README.md": f"# Agents\n\n{prose(7)}\n",
+            "agents/.agents.staging/sc-research.md": f"# Research\n\n{prose(1)}\n",
+        })
+        report = analyze(self.root)
+        self.assertEqual(report["files"], 5)
+        self.assertEqual(len(report["file_pairs"]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Test suite for pattern_benchmark.py
+
+Run tests with:
+    python -m pytest tests/test_pattern_benchmark.py -v
+"""
+
+import os
+import unittest
+import sys
+from pathlib import Path
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from pattern_benchmark import (
+    GENERATORS, Measurement, over_budget, run_benchmark, transform_patterns
+)
+from sync_from_framework import ContentTransformer
+
+
+class TestPatternBenchmark(unittest.TestCase):
+    """Transform patterns must stay linear on adversarial input"""
+
+    def test_covers_every_transformer_pattern(self):
+        """Patterns added to ContentTransformer are picked up automatically"""
+        names = transform_patterns()
+        for attr in ('COMMAND_HEADER_PATTERN', 'COMMAND_REF_PATTERN', 'LINK_REF_PATTERN'):
+            self.assertIn(f"ContentTransformer.{attr}", names)
+            self.assertIs(names[f"ContentTransformer.{attr}"][0], getattr(ContentTransformer, attr))
+
+    def test_generators_produce_requested_size(self):
+        """Generated documents are roughly the requested size"""
+        for name, make in GENERATORS.items():
+            length = len(make(4096))
+            self.assertGreater(length, 2048, name)
+            self.assertLess(length, 8192, name)
+
+    def test_flags_quadratic_growth(self):
+        """Time growing with the square of the input is flagged, linear growth is not"""
+        self.assertTrue(Measurement('p', 'g', 0.001, 0.064, 8).super_linear)
+        self.assertFalse(Measurement('p', 'g', 0.001, 0.009, 8).super_linear)
+
+    def test_transform_patterns_within_budget(self):
+        """Every pattern gets through every adversarial input well inside the budget"""
+        failures = [
+            f"{pattern} on {generator}: {seconds:.2f}s"
+            for pattern, generator, seconds in over_budget()
+        ]
+        self.assertEqual(failures, [])
+
+    @unittest.skipUnless(os.environ.get('SC_PATTERN_BENCHMARK'), 'set SC_PATTERN_BENCHMARK=1 to run')
+    def test_transform_patterns_scale_linearly(self):
+        """No pattern/input combination grows faster than linear (timing sweep)"""
+        failures = [
+            f"{r.pattern} on {r.generator}: slowdown {r.slowdown:.2f}"
+            for r in run_benchmark(size=16384, scale=8, repeats=3)
+            if r.super_linear
+        ]
+        self.assertEqual(failures, [])
+
+if __name__ == '__main__':
+    unittest.main()
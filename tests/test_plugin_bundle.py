@@ -0,0 +1,89 @@
+"""
+Test suite for plugin_bundle.py
+
+Run tests with:
+    python -m pytest tests/test_plugin_bundle.py -v
+"""
+
+import os
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from plugin_bundle import BundleError, BundleReader, pack
+
+
+class TestPluginBundle(unittest.TestCase):
+    """Test packing, random access and round-trips."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        (self.root / "commands").mkdir()
+        (self.root / "agents" / "ContextEngineering").mkdir(parents=True)
+        (self.root / "core").mkdir()
+        (self.root / "commands" / "sc-build.md").write_text("---\nname: build\ncategory: utility\n---\n# /sc:build\n")
+        (self.root / "agents" / "sc-helper.md").write_text("---\nname: sc-helper\n---\nbody\n")
+        (self.root / "agents" / "ContextEngineering" / "notes.py").write_bytes(b"\x00binary\xff")
+        (self.root / "agents" / "ContextEngineering" / "sc-context-agent.md").write_text(
+            "---\nname: sc-context-agent\n---\nnested\n"
+        )
+        (self.root / "agents" / "sc-README.md").write_text("# Agents\n")
+        (self.root / "core" / "RULES.md").write_text("# Rules\n")
+        os.chmod(self.root / "core" / "RULES.md", 0o600)
+        self.bundle = self.root / "out.bundle"
+
+    def test_random_access_by_name_and_path(self):
+        """Test entries are found by corpus name or path, with frontmatter in the header."""
+        pack(self.root, self.bundle)
+        with BundleReader(self.bundle) as reader:
+            self.assertEqual(reader.read("sc:build"), (self.root / "commands/sc-build.md").read_bytes())
+            self.assertEqual(reader.read("agents/ContextEngineering/notes.py"), b"\x00binary\xff")
+            self.assertEqual(reader.entry("sc-helper").path, "agents/sc-helper.md")
+            self.assertEqual(reader.entry("sc:build").frontmatter, {"name": "build", "category": "utility"})
+
+    def test_nested_files_are_named_like_the_index(self):
+        """Test nested corpus files get their node name and header; READMEs keep their path."""
+        pack(self.root, self.bundle)
+        with BundleReader(self.bundle) as reader:
+            nested = reader.entry("sc-context-agent")
+            self.assertEqual(nested.path, "agents/ContextEngineering/sc-context-agent.md")
+            self.assertEqual(nested.frontmatter, {"name": "sc-context-agent"})
+            self.assertEqual(reader.entry("agents/sc-README.md").name, "agents/sc-README.md")
+
+    def test_unpack_round_trip(self):
+        """Test unpacking recreates identical bytes and permission bits."""
+        pack(self.root, self.bundle)
+        dest = Path(mkdtemp())
+        with BundleReader(self.bundle) as reader:
+            self.assertEqual(reader.unpack(dest), 6)
+
+        for rel in ("commands/sc-build.md", "agents/ContextEngineering/notes.py", "core/RULES.md"):
+            self.assertEqual((dest / rel).read_bytes(), (self.root / rel).read_bytes())
+        self.assertEqual((dest / "core/RULES.md").stat().st_mode & 0o777, 0o600)
+
+        # Re-packing the unpacked tree gives the same bundle
+        pack(dest, dest / "again.bundle")
+        self.assertEqual((dest / "again.bundle").read_bytes(), self.bundle.read_bytes())
+
+    def test_corruption_detected(self):
+        """Test verify reports entries whose bytes changed."""
+        pack(self.root, self.bundle)
+        data = bytearray(self.bundle.read_bytes())
+        data[-3] ^= 0xFF
+        self.bundle.write_bytes(bytes(data))
+        with BundleReader(self.bundle) as reader:
+            self.assertEqual(reader.verify(), ["core/RULES.md"])
+
+    def test_not_a_bundle(self):
+        """Test other files are rejected."""
+        self.bundle.write_bytes(b"PK\x03\x04 not ours")
+        with self.assertRaises(BundleError):
+            BundleReader(self.bundle)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Test suite for search_index.py
+
+Run tests with:
+    python -m pytest tests/test_search_index.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from search_index import SearchIndex, build_index, split_sections, tokenize
+
+
+class TestTokenizer(unittest.TestCase):
+    """Test tokenization and section splitting."""
+
+    def test_tokenize(self):
+        """Test ASCII words are lowercased and CJK runs become bigrams."""
+        self.assertEqual(tokenize("Run /sc:Test 進捗確認"), ["run", "sc", "test", "進捗", "捗確", "確認"])
+
+    def test_split_sections_ignores_fenced_headings(self):
+        """Test headings inside code fences do not start sections."""
+        text = "intro\n## Usage\n```\n# not a heading\n```\n## Key Actions\nx\n"
+        self.assertEqual([a for a, _ in split_sections(text)], ["", "usage", "key-actions"])
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test ranking, anchors and incremental rebuilds."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        (self.root / "commands").mkdir()
+        (self.root / "agents").mkdir()
+        (self.root / "commands" / "sc-test.md").write_text(
+            "---\nname: test\ndescription: Run tests and report coverage\n---\n"
+            "# /sc:test\n## Usage\nrun the suite\n## Coverage\ncoverage coverage report\n"
+        )
+        (self.root / "commands" / "sc-build.md").write_text(
+            "---\nname: build\ndescription: Build and package\n---\n# /sc:build\n## Usage\ncompile\n"
+        )
+        (self.root / "agents" / "sc-quality-engineer.md").write_text(
+            "---\nname: sc-quality-engineer\ndescription: Testing strategy\n---\n## Triggers\ntest coverage gaps\n"
+        )
+        self.index_path = self.root / "search-index.json"
+
+    def test_ranked_results_with_anchors(self):
+        """Test the best match comes first with its matching sections."""
+        build_index(self.root, self.index_path)
+        hits = SearchIndex.load(self.index_path).search("coverage report")
+
+        self.assertEqual([h.name for h in hits], ["sc:test", "sc-quality-engineer"])
+        self.assertEqual(hits[0].sections[0], "coverage")
+
+    def test_kind_filter(self):
+        """Test results can be restricted to one kind."""
+        build_index(self.root, self.index_path)
+        hits = SearchIndex.load(self.index_path).search("coverage", kinds=["agent"])
+        self.assertEqual([h.kind for h in hits], ["agent"])
+
+    def test_nested_files(self):
+        """Test documents in nested directories are indexed."""
+        nested = self.root / "agents" / "ContextEngineering"
+        nested.mkdir()
+        (nested / "sc-context-agent.md").write_text(
+            "---\nname: sc-context-agent\ndescription: Context window budgeting\n---\n"
+        )
+        build_index(self.root, self.index_path)
+        hits = SearchIndex.load(self.index_path).search("budgeting")
+        self.assertEqual([h.name for h in hits], ["sc-context-agent"])
+
+    def test_incremental_update(self):
+        """Test only changed files are re-indexed and removed ones dropped."""
+        build_index(self.root, self.index_path)
+        (self.root / "commands" / "sc-build.md").write_text("---\nname: build\n---\nwebpack bundling\n")
+        (self.root / "commands" / "sc-test.md").unlink()
+
+        counts = build_index(self.root, self.index_path)
+        self.assertEqual(counts, {"added": 0, "updated": 1, "removed": 1, "unchanged": 1})
+
+        index = SearchIndex.load(self.index_path)
+        self.assertEqual([h.name for h in index.search("webpack")], ["sc:build"])
+        self.assertEqual([h.name for h in index.search("coverage")], ["sc-quality-engineer"])
+        self.assertNotIn("compile", index.postings)
+
+
+if __name__ == '__main__':
+    unittest.main()
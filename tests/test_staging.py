@@ -0,0 +1,147 @@
+"""
+Test suite for staging.py and the staged content sync
+
+Run tests with:
+    python -m pytest tests/test_staging.py -v
+"""
+
+import subprocess
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from staging import StagedDirectory
+from sync_from_framework import FrameworkSyncer, SyncMapping
+from sync_journal import JOURNAL_FILENAME, SyncJournal
+
+
+class TestStagedDirectory(unittest.TestCase):
+    """Test generation swaps."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        self.live = self.root / "commands"
+        self.live.mkdir()
+        (self.live / "sc-a.md").write_text("v1")
+        (self.live / "setup-mcp.md").write_text("plugin-owned")
+
+    def test_prepare_copies_live(self):
+        """Test staging starts as a copy, and the live directory is untouched by edits."""
+        directory = StagedDirectory(self.live)
+        staging = directory.prepare()
+        (staging / "sc-a.md").write_text("v2")
+
+        self.assertEqual((staging / "setup-mcp.md").read_text(), "plugin-owned")
+        self.assertEqual((self.live / "sc-a.md").read_text(), "v1")
+
+    def test_commit_and_rollback(self):
+        """Test commit swaps in staging and rollback toggles generations."""
+        directory = StagedDirectory(self.live)
+        (directory.prepare() / "sc-a.md").write_text("v2")
+        directory.commit()
+
+        self.assertEqual((self.live / "sc-a.md").read_text(), "v2")
+        self.assertEqual((directory.previous / "sc-a.md").read_text(), "v1")
+        self.assertFalse(directory.staging.exists())
+
+        directory.rollback()
+        self.assertEqual((self.live / "sc-a.md").read_text(), "v1")
+        directory.rollback()
+        self.assertEqual((self.live / "sc-a.md").read_text(), "v2")
+
+    def test_second_commit_replaces_previous(self):
+        """Test only one previous generation is kept."""
+        directory = StagedDirectory(self.live)
+        for version in ("v2", "v3"):
+            (directory.prepare() / "sc-a.md").write_text(version)
+            directory.commit()
+
+        self.assertEqual((directory.previous / "sc-a.md").read_text(), "v2")
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()),
+                         [".commands.previous", "commands"])
+
+
+class TestStagedSync(unittest.TestCase):
+    """Test the content sync only touches live directories on success."""
+
+    def setUp(self):
+        self.framework = Path(mkdtemp())
+        self.plugin = Path(mkdtemp())
+        for kind in ("commands", "agents"):
+            (self.framework / "src/superclaude" / kind).mkdir(parents=True)
+            (self.framework / "src/superclaude" / kind / "x.md").write_text("---\nname: x\n---\n")
+            (self.plugin / kind).mkdir()
+            (self.plugin / kind / "sc-x.md").write_text("old")
+
+    def test_failed_pipeline_leaves_live_tree(self):
+        """Test a failing mapping means no directory is swapped."""
+        def explode(content, filename):
+            raise RuntimeError("transform failed")
+
+        SyncMapping.TRANSFORMERS["explode"] = explode
+        self.addCleanup(SyncMapping.TRANSFORMERS.pop, "explode")
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer.SYNC_MAPPINGS = [
+            SyncMapping("commands", "src/superclaude/commands", "commands", transform="command"),
+            SyncMapping("agents", "src/superclaude/agents", "agents", transform="explode"),
+        ]
+        with self.assertRaises(RuntimeError):
+            syncer._sync_content(self.framework)
+
+        self.assertEqual((self.plugin / "commands/sc-x.md").read_text(), "old")
+        self.assertEqual((self.plugin / "agents/sc-x.md").read_text(), "old")
+
+    def test_rollback_restores_previous_sync(self):
+        """Test --rollback returns every mapping to its pre-sync state."""
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer._sync_content(self.framework)
+        self.assertIn("sc-x", (self.plugin / "agents/sc-x.md").read_text())
+
+        self.assertEqual(syncer.rollback(), ["commands", "agents"])
+        self.assertEqual((self.plugin / "agents/sc-x.md").read_text(), "old")
+
+    def test_resume_after_swap_keeps_rollback_target(self):
+        """Test a run that died after the swap does not stage the new tree again."""
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer.journal = SyncJournal.start(self.plugin / JOURNAL_FILENAME, "abc123")
+        stats = syncer._sync_content(self.framework)
+        # Interrupted before the content step was journaled
+        syncer.journal.close()
+
+        resumed = FrameworkSyncer("unused", self.plugin, resume=True)
+        resumed.journal = resumed._open_journal("abc123")
+        self.assertEqual(resumed._sync_content(self.framework), stats)
+        resumed.journal.close()
+
+        self.assertEqual((self.plugin / ".agents.previous/sc-x.md").read_text(), "old")
+        self.assertFalse((self.plugin / ".agents.staging").exists())
+        resumed.rollback()
+        self.assertEqual((self.plugin / "agents/sc-x.md").read_text(), "old")
+
+    def test_renames_in_staging_are_staged_in_git(self):
+        """Test a rename made inside staging reaches the git index after the swap."""
+        git = ['git', '-c', 'user.name=t', '-c', 'user.email=t@example.com']
+        subprocess.run(['git', 'init', '-q'], cwd=self.plugin, check=True)
+        body = "# Renamed upstream\n" + "same content line\n" * 20
+        (self.plugin / "commands/sc-old.md").write_text(body)
+        subprocess.run(['git', 'add', '-A'], cwd=self.plugin, check=True)
+        subprocess.run(git + ['commit', '-qm', 'init'], cwd=self.plugin, check=True)
+        (self.framework / "src/superclaude/commands/new.md").write_text(body)
+
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer.SYNC_MAPPINGS = [SyncMapping("commands", "src/superclaude/commands", "commands")]
+        syncer._sync_content(self.framework)
+
+        status = subprocess.run(
+            ['git', 'status', '--porcelain'], cwd=self.plugin,
+            check=True, capture_output=True, text=True
+        ).stdout
+        self.assertIn("R  commands/sc-old.md -> commands/sc-new.md", status)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,7 +14,11 @@ from pathlib import Path
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
-from sync_from_framework import ContentTransformer, McpMerger
+from sync_from_framework import (
+    ContentTransformer, McpMerger, RenameDetector, FileSyncer,
+    FrameworkSyncer, ProtectionViolationError, SyncMapping,
+    level_prefix, scan_markdown
+)
 
 
 class TestContentTransformer(unittest.TestCase):
@@ -223,6 +227,323 @@ class TestMcpMerger(unittest.TestCase):
         self.assertEqual(len(warnings), 0)
 
 
+class TestRenameDetector(unittest.TestCase):
+    """Test content-based rename pairing."""
+
+    BODY = " ".join(f"word{i}" for i in range(200))
+
+    def test_exact_rename(self):
+        """Test identical content is paired by hash."""
+        pairs = RenameDetector().detect(
+            {"sc-foo.md": self.BODY, "sc-gone.md": "deleted for real"},
+            {"sc-bar.md": self.BODY}
+        )
+        self.assertEqual(pairs, [("sc-foo.md", "sc-bar.md")])
+
+    def test_near_identical_rename(self):
+        """Test lightly edited content is still paired."""
+        edited = self.BODY.replace("word100", "changed") + " appended line"
+        pairs = RenameDetector().detect({"sc-foo.md": self.BODY}, {"sc-bar.md": edited})
+        self.assertEqual(pairs, [("sc-foo.md", "sc-bar.md")])
+
+    def test_unrelated_content_not_paired(self):
+        """Test a delete plus an unrelated add stays a delete plus an add."""
+        other = " ".join(f"other{i}" for i in range(200))
+        self.assertEqual(
+            RenameDetector().detect({"sc-foo.md": self.BODY}, {"sc-bar.md": other}), []
+        )
+
+    def test_sync_directory_moves_renamed_file(self):
+        """Test sync_directory renames in place instead of delete + add."""
+        from tempfile import mkdtemp
+        root = Path(mkdtemp())
+        source, dest = root / "src", root / "commands"
+        source.mkdir()
+        dest.mkdir()
+        (dest / "sc-foo.md").write_text(self.BODY)
+        (source / "bar.md").write_text(self.BODY + " tweak")
+
+        syncer = FileSyncer(root)
+        syncer.git_available = False
+        stats = syncer.sync_directory(source, dest, filename_prefix="sc-")
+
+        self.assertEqual(stats["renamed"], 1)
+        self.assertFalse((dest / "sc-foo.md").exists())
+        self.assertEqual((dest / "sc-bar.md").read_text(), self.BODY + " tweak")
+
+
+class TestNestedSync(unittest.TestCase):
+    """Test recursive sync of nested source directories."""
+
+    def setUp(self):
+        from tempfile import mkdtemp
+        self.root = Path(mkdtemp())
+        self.source, self.dest = self.root / "src", self.root / "agents"
+        (self.source / "ContextEngineering" / "deep").mkdir(parents=True)
+        (self.source / "top.md").write_text("top")
+        (self.source / "ContextEngineering" / "orchestrator.md").write_text("nested")
+        (self.source / "ContextEngineering" / "deep" / "leaf.md").write_text("leaf")
+        (self.source / "ContextEngineering" / "notes.txt").write_text("not markdown")
+        self.syncer = FileSyncer(self.root)
+        self.syncer.git_available = False
+
+    def test_scan_markdown(self):
+        """Test the walker finds markdown at every depth and skips dot-directories."""
+        (self.source / ".staging").mkdir()
+        (self.source / ".staging" / "hidden.md").write_text("x")
+        self.assertEqual(
+            scan_markdown(self.source, workers=2),
+            ["ContextEngineering/deep/leaf.md", "ContextEngineering/orchestrator.md", "top.md"]
+        )
+
+    def test_level_prefix(self):
+        """Test the last nested prefix applies to every deeper level."""
+        self.assertEqual(level_prefix(0, "sc-"), "sc-")
+        self.assertEqual(level_prefix(3, "sc-"), "sc-")
+        self.assertEqual(level_prefix(1, "sc-", ("", "x-")), "")
+        self.assertEqual(level_prefix(4, "sc-", ("", "x-")), "x-")
+
+    def test_nested_files_mirrored_with_level_prefixes(self):
+        """Test subdirectories are mirrored with their level's prefix."""
+        self.syncer.sync_directory(self.source, self.dest, "sc-", nested_prefixes=("",))
+
+        self.assertEqual((self.dest / "sc-top.md").read_text(), "top")
+        self.assertEqual((self.dest / "ContextEngineering" / "orchestrator.md").read_text(), "nested")
+        self.assertTrue((self.dest / "ContextEngineering" / "deep" / "leaf.md").exists())
+        self.assertFalse((self.dest / "ContextEngineering" / "notes.txt").exists())
+
+    def test_stale_files_removed_across_subtree(self):
+        """Test stale prefixed files go at any depth; unowned files stay."""
+        stale_dir = self.dest / "Retired" / "deeper"
+        stale_dir.mkdir(parents=True)
+        (stale_dir / "sc-gone.md").write_text("retired upstream")
+        (self.dest / "ContextEngineering").mkdir()
+        (self.dest / "ContextEngineering" / "sc-old.md").write_text("stale")
+        (self.dest / "ContextEngineering" / "plugin-notes.md").write_text("plugin-owned")
+
+        self.syncer.sync_directory(self.source, self.dest, "sc-")
+
+        self.assertTrue((self.dest / "ContextEngineering" / "sc-orchestrator.md").exists())
+        self.assertFalse((self.dest / "ContextEngineering" / "sc-old.md").exists())
+        self.assertTrue((self.dest / "ContextEngineering" / "plugin-notes.md").exists())
+        self.assertFalse((self.dest / "Retired").exists())
+
+    def test_file_moved_into_subdirectory(self):
+        """Test an upstream move into a subdirectory is paired as a rename."""
+        body = " ".join(f"word{i}" for i in range(200))
+        self.dest.mkdir()
+        (self.dest / "sc-guide.md").write_text(body)
+        (self.source / "sub").mkdir()
+        (self.source / "sub" / "guide.md").write_text(body)
+
+        stats = self.syncer.sync_directory(self.source, self.dest, "sc-")
+
+        self.assertEqual(stats["renamed"], 1)
+        self.assertFalse((self.dest / "sc-guide.md").exists())
+        self.assertEqual((self.dest / "sub" / "sc-guide.md").read_text(), body)
+
+
+class TestCopyDirectory(unittest.TestCase):
+    """Test the skip-unchanged asset copy."""
+
+    def setUp(self):
+        from tempfile import mkdtemp
+        self.root = Path(mkdtemp())
+        self.source = self.root / "assets"
+        (self.source / "img").mkdir(parents=True)
+        (self.source / "a.bin").write_bytes(b"a" * 5000)
+        (self.source / "img/b.png").write_bytes(b"\x89PNG" + b"b" * 100)
+        self.dest = self.root / "out"
+        self.syncer = FileSyncer(self.root)
+        self.syncer.git_available = False
+
+    def test_copies_then_skips_unchanged(self):
+        """Test a second run copies nothing."""
+        first = self.syncer.copy_directory(self.source, self.dest)
+        self.assertEqual((first["copied"], first["skipped"]), (2, 0))
+        self.assertEqual(first["bytes"], 5104)
+        self.assertEqual((self.dest / "img/b.png").read_bytes(), b"\x89PNG" + b"b" * 100)
+
+        second = self.syncer.copy_directory(self.source, self.dest)
+        self.assertEqual((second["copied"], second["skipped"], second["hashed"]), (0, 2, 0))
+
+    def test_same_size_different_content_is_copied(self):
+        """Test equal size with a different mtime falls back to hashing."""
+        import os
+        self.syncer.copy_directory(self.source, self.dest)
+        (self.dest / "a.bin").write_bytes(b"z" * 5000)
+        os.utime(self.dest / "a.bin", (1, 1))
+        touched = self.dest / "img/b.png"
+        os.utime(touched, (1, 1))
+
+        stats = self.syncer.copy_directory(self.source, self.dest)
+        self.assertEqual((stats["copied"], stats["skipped"], stats["hashed"]), (1, 1, 2))
+        self.assertEqual((self.dest / "a.bin").read_bytes(), b"a" * 5000)
+        # The identical file's mtime is realigned so the next run needn't hash
+        self.assertEqual(self.syncer.copy_directory(self.source, self.dest)["hashed"], 0)
+
+    def test_hardlink_mode(self):
+        """Test opt-in hardlinks, and that updating a link never writes through to the source."""
+        stats = self.syncer.copy_directory(self.source, self.dest, hardlink=True)
+        self.assertEqual((stats["linked"], stats["copied"], stats["bytes"]), (2, 0, 0))
+        self.assertTrue((self.dest / "a.bin").samefile(self.source / "a.bin"))
+        self.assertEqual(self.syncer.copy_directory(self.source, self.dest)["skipped"], 2)
+
+        (self.source / "a.bin").unlink()
+        (self.source / "a.bin").write_bytes(b"new")
+        self.syncer.copy_directory(self.source, self.dest)
+        self.assertEqual((self.dest / "a.bin").read_bytes(), b"new")
+        self.assertFalse((self.dest / "a.bin").samefile(self.source / "a.bin"))
+
+    def test_dry_run_writes_nothing(self):
+        """Test dry run reports copies without creating files."""
+        self.syncer.dry_run = True
+        stats = self.syncer.copy_directory(self.source, self.dest)
+        self.assertEqual(stats["copied"], 2)
+        self.assertFalse((self.dest / "a.bin").exists())
+
+    def test_dry_run_keeps_mtimes(self):
+        """Test dry run hashes an equal file without realigning its mtime."""
+        import os
+        self.syncer.copy_directory(self.source, self.dest)
+        os.utime(self.dest / "a.bin", ns=(0, 1_000_000_000))
+
+        self.syncer.dry_run = True
+        stats = self.syncer.copy_directory(self.source, self.dest)
+        self.assertEqual((stats["skipped"], stats["hashed"]), (2, 1))
+        self.assertEqual((self.dest / "a.bin").stat().st_mtime_ns, 1_000_000_000)
+
+
+class TestSyncMappings(unittest.TestCase):
+    """Test the mapping-driven content sync."""
+
+    def setUp(self):
+        from tempfile import mkdtemp
+        self.framework = Path(mkdtemp())
+        self.plugin = Path(mkdtemp())
+        commands = self.framework / "src/superclaude/commands"
+        agents = self.framework / "src/superclaude/agents"
+        commands.mkdir(parents=True)
+        agents.mkdir(parents=True)
+        (commands / "build.md").write_text("# /build\nSee /test\n")
+        (agents / "helper.md").write_text("---\nname: helper\n---\nbody\n")
+
+    def test_default_mappings(self):
+        """Test commands and agents each get their own transformer and stats."""
+        syncer = FrameworkSyncer("unused", self.plugin)
+        stats = syncer._sync_content(self.framework)
+
+        self.assertEqual(stats["commands"], 1)
+        self.assertEqual(stats["agents"], 1)
+        self.assertEqual(set(syncer.mapping_stats), {"commands", "agents"})
+        self.assertIn("See /sc:test", (self.plugin / "commands/sc-build.md").read_text())
+        self.assertIn("name: sc-helper", (self.plugin / "agents/sc-helper.md").read_text())
+
+    def test_new_mapping_is_configuration_only(self):
+        """Test an extra mapping syncs without code changes."""
+        skills = self.framework / "src/superclaude/skills"
+        skills.mkdir()
+        (skills / "plan.md").write_text("/plan stays as-is\n")
+
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer.SYNC_MAPPINGS = FrameworkSyncer.SYNC_MAPPINGS + [
+            SyncMapping("skills", "src/superclaude/skills", "skills")
+        ]
+        stats = syncer._sync_content(self.framework)
+
+        self.assertEqual(stats["skills"], 1)
+        self.assertEqual((self.plugin / "skills/sc-plan.md").read_text(), "/plan stays as-is\n")
+
+    def test_stubs_layout(self):
+        """Test the stubs layout defers command bodies and the full layout drops them."""
+        (self.framework / "src/superclaude/commands/build.md").write_text(
+            "---\ndescription: Build\n---\n\n# /build\nSee /test\n" + "Step.\n" * 50
+        )
+        syncer = FrameworkSyncer("unused", self.plugin, layout="stubs")
+        syncer._sync_content(self.framework)
+        stats = syncer._apply_layout()
+
+        self.assertEqual(stats["commands"], 1)
+        self.assertLess(stats["stub_bytes"], stats["full_bytes"])
+        self.assertIn("command-bodies/sc-build.md", (self.plugin / "commands/sc-build.md").read_text())
+        self.assertIn("See /sc:test", (self.plugin / "command-bodies/sc-build.md").read_text())
+
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer._sync_content(self.framework)
+        self.assertIsNone(syncer._apply_layout())
+        self.assertIn("See /sc:test", (self.plugin / "commands/sc-build.md").read_text())
+        self.assertFalse((self.plugin / "command-bodies").exists())
+
+        with self.assertRaises(ValueError):
+            FrameworkSyncer("unused", self.plugin, layout="split")
+
+    def test_mapping_into_protected_path_rejected(self):
+        """Test a mapping targeting a PROTECTED_PATHS entry fails before writing."""
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer.SYNC_MAPPINGS = [SyncMapping("modes", "src/superclaude/modes", "modes")]
+        with self.assertRaises(ProtectionViolationError):
+            syncer._sync_content(self.framework)
+
+    def test_build_cache_skips_transform_on_rerun(self):
+        """Test re-syncing the same source restores outputs from the build cache."""
+        from unittest import mock
+        FrameworkSyncer("unused", self.plugin)._sync_content(self.framework)
+        (self.plugin / "commands/sc-build.md").unlink()
+
+        syncer = FrameworkSyncer("unused", self.plugin)
+        transform = mock.Mock(side_effect=AssertionError("transform ran"))
+        with mock.patch.dict(SyncMapping.TRANSFORMERS, {"command": transform}):
+            syncer._sync_content(self.framework)
+        transform.assert_not_called()
+        self.assertEqual(syncer.mapping_stats["commands"]["cached"], 1)
+        self.assertIn("See /sc:test", (self.plugin / "commands/sc-build.md").read_text())
+
+        # Changed source content is a new key, so it is transformed again
+        (self.framework / "src/superclaude/commands/build.md").write_text("# /build\nSee /lint\n")
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer._sync_content(self.framework)
+        self.assertEqual(syncer.mapping_stats["commands"]["cached"], 0)
+        self.assertIn("See /sc:lint", (self.plugin / "commands/sc-build.md").read_text())
+
+    def test_no_cache(self):
+        """Test use_cache=False neither reads nor fills the cache."""
+        syncer = FrameworkSyncer("unused", self.plugin, use_cache=False)
+        syncer._sync_content(self.framework)
+        self.assertFalse((self.plugin / ".sync-cache").exists())
+
+    def test_protection_check_detects_modified_file(self):
+        """Test the Merkle protection snapshot flags a changed protected file."""
+        (self.plugin / "core").mkdir()
+        (self.plugin / "core/RULES.md").write_text("tuned\n")
+        syncer = FrameworkSyncer("unused", self.plugin)
+        snapshot = syncer._snapshot_protected_files()
+        syncer._sync_content(self.framework)
+        syncer._validate_protected_files(snapshot)
+
+        (self.plugin / "core/RULES.md").write_text("overwritten\n")
+        with self.assertRaises(ProtectionViolationError) as raised:
+            syncer._validate_protected_files(snapshot)
+        self.assertIn("MODIFIED : core/RULES.md", str(raised.exception))
+
+    def test_manifest_written_after_sync(self):
+        """Test the manifest covers synced and protected files."""
+        import json
+        (self.plugin / "core").mkdir()
+        (self.plugin / "core/RULES.md").write_text("tuned\n")
+        syncer = FrameworkSyncer("unused", self.plugin)
+        syncer._sync_content(self.framework)
+        syncer._write_manifest()
+
+        nodes = json.loads((self.plugin / ".claude-plugin/merkle-manifest.json").read_text())["nodes"]
+        self.assertIn("commands/sc-build.md", nodes)
+        self.assertIn("core/RULES.md", nodes)
+
+    def test_unknown_transformer_rejected(self):
+        """Test a typo in a transformer name is caught up front."""
+        with self.assertRaises(ValueError):
+            SyncMapping("x", "a", "b", transform="comand").transform_fn()
+
+
 class TestPatterns(unittest.TestCase):
     """Test regex patterns used in transformations."""
 
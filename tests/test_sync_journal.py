@@ -0,0 +1,121 @@
+"""
+Test suite for sync_journal.py and checkpointed syncing
+
+Run tests with:
+    python -m pytest tests/test_sync_journal.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from sync_journal import JOURNAL_FILENAME, SyncJournal
+from sync_from_framework import FileSyncer, FrameworkSyncer
+
+
+class TestSyncJournal(unittest.TestCase):
+    """Test journal replay and resume rules."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        self.path = self.root / JOURNAL_FILENAME
+
+    def test_resume_replays_records(self):
+        """Test steps and writes survive a reopen for the same commit."""
+        journal = SyncJournal.start(self.path, "abc123")
+        journal.record_step("backup")
+        journal.record_step("mcp", 8)
+        journal.record_write("commands/sc-a.md", "hello")
+        journal.close()
+
+        resumed = SyncJournal.resume(self.path, "abc123")
+        self.assertTrue(resumed.step_done("backup"))
+        self.assertEqual(resumed.steps["mcp"], 8)
+        (self.root / "a.md").write_text("hello")
+        self.assertTrue(resumed.write_done("commands/sc-a.md", self.root / "a.md"))
+        (self.root / "a.md").write_text("half-writ")
+        self.assertFalse(resumed.write_done("commands/sc-a.md", self.root / "a.md"))
+        resumed.complete()
+        self.assertFalse(self.path.exists())
+
+    def test_other_commit_not_resumed(self):
+        """Test a checkpoint for a different Framework commit is ignored."""
+        SyncJournal.start(self.path, "abc123").close()
+        self.assertIsNone(SyncJournal.resume(self.path, "def456"))
+
+    def test_torn_last_line_ignored(self):
+        """Test a partially written record from a crash is dropped."""
+        journal = SyncJournal.start(self.path, "abc123")
+        journal.record_step("backup")
+        journal.close()
+        with open(self.path, 'a') as handle:
+            handle.write('{"type": "step", "na')
+
+        resumed = SyncJournal.resume(self.path, "abc123")
+        self.assertEqual(list(resumed.steps), ["backup"])
+        resumed.close()
+
+
+class TestCheckpointedSync(unittest.TestCase):
+    """Test resumed syncs skip work the journal covers."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        self.source = self.root / "src"
+        self.dest = self.root / "commands"
+        self.source.mkdir()
+        for name in ("a", "b", "c"):
+            (self.source / f"{name}.md").write_text(f"# {name}\n")
+        self.transformed = []
+
+    def transform(self, content, filename):
+        self.transformed.append(filename)
+        return content.upper()
+
+    def sync(self, journal):
+        syncer = FileSyncer(self.root, journal=journal)
+        syncer.git_available = False
+        return syncer.sync_directory(self.source, self.dest, "sc-", self.transform)
+
+    def test_resume_skips_completed_writes(self):
+        """Test only files missing or changed since the checkpoint are redone."""
+        path = self.root / JOURNAL_FILENAME
+        journal = SyncJournal.start(path, "abc123")
+        self.sync(journal)
+        journal.close()
+        self.assertEqual(len(self.transformed), 3)
+
+        # Simulate an interrupted write of one file
+        (self.dest / "sc-b.md").write_text("# B trunc")
+        self.transformed.clear()
+
+        journal = SyncJournal.resume(path, "abc123")
+        stats = self.sync(journal)
+        journal.close()
+
+        self.assertEqual(self.transformed, ["b.md"])
+        self.assertEqual(stats["modified"], 3)
+        self.assertEqual((self.dest / "sc-b.md").read_text(), "# B\n")
+        self.assertEqual(sorted(p.name for p in self.dest.iterdir()),
+                         ["sc-a.md", "sc-b.md", "sc-c.md"])
+
+    def test_completed_steps_are_skipped(self):
+        """Test _run_step returns the recorded value instead of re-running."""
+        path = self.root / JOURNAL_FILENAME
+        journal = SyncJournal.start(path, "abc123")
+        journal.record_step("mcp", 5)
+        journal.close()
+
+        syncer = FrameworkSyncer("unused", self.root, resume=True)
+        syncer.journal = syncer._open_journal("abc123")
+        self.assertEqual(syncer._run_step("mcp", lambda: self.fail("re-ran step")), 5)
+        self.assertEqual(syncer._run_step("plugin_json", lambda: "ran"), "ran")
+        syncer.journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Test suite for token_profiler.py and token_estimator.py
+
+Run tests with:
+    python -m pytest tests/test_token_profiler.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from token_estimator import get_estimator, estimate_bytes
+from token_profiler import SectionProfiler, hot_sections, collapsed_stacks
+
+
+SAMPLE = """---
+description: Sample
+---
+
+# /sc:sample - Sample
+
+Intro text.
+
+## Usage
+
+```bash
+# not a heading
+/sc:sample --flag
+```
+
+### Options; and flags
+
+Details.
+
+## Examples
+
+Example text.
+"""
+
+
+class TestTokenEstimator(unittest.TestCase):
+    """Test offline token estimators."""
+
+    def test_bytes_matches_benchmark_heuristic(self):
+        """Test default estimator is the scripts' bytes / 4 rule."""
+        self.assertEqual(get_estimator()("a" * 40), 10)
+        self.assertEqual(estimate_bytes("日本"), 1)  # 6 bytes
+
+    def test_unknown_estimator(self):
+        """Test unknown estimator names are rejected."""
+        with self.assertRaises(ValueError):
+            get_estimator("tiktoken")
+
+
+class TestSectionProfiler(unittest.TestCase):
+    """Test heading hierarchy and token attribution."""
+
+    def setUp(self):
+        self.profiler = SectionProfiler(len)  # 1 token per character
+        self.root = self.profiler.profile_text(SAMPLE, "commands", "sc-sample.md")
+
+    def test_hierarchy(self):
+        """Test headings nest by level and fenced headings are ignored."""
+        headings = [(s.level, s.heading) for s in self.root.walk()]
+        self.assertEqual(headings, [
+            (0, "sc-sample.md"),
+            (1, "(frontmatter)"),
+            (1, "/sc:sample - Sample"),
+            (2, "Usage"),
+            (3, "Options; and flags"),
+            (2, "Examples"),
+        ])
+
+    def test_tokens_are_conserved(self):
+        """Test section costs add up to the whole file."""
+        self.assertEqual(self.root.total_tokens, len(SAMPLE))
+        self.assertEqual(
+            sum(s.self_tokens for s in self.root.walk()), len(SAMPLE)
+        )
+
+    def test_collapsed_stacks(self):
+        """Test collapsed stacks escape separators and carry self cost."""
+        lines = collapsed_stacks([self.root])
+        self.assertIn(
+            "commands;sc-sample.md;/sc:sample - Sample;Usage;Options, and flags 34",
+            lines
+        )
+
+    def test_hot_sections_ranking(self):
+        """Test hot sections are sorted by self tokens."""
+        ranked = hot_sections([self.root])
+        costs = [s.self_tokens for s in ranked]
+        self.assertEqual(costs, sorted(costs, reverse=True))
+        self.assertEqual(len(hot_sections([self.root], top=2)), 2)
+
+    def test_profile_tree_includes_nested_files(self):
+        """Test nested files are profiled under their path within the category."""
+        plugin_root = Path(mkdtemp())
+        nested = plugin_root / "agents" / "ContextEngineering"
+        nested.mkdir(parents=True)
+        (nested / "sc-context-agent.md").write_text("# Context\n")
+        (plugin_root / "agents" / "sc-helper.md").write_text("# Helper\n")
+        roots = self.profiler.profile_tree(plugin_root)
+        self.assertEqual(
+            [(r.category, r.file) for r in roots],
+            [("agents", "ContextEngineering/sc-context-agent.md"), ("agents", "sc-helper.md")]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
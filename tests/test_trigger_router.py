@@ -0,0 +1,98 @@
+"""
+Test suite for trigger_router.py
+
+Run tests with:
+    python -m pytest tests/test_trigger_router.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from trigger_router import AhoCorasick, TriggerRouter, extract_phrases
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """Test the multi-pattern matcher."""
+
+    def test_overlapping_matches(self):
+        """Test every occurrence is reported, including overlaps and suffixes."""
+        matcher = AhoCorasick(["he", "she", "his", "hers"])
+        found = sorted((end, matcher.patterns[n]) for end, n in matcher.finditer("ushers"))
+        self.assertEqual(found, [(4, "he"), (4, "she"), (6, "hers")])
+
+
+class TestPhraseExtraction(unittest.TestCase):
+    """Test trigger bullet parsing."""
+
+    def test_quoted_flags_and_lists(self):
+        """Test explicit phrases outrank prose keywords."""
+        phrases = extract_phrases('Exploration keywords: brainstorm, figure out, not sure')
+        self.assertEqual(phrases, {"brainstorm": 2, "figure out": 2, "not sure": 2, "exploration": 1,
+                                   "keywords": 1})
+
+        phrases = extract_phrases('**State Questions**: "どこまで進んでた", "現状" trigger `/sc:pm`')
+        self.assertEqual(phrases["どこまで進んでた"], 2)
+        self.assertEqual(phrases["現状"], 2)
+        self.assertEqual(phrases["/sc:pm"], 2)
+        self.assertEqual(phrases["state"], 1)
+
+    def test_prose_keywords(self):
+        """Test stopwords are dropped from prose bullets."""
+        phrases = extract_phrases("Security vulnerability assessment and code audit requests")
+        self.assertEqual(set(phrases), {"security", "vulnerability", "assessment", "code", "audit"})
+
+
+class TestTriggerRouter(unittest.TestCase):
+    """Test routing against a small corpus."""
+
+    def setUp(self):
+        self.root = Path(mkdtemp())
+        (self.root / "agents").mkdir()
+        (self.root / "modes").mkdir()
+        (self.root / "agents" / "sc-security-engineer.md").write_text(
+            "---\nname: sc-security-engineer\n---\n## Triggers\n- Security vulnerability and code audit requests\n"
+            "## Behavioral Mindset\n- brainstorm is not a trigger here\n"
+        )
+        (self.root / "modes" / "MODE_Brainstorming.md").write_text(
+            "# Brainstorming Mode\n## Activation Triggers\n- Uncertainty: \"maybe\", \"not sure\"\n- Flags: `--bs`\n"
+        )
+        self.router = TriggerRouter.compile(self.root)
+
+    def test_route(self):
+        """Test requests reach the right target with matched phrases."""
+        routes = self.router.route("Not sure, maybe run --bs first")
+        self.assertEqual([r.name for r in routes], ["MODE_Brainstorming"])
+        self.assertEqual(routes[0].score, 6)
+
+        self.assertEqual(self.router.route("audit this code")[0].name, "sc-security-engineer")
+        self.assertEqual(self.router.route("let's brainstorm"), [])
+
+    def test_word_boundaries(self):
+        """Test ASCII phrases do not match inside longer words."""
+        self.assertEqual(self.router.route("auditorium codec"), [])
+
+    def test_nested_files(self):
+        """Test agents in nested directories are routed."""
+        nested = self.root / "agents" / "ContextEngineering"
+        nested.mkdir()
+        (nested / "sc-context-agent.md").write_text(
+            "---\nname: sc-context-agent\n---\n## Triggers\n- Context window budgeting requests\n"
+        )
+        router = TriggerRouter.compile(self.root)
+        self.assertEqual(router.route("context window budgeting")[0].name, "sc-context-agent")
+
+    def test_save_and_load(self):
+        """Test the saved table routes identically."""
+        path = self.root / "table.json"
+        self.router.save(path)
+        loaded = TriggerRouter.load(path)
+        self.assertEqual(loaded.route("maybe"), self.router.route("maybe"))
+
+
+if __name__ == '__main__':
+    unittest.main()